@@ -0,0 +1,134 @@
+"""
+benchmark the loading time and the memory used by the channels metadata of
+wide MDF v4 files
+"""
+
+import argparse
+import gc
+import multiprocessing
+from multiprocessing.connection import Connection
+import os
+import sys
+import tempfile
+from time import perf_counter
+import tracemalloc
+
+import numpy as np
+
+from asammdf import __version__ as asammdf_version
+from asammdf import MDF, Signal
+
+
+def generate_wide_file(filename: str, groups: int, channels: int, cycles: int = 10) -> None:
+    """generate a synthetic file with `groups` channel groups of `channels`
+    channels, each channel with unit, comment and linear conversion
+    """
+    t = np.arange(cycles, dtype=np.float64)
+
+    with MDF(version="4.10") as mdf:
+        for group_index in range(groups):
+            sigs = [
+                Signal(
+                    np.arange(cycles, dtype=np.int16) + i,
+                    t,
+                    name=f"Channel_{group_index}_{i}",
+                    unit=f"unit_{i % 50}",
+                    comment=f"Signed 16bit channel {i} of group {group_index} with linear conversion",
+                    conversion={"a": float(group_index * channels + i), "b": -0.5},
+                )
+                for i in range(channels)
+            ]
+            mdf.append(sigs, common_timebase=True)
+
+        mdf.save(filename, overwrite=True)
+
+
+def measure_open(filename: str, lazy_channel_metadata: bool, use_display_names: bool, pipe: Connection) -> None:
+    """open the file and send the loading time, the traced memory of the loaded
+    metadata and the number of channels
+    """
+    start = perf_counter()
+    mdf = MDF(filename, lazy_channel_metadata=lazy_channel_metadata, use_display_names=use_display_names)
+    elapsed_time = perf_counter() - start
+    mdf.close()
+    del mdf
+
+    # the memory is measured in a second run because tracing slows down the loading
+    gc.collect()
+    tracemalloc.start()
+
+    mdf = MDF(filename, lazy_channel_metadata=lazy_channel_metadata, use_display_names=use_display_names)
+
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    channels = sum(len(group.channels) for group in mdf.groups)
+
+    # touch a single channel the way a typical script does
+    mdf.get(f"Channel_{len(mdf.groups) // 2}_1")
+
+    mdf.close()
+
+    pipe.send((elapsed_time, memory, channels))
+
+
+def main(groups: int, channels: int, path: str | None, use_display_names: bool) -> None:
+    folder = path or tempfile.mkdtemp()
+    filename = os.path.join(folder, f"wide_{groups}x{channels}.mf4")
+
+    if not os.path.exists(filename):
+        generate_wide_file(filename, groups, channels)
+
+    print(f"asammdf {asammdf_version}; {filename}")
+    print("{:<30} {:>10} {:>12} {:>16}".format("Mode", "Time [ms]", "Memory [MB]", "Bytes / channel"))
+
+    for lazy_channel_metadata in (False, True):
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=measure_open, args=(filename, lazy_channel_metadata, use_display_names, sender)
+        )
+        process.start()
+        elapsed_time, memory, channel_count = receiver.recv()
+        process.join()
+
+        mode = "lazy channel metadata" if lazy_channel_metadata else "full channel metadata"
+        print(f"{mode:<30} {int(elapsed_time * 1000):>10} {memory / 1024 / 1024:>12.1f} {memory // channel_count:>16}")
+
+
+def _cmd_line_parser() -> argparse.ArgumentParser:
+    """
+    return a command line parser. It is used when generating the documentation
+    """
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--path",
+        help="folder for the generated test file, if not provided a temporary folder is used",
+    )
+    parser.add_argument(
+        "--groups",
+        type=int,
+        default=50,
+        help="number of channel groups",
+    )
+    parser.add_argument(
+        "--channels",
+        type=int,
+        default=1000,
+        help="number of channels in each channel group",
+    )
+    parser.add_argument(
+        "--no_display_names",
+        action="store_true",
+        help="do not parse the XML channel comments to search for display names",
+    )
+
+    return parser
+
+
+if __name__ == "__main__":
+    cmd_parser = _cmd_line_parser()
+    args = cmd_parser.parse_args(sys.argv[1:])
+
+    main(args.groups, args.channels, args.path, not args.no_display_names)
@@ -20,7 +20,8 @@ from .blocks.options import get_global_option, set_global_option
 from .blocks.source_utils import Source
 from .gui import plot
 from .mdf import MDF, SUPPORTED_VERSIONS
-from .signal import InvalidationArray, Signal
+from .signal import ChunkedSignal, InvalidationArray, Signal
+from .streaming import StreamingMDF4Writer
 from .version import __version__
 
 try:
@@ -33,9 +34,11 @@ except ImportError:
 __all__ = [
     "MDF",
     "SUPPORTED_VERSIONS",
+    "ChunkedSignal",
     "InvalidationArray",
     "Signal",
     "Source",
+    "StreamingMDF4Writer",
     "__cextension__",
     "__version__",
     "get_global_option",
@@ -0,0 +1,192 @@
+"""asammdf utility functions for the persistent metadata index cache"""
+
+from hashlib import md5, sha256
+import hmac
+import logging
+import os
+from pathlib import Path
+import pickle
+import sys
+from typing import Final
+
+from typing_extensions import Any
+
+from ..version import __version__
+from .types import StrPath
+
+logger = logging.getLogger("asammdf")
+
+__all__ = [
+    "dump_metadata_cache",
+    "file_identity",
+    "load_metadata_cache",
+    "metadata_cache_path",
+    "user_cache_folder",
+]
+
+# bump this when the layout of the cached state changes
+METADATA_CACHE_FORMAT: Final = 2
+METADATA_CACHE_SUFFIX: Final = ".asammdf-idx"
+
+# the indexes are authenticated with a per-user key before they are unpickled
+METADATA_CACHE_KEY_NAME: Final = "metadata.key"
+METADATA_CACHE_KEY_SIZE: Final = 32
+METADATA_CACHE_DIGEST_SIZE: Final = sha256().digest_size
+
+# the identification block and the header block are found in the first bytes
+# of the file; this also covers the finalization flags
+HEADER_HASH_SIZE: Final = 4096
+
+
+def file_identity(name: StrPath, **load_options: object) -> dict[str, object]:
+    """Build the identity used to validate a cached metadata index.
+
+    Parameters
+    ----------
+    name : str | path-like
+        Measurement file name.
+    load_options : dict
+        Loading options that change the parsed metadata (load filter,
+        display names handling, bus logging processing etc.).
+
+    Returns
+    -------
+    identity : dict
+        File path, size, modification time, header hash and loading options.
+    """
+    path = Path(name).resolve()
+    stat = path.stat()
+
+    with open(path, "rb") as stream:
+        header_hash = md5(stream.read(HEADER_HASH_SIZE)).hexdigest()
+
+    return {
+        "format": METADATA_CACHE_FORMAT,
+        "asammdf": __version__,
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "header_hash": header_hash,
+        "options": repr(sorted(load_options.items())),
+    }
+
+
+def user_cache_folder() -> Path:
+    """Get the per-user cache folder of asammdf."""
+    base: StrPath
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base) / "asammdf"
+
+
+def metadata_cache_path(name: StrPath, folder: StrPath | None = None) -> Path:
+    """Get the index file path for the measurement file.
+
+    The index is stored in `folder` using a name derived from the measurement
+    file path. If `folder` is None, the "metadata" folder of the per-user
+    cache folder is used.
+    """
+    path = Path(name).resolve()
+    if folder is None:
+        folder = user_cache_folder() / "metadata"
+    digest = md5(str(path).encode("utf-8")).hexdigest()
+    return Path(folder) / f"{path.stem}_{digest}{METADATA_CACHE_SUFFIX}"
+
+
+def _metadata_cache_key() -> bytes:
+    """Get the per-user key that authenticates the indexes; the key is created
+    on first use and can only be read by the user.
+    """
+    key_path = user_cache_folder() / METADATA_CACHE_KEY_NAME
+
+    if not key_path.is_file():
+        key_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o600)
+        except FileExistsError:
+            # created by another process
+            pass
+        else:
+            with os.fdopen(fd, "wb") as stream:
+                stream.write(os.urandom(METADATA_CACHE_KEY_SIZE))
+
+    key = key_path.read_bytes()
+    if len(key) != METADATA_CACHE_KEY_SIZE:
+        raise OSError(f'Invalid metadata index key "{key_path}"')
+
+    return key
+
+
+def load_metadata_cache(cache_path: StrPath, identity: dict[str, object]) -> dict[str, Any] | None:
+    """Load the cached metadata state.
+
+    Returns None if the index does not exist, cannot be loaded, was not
+    written with the user's key or was created for a different file identity
+    (the measurement file was modified). The index is only unpickled after
+    its authentication.
+    """
+    cache_path = Path(cache_path)
+    if not cache_path.is_file():
+        return None
+
+    try:
+        key = _metadata_cache_key()
+        data = cache_path.read_bytes()
+    except OSError as e:
+        logger.debug(f'Could not load the metadata index "{cache_path}": {e}')
+        return None
+
+    digest, payload = data[:METADATA_CACHE_DIGEST_SIZE], data[METADATA_CACHE_DIGEST_SIZE:]
+    if not hmac.compare_digest(digest, hmac.new(key, payload, sha256).digest()):
+        logger.debug(f'The metadata index "{cache_path}" was not written with the user\'s key')
+        return None
+
+    try:
+        cached_identity, state = pickle.loads(payload)
+    except Exception as e:
+        logger.debug(f'Could not load the metadata index "{cache_path}": {e}')
+        return None
+
+    if cached_identity != identity:
+        logger.debug(f'The metadata index "{cache_path}" is outdated')
+        return None
+
+    if not isinstance(state, dict):
+        return None
+
+    return state
+
+
+def dump_metadata_cache(cache_path: StrPath, identity: dict[str, object], state: dict[str, Any]) -> bool:
+    """Store the metadata state; the pickled state is preceded by its HMAC
+    computed with the user's key. The index is written to a temporary file
+    that is renamed afterwards so that concurrent readers never see a
+    partially written index.
+
+    Returns True if the index was written.
+    """
+    cache_path = Path(cache_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+
+    try:
+        key = _metadata_cache_key()
+        payload = pickle.dumps((identity, state), protocol=pickle.HIGHEST_PROTOCOL)
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as stream:
+            stream.write(hmac.new(key, payload, sha256).digest())
+            stream.write(payload)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f'Could not write the metadata index "{cache_path}": {e}')
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+    return True
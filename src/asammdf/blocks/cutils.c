@@ -35,6 +35,19 @@
 
 char err_string[1024];
 
+// number of worker threads used when the thread count argument is omitted or not positive
+static Py_ssize_t default_thread_count(void)
+{
+#if defined(_WIN32)
+  SYSTEM_INFO sysinfo;
+  GetSystemInfo(&sysinfo);
+  return MAX((Py_ssize_t) sysinfo.dwNumberOfProcessors, 1);
+#else
+  long count = sysconf(_SC_NPROCESSORS_ONLN);
+  return MAX((Py_ssize_t) count, 1);
+#endif
+}
+
 struct rec_info
 {
   uint32_t id;
@@ -1416,6 +1429,8 @@ typedef struct MyData {
   Py_ssize_t byte_offset;
   Py_ssize_t byte_count;
   Py_ssize_t cycles;
+  uint8_t ** bits;
+  Py_ssize_t bit_count;
 } MYDATA, *PMYDATA;
 
 typedef struct ChannelInfo {
@@ -1496,7 +1511,7 @@ static PyObject *get_channel_raw_bytes_parallel(PyObject *self, PyObject *args)
   PyObject *data_block, *out, *signals, *obj;
 
   Py_ssize_t record_size, byte_offset, byte_count;
-  Py_ssize_t signal_count, thread_count=11, remaining_signals, thread_pos;
+  Py_ssize_t signal_count, thread_count=0, remaining_signals, thread_pos;
 
   uint8_t *inptr, *outptr;
   int is_list;
@@ -1510,6 +1525,10 @@ static PyObject *get_channel_raw_bytes_parallel(PyObject *self, PyObject *args)
   }
   else
   {
+    if (thread_count <= 0) {
+      thread_count = default_thread_count();
+    }
+
 
 #ifdef _WIN32
     HANDLE  *hThreads;
@@ -1591,30 +1610,36 @@ static PyObject *get_channel_raw_bytes_parallel(PyObject *self, PyObject *args)
 
     Py_BEGIN_ALLOW_THREADS
 
-#ifdef _WIN32
-    for (int i=0; i< thread_count; i++) {
-      hThreads[i] = CreateThread(
-                      NULL,
-                      0,
-                      get_channel_raw_bytes_C,
-                      &ch_info[i],
-                      0,
-                      &dwThreadIdArray[i]
-                    );
+    if (thread_count == 1) {
+      // no need to spawn a worker for a single thread
+      get_channel_raw_bytes_C(&ch_info[0]);
     }
+    else {
+#ifdef _WIN32
+      for (int i=0; i< thread_count; i++) {
+        hThreads[i] = CreateThread(
+                        NULL,
+                        0,
+                        get_channel_raw_bytes_C,
+                        &ch_info[i],
+                        0,
+                        &dwThreadIdArray[i]
+                      );
+      }
 
-    WaitForMultipleObjects(thread_count, hThreads, true, INFINITE);
-    for (int i=0; i< thread_count; i++) {
-      CloseHandle(hThreads[i]);
-    }
+      WaitForMultipleObjects(thread_count, hThreads, true, INFINITE);
+      for (int i=0; i< thread_count; i++) {
+        CloseHandle(hThreads[i]);
+      }
 #else
-    for (int i=0; i< thread_count; i++) {
-      pthread_create(&(dwThreadIdArray[i]), NULL, get_channel_raw_bytes_C, &ch_info[i]);
-    }
-    for (int i=0; i< thread_count; i++) {
-      pthread_join(dwThreadIdArray[i], NULL);
-    }
+      for (int i=0; i< thread_count; i++) {
+        pthread_create(&(dwThreadIdArray[i]), NULL, get_channel_raw_bytes_C, &ch_info[i]);
+      }
+      for (int i=0; i< thread_count; i++) {
+        pthread_join(dwThreadIdArray[i], NULL);
+      }
 #endif
+    }
 
     Py_END_ALLOW_THREADS
 
@@ -1641,13 +1666,8 @@ struct dtype
 
 void * data_block_from_arrays_C(void *lpParam )
 {
-  Py_ssize_t size, thread_count;
-  PyObject *data_blocks, *out = NULL, *item, *array, *copy_array, *itemsize, *cycles_obj;
-
-  char *read_pos = NULL, *write_pos = NULL;
-  Py_ssize_t total_size = 0, record_size = 0,
-             cycles, byte_count = 0, step;
-  Py_ssize_t isize = 0, offset = 0;
+  Py_ssize_t record_size, step, cycles, byte_count, bit_count, thread_count;
+  uint8_t *outptr, *inptr, **bits;
 
   PMYDATA data;
   PMyChannelInfo indata;
@@ -1660,187 +1680,309 @@ void * data_block_from_arrays_C(void *lpParam )
   thread_count= indata->thread_count;
   for (Py_ssize_t i = 0; i<thread_idx; i++, data++);
 
-  uint8_t *outptr, *inptr;
-
   for (Py_ssize_t idx = thread_idx; idx < signal_count; idx += thread_count) {
     record_size = data->record_size;
     step = record_size - data->byte_count;
     cycles = data->cycles;
     byte_count = data->byte_count;
     inptr = data->inptr;
+    bits = data->bits;
+    bit_count = data->bit_count;
+
+    if (record_size) {
+      outptr = data->outptr + data->byte_offset;
+
+      if (bits) {
+        // packed bits column: the bit j of the column is set by the j-th
+        // boolean array; missing arrays leave the bit cleared
+        for (Py_ssize_t i=0; i <cycles; i++) {
+          for (Py_ssize_t k = 0; k < byte_count; k++)
+            outptr[k] = 0;
+          for (Py_ssize_t j = 0; j < bit_count; j++) {
+            if (bits[j] && bits[j][i])
+              outptr[j >> 3] |= (uint8_t) (1 << (j & 7));
+          }
+          outptr += record_size;
+        }
+      }
+      else {
+        for (Py_ssize_t i=0; i <cycles; i++) {
+          for (Py_ssize_t k = 0; k < byte_count; k++)
+            *outptr++ = *inptr++;
+          outptr += step;
+        }
+      }
+    }
 
-    if (!record_size) continue;
+    for (Py_ssize_t i = 0; i<thread_count; i++, data++);
+  }
 
-    outptr = data->outptr + data->byte_offset;
+  return NULL;
+}
 
-    for (Py_ssize_t i=0; i <cycles; i++) {
-      for (Py_ssize_t k = 0; k < byte_count; k++)
-        *outptr++ = *inptr++;
-      outptr += step;
-    }
 
-    for (Py_ssize_t i = 0; i<thread_count; i++, data++);
+static uint8_t * data_block_column_pointer(PyObject *array, PyObject *references, Py_ssize_t min_size)
+{
+  PyObject *contiguous;
+
+  if (PyByteArray_Check(array)) {
+    if (PyByteArray_Size(array) < min_size) {
+      PyErr_SetString(PyExc_ValueError, "data_block_from_arrays: the column is smaller than the expected size");
+      return NULL;
+    }
+    return (uint8_t *) PyByteArray_AsString(array);
+  }
+  else if (PyBytes_Check(array)) {
+    if (PyBytes_Size(array) < min_size) {
+      PyErr_SetString(PyExc_ValueError, "data_block_from_arrays: the column is smaller than the expected size");
+      return NULL;
+    }
+    return (uint8_t *) PyBytes_AsString(array);
+  }
+  else if (PyArray_Check(array)) {
+    if (!PyArray_IS_C_CONTIGUOUS((PyArrayObject *) array)) {
+      // the copy is kept alive until the data block is built
+      contiguous = PyArray_NewCopy((PyArrayObject *)array, NPY_CORDER);
+      if (!contiguous)
+        return NULL;
+      if (PyList_Append(references, contiguous)) {
+        Py_DECREF(contiguous);
+        return NULL;
+      }
+      Py_DECREF(contiguous);
+      array = contiguous;
+    }
+    if (PyArray_NBYTES((PyArrayObject *) array) < min_size) {
+      PyErr_SetString(PyExc_ValueError, "data_block_from_arrays: the column is smaller than the expected size");
+      return NULL;
+    }
+    return (uint8_t *)PyArray_BYTES((PyArrayObject *)array);
+  }
+  else {
+    PyErr_SetString(PyExc_TypeError, "data_block_from_arrays: the columns must be bytes, bytearray or numpy arrays");
+    return NULL;
   }
 }
 
 
 static PyObject *data_block_from_arrays(PyObject *self, PyObject *args)
 {
-  Py_ssize_t signal_count, thread_count=11;
-  PyObject *data_blocks, *out = NULL, *item, *array, *copy_array, *cycles_obj;
+  Py_ssize_t signal_count, thread_count=0, created_threads = 0;
+  PyObject *data_blocks, *out = NULL, *item, *array, *bit_array, *cycles_obj, *references = NULL;
 
   char *outptr;
-  char *read_pos = NULL, *write_pos = NULL;
-  Py_ssize_t total_size = 0, record_size = 0,
-             cycles, step = 0;
-  Py_ssize_t isize = 0, offset = 0,byte_count;
-  int is_list;
-  uint8_t* inptr;
+  Py_ssize_t total_size = 0, record_size = 0, cycles, byte_count, bit_count;
+  int is_list, error = 0;
+  uint8_t *inptr, **bits;
 
-  PMYDATA pDataArray;
-  PMyChannelInfo ch_info;
+  PMYDATA pDataArray = NULL;
+  PMyChannelInfo ch_info = NULL;
 
   if (!PyArg_ParseTuple(args, "OO|n", &data_blocks, &cycles_obj, &thread_count))
   {
     return NULL;
   }
-  else
-  {
-#ifdef _WIN32
-    HANDLE  *hThreads;
-    DWORD   *dwThreadIdArray;
-    hThreads = (HANDLE  *) malloc(sizeof(HANDLE) * thread_count);
-    dwThreadIdArray = (DWORD  *) malloc(sizeof(DWORD) * thread_count);
-#else
-    pthread_t * dwThreadIdArray;
-    dwThreadIdArray = (pthread_t  *) malloc(sizeof(pthread_t) * thread_count);
-#endif
-    cycles = PyLong_AsLongLong(cycles_obj);
-    is_list = PyList_Check(data_blocks);
-    if (is_list) {
-      signal_count = PyList_Size(data_blocks);
-    }
-    else {
-      signal_count = PyTuple_Size(data_blocks);
-    }
 
-    if (!signal_count)
-    {
-      out = PyByteArray_FromStringAndSize(NULL, 0);
-    }
-    else
-    {
-      if (signal_count < thread_count) {
-        thread_count = signal_count;
-      }
-      pDataArray = (PMYDATA) malloc(sizeof(MYDATA) * signal_count);
-      ch_info = (PMyChannelInfo) malloc(sizeof(MyChannelInfo) * thread_count);
+  if (thread_count <= 0) {
+    thread_count = default_thread_count();
+  }
 
-      total_size = 0;
-      for (int i=0; i<thread_count; i++) {
-        ch_info[i].data = pDataArray;
-        ch_info[i].count = signal_count;
-        ch_info[i].idx = i;
-        ch_info[i].thread_count = thread_count;
-      }
+  cycles = PyLong_AsLongLong(cycles_obj);
+  if (cycles == -1 && PyErr_Occurred())
+    return NULL;
 
-      for (int i=0; i<signal_count; i++) {
-        if (is_list) {
-          item = PyList_GetItem(data_blocks, i);
-        }
-        else {
-          item = PyTuple_GetItem(data_blocks, i);
-        }
+  is_list = PyList_Check(data_blocks);
+  if (is_list) {
+    signal_count = PyList_Size(data_blocks);
+  }
+  else if (PyTuple_Check(data_blocks)) {
+    signal_count = PyTuple_Size(data_blocks);
+  }
+  else {
+    PyErr_SetString(PyExc_TypeError, "data_block_from_arrays: the columns must be given as a list or a tuple");
+    return NULL;
+  }
 
-        if (PyList_Check(item)) {
-          array = PyList_GetItem(item, 0);
-          byte_count = PyLong_AsSsize_t(PyList_GetItem(item, 1));
-        }
-        else {
-          array = PyTuple_GetItem(item, 0);
-          byte_count = PyLong_AsSsize_t(PyTuple_GetItem(item, 1));
-        }
+  if (!signal_count)
+  {
+    return PyByteArray_FromStringAndSize(NULL, 0);
+  }
 
-        if (PyByteArray_Check(array)) {
-          inptr = (uint8_t *) PyByteArray_AsString(array);
-        }
-        else if (PyBytes_Check(array)) {
-          inptr = (uint8_t *) PyBytes_AsString(array);
-        }
-        else {
-          if (!PyArray_IS_C_CONTIGUOUS((PyArrayObject *) array))
-          {
-            copy_array = PyArray_NewCopy((PyArrayObject *)array, NPY_CORDER);
-            array = copy_array;
-            copy_array = NULL;
-          }
-          inptr = (uint8_t *)PyArray_BYTES((PyArrayObject *)array);
-        }
+  if (signal_count < thread_count) {
+    thread_count = signal_count;
+  }
 
+  references = PyList_New(0);
+  pDataArray = (PMYDATA) calloc(signal_count, sizeof(MYDATA));
+  ch_info = (PMyChannelInfo) malloc(sizeof(MyChannelInfo) * thread_count);
+  if (!references || !pDataArray || !ch_info) {
+    if (references)
+      PyErr_NoMemory();
+    goto cleanup;
+  }
 
-        pDataArray[i].inptr = inptr;
-        pDataArray[i].cycles = cycles;
-        pDataArray[i].byte_offset = total_size;
-        pDataArray[i].byte_count = byte_count;
+  for (Py_ssize_t i=0; i<thread_count; i++) {
+    ch_info[i].data = pDataArray;
+    ch_info[i].count = signal_count;
+    ch_info[i].idx = i;
+    ch_info[i].thread_count = thread_count;
+  }
 
-        total_size += byte_count;
+  for (Py_ssize_t i=0; i<signal_count; i++) {
+    item = is_list ? PyList_GetItem(data_blocks, i) : PyTuple_GetItem(data_blocks, i);
+
+    if (PyList_Check(item) && PyList_Size(item) == 2) {
+      array = PyList_GetItem(item, 0);
+      byte_count = PyLong_AsSsize_t(PyList_GetItem(item, 1));
+    }
+    else if (PyTuple_Check(item) && PyTuple_Size(item) == 2) {
+      array = PyTuple_GetItem(item, 0);
+      byte_count = PyLong_AsSsize_t(PyTuple_GetItem(item, 1));
+    }
+    else {
+      PyErr_SetString(PyExc_TypeError, "data_block_from_arrays: the columns must be (array, byte count) pairs");
+      goto cleanup;
+    }
+
+    if (byte_count < 0) {
+      if (!PyErr_Occurred())
+        PyErr_SetString(PyExc_ValueError, "data_block_from_arrays: negative byte count");
+      goto cleanup;
+    }
+
+    if (PyList_Check(array)) {
+      // packed bits column given as a list of boolean arrays (or None)
+      bit_count = PyList_Size(array);
+      if (bit_count > byte_count * 8) {
+        PyErr_SetString(PyExc_ValueError, "data_block_from_arrays: too many bits for the column byte count");
+        goto cleanup;
+      }
+      bits = (uint8_t **) calloc(bit_count ? bit_count : 1, sizeof(uint8_t *));
+      if (!bits) {
+        PyErr_NoMemory();
+        goto cleanup;
+      }
+      pDataArray[i].bits = bits;
+      pDataArray[i].bit_count = bit_count;
+
+      for (Py_ssize_t j=0; j<bit_count; j++) {
+        bit_array = PyList_GetItem(array, j);
+        if (bit_array == Py_None)
+          continue;
+        if (PyArray_Check(bit_array) && PyArray_ITEMSIZE((PyArrayObject *) bit_array) != 1) {
+          PyErr_SetString(PyExc_ValueError, "data_block_from_arrays: the bits arrays must have 1 byte items");
+          goto cleanup;
+        }
+        bits[j] = data_block_column_pointer(bit_array, references, cycles);
+        if (!bits[j])
+          goto cleanup;
       }
+      inptr = NULL;
+    }
+    else {
+      inptr = data_block_column_pointer(array, references, cycles * byte_count);
+      if (!inptr)
+        goto cleanup;
+    }
 
-      record_size = total_size;
-      total_size *= cycles;
+    pDataArray[i].inptr = inptr;
+    pDataArray[i].cycles = cycles;
+    pDataArray[i].byte_offset = total_size;
+    pDataArray[i].byte_count = byte_count;
 
-      out = PyByteArray_FromStringAndSize(NULL, (Py_ssize_t)total_size);
-      if (!out)
-        return NULL;
-      outptr = PyByteArray_AsString(out);
+    total_size += byte_count;
+  }
 
-      for (int i=0; i<signal_count; i++) {
-        pDataArray[i].record_size = record_size;
-        pDataArray[i].outptr=outptr;
-      }
+  record_size = total_size;
+  total_size *= cycles;
+
+  out = PyByteArray_FromStringAndSize(NULL, (Py_ssize_t)total_size);
+  if (!out)
+    goto cleanup;
+  outptr = PyByteArray_AsString(out);
 
-      Py_BEGIN_ALLOW_THREADS
+  for (Py_ssize_t i=0; i<signal_count; i++) {
+    pDataArray[i].record_size = record_size;
+    pDataArray[i].outptr = (uint8_t *) outptr;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
 
+  if (thread_count == 1) {
+    data_block_from_arrays_C(&ch_info[0]);
+  }
+  else {
 #ifdef _WIN32
-      for (int i=0; i< thread_count; i++) {
+    HANDLE *hThreads = (HANDLE *) malloc(sizeof(HANDLE) * thread_count);
+    DWORD *dwThreadIdArray = (DWORD *) malloc(sizeof(DWORD) * thread_count);
+
+    if (hThreads && dwThreadIdArray) {
+      for (Py_ssize_t i=0; i< thread_count; i++) {
         hThreads[i] = CreateThread(
                         NULL,
                         0,
-                        data_block_from_arrays_C,
+                        (LPTHREAD_START_ROUTINE) data_block_from_arrays_C,
                         &ch_info[i],
                         0,
                         &dwThreadIdArray[i]
                       );
+        if (!hThreads[i])
+          break;
+        created_threads++;
       }
 
-      WaitForMultipleObjects(thread_count, hThreads, true, INFINITE);
-      for (int i=0; i< thread_count; i++) {
+      if (created_threads)
+        WaitForMultipleObjects((DWORD) created_threads, hThreads, true, INFINITE);
+      for (Py_ssize_t i=0; i< created_threads; i++) {
         CloseHandle(hThreads[i]);
       }
+    }
+    free(hThreads);
+    free(dwThreadIdArray);
 #else
-      for (int i=0; i< thread_count; i++) {
-        pthread_create(&(dwThreadIdArray[i]), NULL, data_block_from_arrays_C, &ch_info[i]);
+    pthread_t *dwThreadIdArray = (pthread_t *) malloc(sizeof(pthread_t) * thread_count);
+
+    if (dwThreadIdArray) {
+      for (Py_ssize_t i=0; i< thread_count; i++) {
+        if (pthread_create(&(dwThreadIdArray[i]), NULL, data_block_from_arrays_C, &ch_info[i]))
+          break;
+        created_threads++;
       }
-      for (int i=0; i< thread_count; i++) {
+      for (Py_ssize_t i=0; i< created_threads; i++) {
         pthread_join(dwThreadIdArray[i], NULL);
       }
+    }
+    free(dwThreadIdArray);
 #endif
 
-      Py_END_ALLOW_THREADS
-
-      free(pDataArray);
-      free(ch_info);
+    // the columns of the threads that could not be started are written
+    // by the calling thread
+    for (Py_ssize_t i=created_threads; i< thread_count; i++) {
+      data_block_from_arrays_C(&ch_info[i]);
     }
+  }
 
-#ifdef _WIN32
-    free(hThreads);
-    free(dwThreadIdArray);
-#else
-    free(dwThreadIdArray);
-#endif
+  Py_END_ALLOW_THREADS
 
-    return out;
+cleanup:
+  if (PyErr_Occurred()) {
+    error = 1;
   }
+  if (pDataArray) {
+    for (Py_ssize_t i=0; i<signal_count; i++) {
+      free(pDataArray[i].bits);
+    }
+  }
+  free(pDataArray);
+  free(ch_info);
+  Py_XDECREF(references);
+
+  if (error) {
+    Py_XDECREF(out);
+    return NULL;
+  }
+
+  return out;
 }
 
 
@@ -2187,7 +2329,7 @@ void * get_channel_raw_bytes_complete_C(void *lpParam )
 
 static PyObject *get_channel_raw_bytes_complete(PyObject *self, PyObject *args)
 {
-  Py_ssize_t info_count, signal_count, signal_and_invalidation_count, thread_count=11;
+  Py_ssize_t info_count, signal_count, signal_and_invalidation_count, thread_count=0;
   PyObject *data_blocks_info, *signals, *out = NULL, *item, *ref, *obj, *group_index, *InvalidationArray;
 
   char *outptr, *file_name;
@@ -2218,6 +2360,10 @@ static PyObject *get_channel_raw_bytes_complete(PyObject *self, PyObject *args)
   }
   else
   {
+    if (thread_count <= 0) {
+      thread_count = default_thread_count();
+    }
+
 
     ref = PyImport_ImportModule("asammdf");
     InvalidationArray = PyObject_GetAttrString(ref, "InvalidationArray");
@@ -2706,6 +2852,164 @@ static PyObject *get_channel_raw_bytes_complete(PyObject *self, PyObject *args)
 
 
 
+// MDF v4 block types that are searched by scan_block_headers; the DG blocks are
+// only accepted with the standard block size and links count
+static int is_block_id(const uint8_t *id)
+{
+  switch (id[0])
+  {
+  case 'A':
+    return id[1] == 'T';
+  case 'C':
+    return id[1] == 'A' || id[1] == 'G' || id[1] == 'H' || id[1] == 'N' || id[1] == 'C';
+  case 'D':
+    return id[1] == 'V' || id[1] == 'T' || id[1] == 'Z' || id[1] == 'I' || id[1] == 'L' || id[1] == 'G';
+  case 'E':
+    return id[1] == 'V';
+  case 'F':
+    return id[1] == 'H';
+  case 'G':
+    return id[1] == 'D';
+  case 'H':
+    return id[1] == 'L';
+  case 'L':
+    return id[1] == 'D';
+  case 'M':
+    return id[1] == 'D';
+  case 'R':
+    return id[1] == 'D' || id[1] == 'V' || id[1] == 'I';
+  case 'S':
+    return id[1] == 'I' || id[1] == 'R' || id[1] == 'D';
+  case 'T':
+    return id[1] == 'X';
+  default:
+    return 0;
+  }
+}
+
+static PyObject *scan_block_headers(PyObject *self, PyObject *args)
+{
+  Py_buffer buffer;
+  const uint8_t *data, *header;
+  uint64_t *addresses = NULL, *block_lengths = NULL, *links_nrs = NULL, *new_buffer;
+  uint64_t block_len, links_nr;
+  uint32_t *ids = NULL, *new_ids;
+  Py_ssize_t size, position, count = 0, capacity = 0;
+  npy_intp dims[1];
+  PyArrayObject *addresses_array, *ids_array, *lengths_array, *links_array;
+  int failed = 0;
+
+  if (!PyArg_ParseTuple(args, "y*", &buffer))
+  {
+    return NULL;
+  }
+
+  data = (const uint8_t *)buffer.buf;
+  size = buffer.len;
+
+  Py_BEGIN_ALLOW_THREADS
+
+  // the blocks always start at 8 bytes aligned addresses
+  for (position = 0; position + 8 <= size; position += 8)
+  {
+    header = data + position;
+    if (header[0] != '#' || header[1] != '#' || !is_block_id(header + 2))
+      continue;
+
+    // reserved bytes
+    if (header[4] || header[5] || header[6] || header[7])
+      continue;
+
+    if (position + 24 <= size)
+    {
+      memcpy(&block_len, header + 8, 8);
+      memcpy(&links_nr, header + 16, 8);
+    }
+    else
+    {
+      block_len = 0;
+      links_nr = 0;
+    }
+
+    if (header[2] == 'D' && header[3] == 'G' && (block_len != 64 || links_nr != 4))
+      continue;
+
+    if (count == capacity)
+    {
+      capacity = capacity ? capacity * 2 : 4096;
+
+      new_buffer = (uint64_t *)realloc(addresses, capacity * sizeof(uint64_t));
+      if (!new_buffer) { failed = 1; break; }
+      addresses = new_buffer;
+
+      new_buffer = (uint64_t *)realloc(block_lengths, capacity * sizeof(uint64_t));
+      if (!new_buffer) { failed = 1; break; }
+      block_lengths = new_buffer;
+
+      new_buffer = (uint64_t *)realloc(links_nrs, capacity * sizeof(uint64_t));
+      if (!new_buffer) { failed = 1; break; }
+      links_nrs = new_buffer;
+
+      new_ids = (uint32_t *)realloc(ids, capacity * sizeof(uint32_t));
+      if (!new_ids) { failed = 1; break; }
+      ids = new_ids;
+    }
+
+    addresses[count] = (uint64_t)position;
+    memcpy(ids + count, header, 4);
+    block_lengths[count] = block_len;
+    links_nrs[count] = links_nr;
+    count++;
+  }
+
+  Py_END_ALLOW_THREADS
+
+  PyBuffer_Release(&buffer);
+
+  if (failed)
+  {
+    free(addresses);
+    free(block_lengths);
+    free(links_nrs);
+    free(ids);
+    return PyErr_NoMemory();
+  }
+
+  dims[0] = count;
+  addresses_array = (PyArrayObject *)PyArray_SimpleNew(1, dims, NPY_UINT64);
+  ids_array = (PyArrayObject *)PyArray_New(&PyArray_Type, 1, dims, NPY_STRING, NULL, NULL, 4, 0, NULL);
+  lengths_array = (PyArrayObject *)PyArray_SimpleNew(1, dims, NPY_UINT64);
+  links_array = (PyArrayObject *)PyArray_SimpleNew(1, dims, NPY_UINT64);
+
+  if (!addresses_array || !ids_array || !lengths_array || !links_array)
+  {
+    Py_XDECREF(addresses_array);
+    Py_XDECREF(ids_array);
+    Py_XDECREF(lengths_array);
+    Py_XDECREF(links_array);
+    free(addresses);
+    free(block_lengths);
+    free(links_nrs);
+    free(ids);
+    return NULL;
+  }
+
+  if (count)
+  {
+    memcpy(PyArray_DATA(addresses_array), addresses, count * sizeof(uint64_t));
+    memcpy(PyArray_DATA(ids_array), ids, count * sizeof(uint32_t));
+    memcpy(PyArray_DATA(lengths_array), block_lengths, count * sizeof(uint64_t));
+    memcpy(PyArray_DATA(links_array), links_nrs, count * sizeof(uint64_t));
+  }
+
+  free(addresses);
+  free(block_lengths);
+  free(links_nrs);
+  free(ids);
+
+  return Py_BuildValue("NNNN", addresses_array, ids_array, lengths_array, links_array);
+}
+
 // Our Module's Function Definition struct
 // We require this `NULL` to signal the end of our method
 // definition
@@ -2724,6 +3028,7 @@ static PyMethodDef myMethods[] = {
   {"bytes_dtype_size", bytes_dtype_size, METH_VARARGS, "bytes_dtype_size"},
   {"get_channel_raw_bytes_parallel", get_channel_raw_bytes_parallel, METH_VARARGS, "get_channel_raw_bytes_parallel"},
   {"get_channel_raw_bytes_complete", get_channel_raw_bytes_complete, METH_VARARGS, "get_channel_raw_bytes_complete"},
+  {"scan_block_headers", scan_block_headers, METH_VARARGS, "scan_block_headers"},
   {NULL, NULL, 0, NULL}
 };
 
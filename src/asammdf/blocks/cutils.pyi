@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+import mmap
+
 import numpy as np
 from numpy.typing import NDArray
 from typing_extensions import Any
@@ -22,10 +25,12 @@ def get_invalidation_bits_array(
     data_block: bytes | bytearray, invalidation_size: int, invalidation_pos: int
 ) -> NDArray[np.uint8]: ...
 def get_channel_raw_bytes_parallel(
-    data_block: bytes | bytearray, record_size: int, signals: list[list[int]], thread_count: int = 11
+    data_block: bytes | bytearray, record_size: int, signals: list[list[int]], thread_count: int = 0
 ) -> list[bytearray]: ...
 def data_block_from_arrays(
-    data_blocks: list[tuple[bytes | NDArray[Any], int]], cycles_obj: int, thread_count: int = 11
+    data_blocks: Sequence[tuple[bytes | bytearray | NDArray[Any] | list[NDArray[Any] | None], int]],
+    cycles_obj: int,
+    thread_count: int = 0,
 ) -> bytearray: ...
 def bytes_dtype_size(ret: NDArray[Any]) -> int: ...
 def get_channel_raw_bytes_complete(
@@ -36,5 +41,8 @@ def get_channel_raw_bytes_complete(
     record_size: int,
     invalidation_bytes: int,
     group_index: int,
-    thread_count: int = 11,
+    thread_count: int = 0,
 ) -> tuple[tuple[bytearray, InvalidationArray | None], ...]: ...
+def scan_block_headers(
+    data: bytes | bytearray | memoryview | mmap.mmap,
+) -> tuple[NDArray[np.uint64], NDArray[np.bytes_], NDArray[np.uint64], NDArray[np.uint64]]: ...
@@ -32,6 +32,8 @@ class MdfKwargs(TypedDict, total=False):
     fill_0_for_missing_computation_channels: bool
     remove_source_from_channel_names: bool
     password: str | None
+    use_metadata_cache: bool
+    lazy_channel_metadata: bool
     progress: Callable[[int, int], None] | Any
     callback: Callable[[int, int], None] | Any
 
@@ -40,7 +40,7 @@ from pandas import DataFrame
 from typing_extensions import Any, Buffer, overload, SupportsBytes, TypedDict, Unpack
 
 from .. import tool
-from ..signal import Signal
+from ..signal import interp_signals, Signal
 from . import mdf_common
 from . import v2_v3_constants as v23c
 from .conversion_utils import conversion_transfer
@@ -220,6 +220,7 @@ class MDF3(MDF_Common[Group]):
 
         self._read_fragment_size = GLOBAL_OPTIONS["read_fragment_size"]
         self._write_fragment_size = GLOBAL_OPTIONS["write_fragment_size"]
+        self._group_thread_count = GLOBAL_OPTIONS["group_thread_count"]
         self._single_bit_uint_as_bool = GLOBAL_OPTIONS["single_bit_uint_as_bool"]
         self._integer_interpolation = GLOBAL_OPTIONS["integer_interpolation"]
         self._float_interpolation = GLOBAL_OPTIONS["float_interpolation"]
@@ -318,6 +319,11 @@ class MDF3(MDF_Common[Group]):
         else:
             stream = self._tempfile
 
+        if record_count == 0:
+            # no records are requested; the data blocks are not read
+            yield b"", record_offset, 0
+            return
+
         samples_size = channel_group.samples_byte_nr
 
         record_offset *= samples_size
@@ -1164,14 +1170,12 @@ class MDF3(MDF_Common[Group]):
                 if different:
                     times = [s.timestamps for s in signals]
                     timestamps = unique(concatenate(times)).astype(float64)
-                    signals = [
-                        s.interp(
-                            timestamps,
-                            integer_interpolation_mode=integer_interp_mode,
-                            float_interpolation_mode=float_interp_mode,
-                        )
-                        for s in signals
-                    ]
+                    signals = interp_signals(
+                        signals,
+                        timestamps,
+                        integer_interpolation_mode=integer_interp_mode,
+                        float_interpolation_mode=float_interp_mode,
+                    )
                     del times
         else:
             timestamps = array([])
@@ -3314,6 +3318,46 @@ class MDF3(MDF_Common[Group]):
 
         return timestamps
 
+    def get_record_range(
+        self,
+        index: int,
+        start: float | None = None,
+        stop: float | None = None,
+    ) -> tuple[int, int]:
+        """Get the records of the group whose master timestamps are inside the
+        [`start`, `stop`] interval. The master channel must be monotonically
+        increasing.
+
+        .. versionadded:: 8.8.0
+
+        Parameters
+        ----------
+        index : int
+            Group index.
+        start : float, optional
+            Interval start time; default is None and in this case the range
+            starts with the first record.
+        stop : float, optional
+            Interval stop time; default is None and in this case the range
+            ends with the last record.
+
+        Returns
+        -------
+        record_offset, record_count : (int, int)
+            Offset of the first record inside the interval and the number of
+            records inside the interval.
+        """
+        cycles_nr = self.groups[index].channel_group.cycles_nr
+
+        if start is None and stop is None:
+            return 0, cycles_nr
+
+        t = self.get_master(index)
+        first = 0 if start is None else int(searchsorted(t, start, side="left"))
+        end = len(t) if stop is None else int(searchsorted(t, stop, side="right"))
+
+        return first, max(end - first, 0)
+
     def iter_get_triggers(self) -> Iterator[TriggerInfoDict]:
         """Generator that yields triggers.
 
@@ -3,11 +3,14 @@
 import bisect
 from collections import defaultdict, deque
 from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from hashlib import md5
+from inspect import isgenerator
 from io import StringIO
+from itertools import chain
 import logging
 from math import ceil, floor
 from mimetypes import guess_type
@@ -19,6 +22,7 @@ import shutil
 import sys
 import tempfile
 from tempfile import gettempdir, NamedTemporaryFile
+from time import perf_counter
 from traceback import format_exc
 import typing
 from typing import BinaryIO, Final, Literal, TYPE_CHECKING
@@ -62,13 +66,15 @@ from typing_extensions import (
     SupportsBytes,
     TypedDict,
     TypeIs,
+    TypeVar,
     Unpack,
 )
 
 from .. import tool
-from ..signal import InvalidationArray, Signal
+from ..signal import interp_signals, InvalidationArray, Signal
 from . import bus_logging_utils, mdf_common
 from . import v4_constants as v4c
+from .cache_utils import dump_metadata_cache, file_identity, load_metadata_cache, metadata_cache_path
 from .conversion_utils import conversion_transfer
 from .cutils import (
     data_block_from_arrays,
@@ -85,6 +91,7 @@ from .source_utils import Source
 from .types import (
     BusType,
     ChannelsType,
+    CompressionLevelType,
     CompressionType,
     DbcFileType,
     RasterType,
@@ -92,6 +99,7 @@ from .types import (
 )
 from .utils import (
     all_blocks_addresses,
+    AppendBuffer,
     as_non_byte_sized_signed_int,
     CHANNEL_COUNT,
     CONVERT,
@@ -117,6 +125,7 @@ from .utils import (
     UINT16_uf,
     UINT32_p,
     UINT32_uf,
+    UINT64_p,
     UINT64_uf,
     UniqueDB,
     validate_version_argument,
@@ -131,6 +140,7 @@ from .v4_blocks import (
     ChannelGroup,
     ChannelGroupKwargs,
     ChannelKwargs,
+    compress_data_block,
     DataBlock,
     DataGroup,
     DataList,
@@ -143,6 +153,7 @@ from .v4_blocks import (
     HeaderBlock,
     HeaderList,
     HeaderListKwargs,
+    LazyChannelMetadata,
     ListData,
     ListDataKwargs,
     SourceInformation,
@@ -187,14 +198,83 @@ EMPTY_TUPLE: Final = ()
 # 100 extra steps for the sorting, 1 step after sorting and 1 step at finish
 SORT_STEPS: Final = 102
 
+# MDF4 attributes created by `_read` that are stored in the metadata index
+METADATA_CACHE_ATTRIBUTES: Final = (
+    "identification",
+    "version",
+    "_column_storage",
+    "file_limit",
+    "header",
+    "file_history",
+    "attachments",
+    "groups",
+    "channels_db",
+    "masters_db",
+    "virtual_groups",
+    "virtual_groups_map",
+    "bus_logging_map",
+    "events",
+    "progress",
+    "_channel_metadata_source",
+)
+
 
 logger = logging.getLogger("asammdf")
 
+_T = TypeVar("_T")
+
 __all__ = ["MDF4"]
 
 Group = mdf_common.GroupV4
 
 
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    """Read `size` bytes at `offset` without changing the file position."""
+    data = os.pread(fd, size, offset)
+    if len(data) == size or not data:
+        return data
+
+    chunks = [data]
+    read_size = len(data)
+    while read_size < size:
+        chunk = os.pread(fd, size - read_size, offset + read_size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        read_size += len(chunk)
+
+    return b"".join(chunks)
+
+
+def _inflate_block(data: bytes, info: DataBlockInfo) -> bytes:
+    """Decompress (and transpose back) the data block bytes."""
+    original_size = typing.cast(int, info.original_size)
+
+    match info.block_type:
+        case v4c.DZ_BLOCK_DEFLATE:
+            data = decompress(data, bufsize=original_size)
+        case v4c.DZ_BLOCK_TRANSPOSED:
+            data = decompress(data, bufsize=original_size)
+            cols = typing.cast(int, info.param)
+            lines = original_size // cols
+            matrix_size = lines * cols
+
+            if matrix_size != original_size:
+                data = (
+                    frombuffer(data[:matrix_size], dtype=uint8).reshape((cols, lines)).T.ravel().tobytes()
+                    + data[matrix_size:]
+                )
+            else:
+                data = frombuffer(data, dtype=uint8).reshape((cols, lines)).T.ravel().tobytes()
+        case v4c.DZ_BLOCK_LZ:
+            data = lz_decompress(data)
+
+    if info.block_limit is not None:
+        data = data[: info.block_limit]
+
+    return data
+
+
 class BusLoggingMap(TypedDict):
     CAN: dict[int, dict[int, int]]
     ETHERNET: dict[int, int]
@@ -205,6 +285,7 @@ class BusLoggingMap(TypedDict):
 class Kwargs(MdfCommonKwargs, total=False):
     column_storage: bool
     process_bus_logging: bool
+    use_metadata_cache: bool
 
 
 class MDF4(MDF_Common[Group]):
@@ -252,6 +333,15 @@ class MDF4(MDF_Common[Group]):
         Use column storage for MDF version >= 4.20.
     password : bytes | str, optional
         Use this password to decode encrypted attachments.
+    use_metadata_cache : bool, default False
+        Store the parsed metadata (channels, groups and data blocks address
+        tables) in a persistent index file and reuse it when the same
+        unmodified file is opened again. The indexes are stored in the
+        per-user cache folder and are authenticated with a per-user key before
+        they are loaded.
+    lazy_channel_metadata : bool, default False
+        Defer the loading of the channel comment, unit and conversion until
+        the channel is accessed.
 
     Attributes
     ----------
@@ -334,7 +424,20 @@ class MDF4(MDF_Common[Group]):
         self._file: FileLike | mmap.mmap | None = None
 
         self._read_fragment_size = GLOBAL_OPTIONS["read_fragment_size"]
+        self._decompression_thread_count = GLOBAL_OPTIONS["decompression_thread_count"]
+        self._compression_thread_count = GLOBAL_OPTIONS["compression_thread_count"]
+        self._extraction_thread_count = GLOBAL_OPTIONS["extraction_thread_count"]
+        self._decompression_pool: ThreadPoolExecutor | None = None
+        self._prefetch_depth = GLOBAL_OPTIONS["prefetch_depth"]
+        self._prefetch_pool: ThreadPoolExecutor | None = None
+        self._compression_level = GLOBAL_OPTIONS["compression_level"]
+        self._append_buffer_size = GLOBAL_OPTIONS["append_buffer_size"]
+        self._append_buffer_samples = GLOBAL_OPTIONS["append_buffer_samples"]
+        self._append_buffer_interval = GLOBAL_OPTIONS["append_buffer_interval"]
+        self._append_buffers: dict[int, AppendBuffer] = {}
+        self._master_summary_changed = False
         self._write_fragment_size = GLOBAL_OPTIONS["write_fragment_size"]
+        self._group_thread_count = GLOBAL_OPTIONS["group_thread_count"]
         self._single_bit_uint_as_bool = GLOBAL_OPTIONS["single_bit_uint_as_bool"]
         self._integer_interpolation = GLOBAL_OPTIONS["integer_interpolation"]
         self._float_interpolation = GLOBAL_OPTIONS["float_interpolation"]
@@ -350,6 +453,10 @@ class MDF4(MDF_Common[Group]):
         )
 
         self._remove_source_from_channel_names = kwargs.get("remove_source_from_channel_names", False)
+        self._use_metadata_cache = kwargs.get("use_metadata_cache", GLOBAL_OPTIONS["use_metadata_cache"])
+        self._metadata_cache_info: tuple[Path, dict[str, object]] | None = None
+        self._lazy_channel_metadata = kwargs.get("lazy_channel_metadata", GLOBAL_OPTIONS["lazy_channel_metadata"])
+        self._channel_metadata_source: LazyChannelMetadata | None = None
         self._password = kwargs.get("password", None)
         self._force_attachment_encryption = kwargs.get("force_attachment_encryption", False)
         self.compact_vlsd = kwargs.get("compact_vlsd", False)
@@ -406,13 +513,13 @@ class MDF4(MDF_Common[Group]):
                             self.name = Path(name)
                             self._file = open(self.name, "rb")
                             self._from_filelike = False
-                            self._read(self._file, mapped=False, progress=progress)
+                            self._read_with_metadata_cache(self._file, mapped=False, progress=progress)
                         else:
                             self.name = Path(name)
                             self._mapped_file = open(self.name, "rb")
                             self._file = mmap.mmap(self._mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
                             self._from_filelike = False
-                            self._read(self._file, mapped=True, progress=progress)
+                            self._read_with_metadata_cache(self._file, mapped=True, progress=progress)
                 except:
                     if self._file:
                         self._file.close()
@@ -496,6 +603,11 @@ class MDF4(MDF_Common[Group]):
         self.file_limit = stream.tell()
         stream.seek(0)
 
+        if self._lazy_channel_metadata:
+            self._channel_metadata_source = LazyChannelMetadata(stream, mapped, self.file_limit)
+        else:
+            self._channel_metadata_source = None
+
         cg_count, _ = count_channel_groups(stream)
         progress_steps = cg_count + SORT_STEPS
 
@@ -818,6 +930,119 @@ class MDF4(MDF_Common[Group]):
 
         self.progress = cg_count, cg_count
 
+    def _read_with_metadata_cache(
+        self,
+        stream: FileLike | mmap.mmap,
+        mapped: bool = False,
+        progress: Callable[[int, int], None] | Any | None = None,
+    ) -> None:
+        """Read the file metadata; if the metadata cache is enabled, the state
+        is loaded from the persistent index when it matches the file identity,
+        otherwise the file is parsed and the index is (re)created.
+        """
+        if not self._use_metadata_cache:
+            self._read(stream, mapped=mapped, progress=progress)
+            return
+
+        source = self._metadata_cache_source()
+
+        # the unfinalised files are finalised by `_read` and are not cached
+        stream.seek(0)
+        if source is None or FileIdentificationBlock(stream=stream, mapped=mapped).unfinalized_standard_flags:
+            self._read(stream, mapped=mapped, progress=progress)
+            return
+
+        identity = file_identity(
+            source,
+            channels=sorted(self.load_filter) if self.use_load_filter else None,
+            use_display_names=self._use_display_names,
+            remove_source_from_channel_names=self._remove_source_from_channel_names,
+            process_bus_logging=self._kwargs.get("process_bus_logging", True),
+            column_storage=self._kwargs.get("column_storage", True),
+            lazy_channel_metadata=self._lazy_channel_metadata,
+        )
+        cache_path = metadata_cache_path(source, GLOBAL_OPTIONS["metadata_cache_folder"])
+
+        state = load_metadata_cache(cache_path, identity)
+        if state is not None and all(attr in state for attr in METADATA_CACHE_ATTRIBUTES):
+            self._mapped = mapped
+            for attr in METADATA_CACHE_ATTRIBUTES:
+                setattr(self, attr, state[attr])
+            if self._channel_metadata_source is not None:
+                self._channel_metadata_source.stream = stream
+
+            # the signal data blocks are found again when they are needed
+            for group in self.groups:
+                for index, signal_data in enumerate(group.signal_data):
+                    if signal_data is not None and signal_data[1] is None:
+                        group.signal_data[index] = (
+                            [],
+                            self._get_signal_data_blocks_info(group.channels[index].data_block_addr, stream),
+                        )
+
+            self._metadata_cache_info = cache_path, identity
+
+            if progress is not None and callable(progress):
+                progress(*self.progress)
+            return
+
+        self._read(stream, mapped=mapped, progress=progress)
+
+        self._metadata_cache_info = cache_path, identity
+        self._dump_metadata_cache()
+
+    def _metadata_cache_source(self) -> Path | None:
+        """Get the measurement file that identifies the metadata index.
+
+        The zipped and compressed inputs are read from a temporary copy, so
+        the original input file is used; None is returned if the input is not
+        a file (for example a member of an opened zip archive).
+        """
+        if not self.original_name or self.original_name == Path(""):
+            return Path(self.name)
+
+        original_name = Path(self.original_name)
+        if original_name.is_file():
+            return original_name
+        else:
+            return None
+
+    def _dump_metadata_cache(self) -> None:
+        """Write the current metadata state to the persistent index."""
+        if self._metadata_cache_info is None:
+            return
+
+        # sorted or modified groups have their data in the temporary file
+        if not all(group.data_location == v4c.LOCATION_ORIGINAL_FILE for group in self.groups):
+            self._metadata_cache_info = None
+            return
+
+        # the block generators cannot be pickled; the data blocks are loaded
+        # when the file is read, and the signal data blocks that are not loaded
+        # yet are marked so that they are found again after the index is loaded
+        generators = []
+        for group in self.groups:
+            signal_data = list(group.signal_data)
+            generators.append((group.data_blocks_info_generator, signal_data))
+
+            group.data_blocks_info_generator = iter(EMPTY_TUPLE)
+            for index, item in enumerate(signal_data):
+                if item is not None:
+                    blocks, generator = item
+                    if isgenerator(generator):
+                        group.signal_data[index] = ([], None)  # type: ignore[assignment]
+                    else:
+                        group.signal_data[index] = (blocks, iter(EMPTY_TUPLE))
+
+        try:
+            cache_path, identity = self._metadata_cache_info
+            state = {attr: getattr(self, attr) for attr in METADATA_CACHE_ATTRIBUTES}
+            dump_metadata_cache(cache_path, identity, state)
+        finally:
+            for group, (data_blocks_info_generator, signal_data) in zip(self.groups, generators, strict=False):
+                group.data_blocks_info_generator = data_blocks_info_generator
+                group.signal_data[:] = signal_data
+
     @overload
     def _read_channels(
         self,
@@ -964,6 +1189,7 @@ class MDF4(MDF_Common[Group]):
                         mapped=mapped,
                         parsed_strings=(name, display_names, comment),
                         file_limit=self.file_limit,
+                        metadata_source=self._channel_metadata_source,
                     )
 
                     si_path = getattr(channel.source, "path", "")
@@ -1013,7 +1239,8 @@ class MDF4(MDF_Common[Group]):
                     mapped=mapped,
                     parsed_strings=None,
                     file_limit=self.file_limit,
-                    units_map=self._units_map
+                    units_map=self._units_map,
+                    metadata_source=self._channel_metadata_source,
                 )
 
             if channel.data_type not in VALID_DATA_TYPES:
@@ -1441,6 +1668,225 @@ class MDF4(MDF_Common[Group]):
 
         return data
 
+    def _get_decompression_pool(self) -> ThreadPoolExecutor | None:
+        """Get the thread pool used to decompress the data blocks; None is
+        returned if the decompression runs on the caller's thread.
+        """
+        thread_count = self._decompression_thread_count or THREAD_COUNT
+        if thread_count <= 1:
+            return None
+
+        if self._decompression_pool is None or self._decompression_pool._max_workers != thread_count:
+            if self._decompression_pool is not None:
+                self._decompression_pool.shutdown(wait=False)
+            self._decompression_pool = ThreadPoolExecutor(
+                max_workers=thread_count, thread_name_prefix="asammdf_decompression"
+            )
+
+        return self._decompression_pool
+
+    def _get_prefetch_pool(self) -> ThreadPoolExecutor:
+        """Get the single thread pool used to read the data blocks ahead."""
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asammdf_prefetch")
+
+        return self._prefetch_pool
+
+    def _read_data_blocks(
+        self,
+        group: Group,
+        stream: "FileLike | mmap.mmap | tempfile._TemporaryFileWrapper[bytes]",
+        record_offset: int = 0,
+        invalidation: bool = False,
+    ) -> Iterator[tuple[DataBlockInfo, bytes | None, bytes | None]]:
+        """Yield the group's data blocks info together with the raw (compressed)
+        block bytes, in record order.
+
+        Blocks that end before `record_offset` (in bytes) are yielded without
+        bytes. If `invalidation` is True the bytes of the matching invalidation
+        block are also read (column oriented storage); otherwise the third item
+        is None.
+
+        Up to `prefetch_depth` blocks, but not more than `read_fragment_size`
+        bytes, are read ahead of the yielded block: memory mapped files get a
+        MADV_WILLNEED hint and the other files opened by this object are read
+        with `os.pread` on a background thread, so that the disk I/O overlaps
+        the decoding of the current data. User file objects are read without
+        prefetching.
+        """
+        seek = stream.seek
+        read = stream.read
+
+        depth = self._prefetch_depth
+        size_limit = self._read_fragment_size
+        advise: Callable[[int, int, int], None] | None = None
+        fd: int | None = None
+
+        if depth:
+            if isinstance(stream, mmap.mmap):
+                if hasattr(mmap, "MADV_WILLNEED"):
+                    advise = stream.madvise
+            # the temporary file can have pending writes in the file object's buffer
+            # and the file descriptor of a user file object can belong to another
+            # file (for example the compressed file of a gzip.GzipFile)
+            elif stream is self._file and not self._from_filelike and hasattr(os, "pread"):
+                try:
+                    fd = stream.fileno()
+                except (AttributeError, OSError, ValueError):
+                    fd = None
+
+            if advise is None and fd is None:
+                depth = 0
+
+        pool = self._get_prefetch_pool() if fd is not None else None
+
+        def request(address: int, size: int) -> bytes | Future[bytes] | tuple[int, int]:
+            if pool is not None:
+                return pool.submit(_pread, typing.cast(int, fd), size, address)
+            elif advise is not None:
+                start = address - address % mmap.PAGESIZE
+                try:
+                    advise(mmap.MADV_WILLNEED, start, size + address - start)
+                except (OSError, ValueError):
+                    pass
+                return address, size
+            else:
+                seek(address)
+                return read(size)
+
+        def fetch(data: bytes | Future[bytes] | tuple[int, int] | None) -> bytes | None:
+            if isinstance(data, Future):
+                return data.result()
+            elif isinstance(data, tuple):
+                address, size = data
+                seek(address)
+                return read(size)
+            else:
+                return data
+
+        pending: deque[
+            tuple[
+                DataBlockInfo,
+                bytes | Future[bytes] | tuple[int, int] | None,
+                bytes | Future[bytes] | tuple[int, int] | None,
+                int,
+            ]
+        ] = deque()
+        pending_size = 0
+
+        position = 0
+        skip = True
+
+        for info in group.get_data_blocks():
+            original_size = typing.cast(int, info.original_size)
+
+            if skip and position + original_size < record_offset + 1:
+                position += original_size
+                pending.append((info, None, None, 0))
+            else:
+                skip = False
+                size = typing.cast(int, info.compressed_size)
+                new_data = request(info.address, size)
+
+                new_invalidation_data = None
+                invalidation_info = info.invalidation_block
+                if invalidation and invalidation_info is not None and not invalidation_info.all_valid:
+                    invalidation_size = typing.cast(int, invalidation_info.compressed_size)
+                    new_invalidation_data = request(invalidation_info.address, invalidation_size)
+                    size += invalidation_size
+
+                pending.append((info, new_data, new_invalidation_data, size))
+                pending_size += size
+
+            while len(pending) > depth or (size_limit and pending_size > size_limit and len(pending) > 1):
+                block_info, block_data, invalidation_block_data, size = pending.popleft()
+                pending_size -= size
+                yield block_info, fetch(block_data), fetch(invalidation_block_data)
+
+        while pending:
+            block_info, block_data, invalidation_block_data, size = pending.popleft()
+            yield block_info, fetch(block_data), fetch(invalidation_block_data)
+
+    def _iter_data_blocks(
+        self,
+        group: Group,
+        stream: "FileLike | mmap.mmap | tempfile._TemporaryFileWrapper[bytes]",
+        record_offset: int = 0,
+        samples_size: int = 0,
+        invalidation_size: int = 0,
+    ) -> Iterator[tuple[DataBlockInfo, bytes | None, bytes | None]]:
+        """Yield the group's data blocks info together with the decompressed
+        block bytes, in record order.
+
+        Blocks that end before `record_offset` (in bytes) are yielded without
+        bytes. The compressed blocks are read (and prefetched) by
+        `_read_data_blocks` and inflated ahead in the decompression thread
+        pool; the zlib/lz4 calls release the GIL so several blocks are decoded
+        concurrently.
+
+        If `invalidation_size` is not 0, the matching invalidation block bytes
+        are also loaded (column oriented storage); otherwise the third item is
+        None.
+        """
+        pool = self._get_decompression_pool()
+        if pool is None:
+            window = 0
+        else:
+            window = 2 * pool._max_workers
+
+        pending: deque[tuple[DataBlockInfo, bytes | Future[bytes] | None, bytes | Future[bytes] | None]] = deque()
+
+        def inflate(data: bytes, block_info: DataBlockInfo) -> bytes | Future[bytes]:
+            if pool is None or block_info.block_type == v4c.DT_BLOCK:
+                return _inflate_block(data, block_info)
+            else:
+                return pool.submit(_inflate_block, data, block_info)
+
+        for info, data, invalidation_data in self._read_data_blocks(
+            group, stream, record_offset, invalidation=bool(invalidation_size)
+        ):
+            if data is None:
+                pending.append((info, None, None))
+            else:
+                new_data = inflate(data, info)
+
+                new_invalidation_data: bytes | Future[bytes] | None = None
+                if invalidation_size:
+                    invalidation_info = info.invalidation_block
+                    if invalidation_info is None:
+                        pass
+                    elif invalidation_info.all_valid:
+                        count = typing.cast(int, info.original_size) // samples_size
+                        new_invalidation_data = b"\0" * (count * invalidation_size)
+                    else:
+                        new_invalidation_data = inflate(typing.cast(bytes, invalidation_data), invalidation_info)
+
+                pending.append((info, new_data, new_invalidation_data))
+
+            while len(pending) > window:
+                block_info, block_data, invalidation_block_data = pending.popleft()
+                yield (
+                    block_info,
+                    block_data.result() if isinstance(block_data, Future) else block_data,
+                    (
+                        invalidation_block_data.result()
+                        if isinstance(invalidation_block_data, Future)
+                        else invalidation_block_data
+                    ),
+                )
+
+        while pending:
+            block_info, block_data, invalidation_block_data = pending.popleft()
+            yield (
+                block_info,
+                block_data.result() if isinstance(block_data, Future) else block_data,
+                (
+                    invalidation_block_data.result()
+                    if isinstance(invalidation_block_data, Future)
+                    else invalidation_block_data
+                ),
+            )
+
     def _load_data(
         self,
         group: Group,
@@ -1459,7 +1905,6 @@ class MDF4(MDF_Common[Group]):
         has_yielded = False
         _count = 0
 
-        data_blocks_info_generator = group.data_blocks_info_generator
         channel_group = group.channel_group
 
         stream: FileLike | mmap.mmap | tempfile._TemporaryFileWrapper[bytes]
@@ -1468,9 +1913,6 @@ class MDF4(MDF_Common[Group]):
         else:
             stream = self._tempfile
 
-        read = stream.read
-        seek = stream.seek
-
         if group.uses_ld:
             samples_size = channel_group.samples_byte_nr
             invalidation_size = channel_group.invalidation_bytes_nr
@@ -1533,8 +1975,6 @@ class MDF4(MDF_Common[Group]):
 
             invalidation_split_size = int(invalidation_split_size)
 
-            blocks = iter(group.data_blocks)
-
             cur_size = 0
             data: list[object] = []
 
@@ -1545,59 +1985,19 @@ class MDF4(MDF_Common[Group]):
             ss = 0
             cc = 0
 
-            while True:
-                try:
-                    info = next(blocks)
-                    (
-                        address,
-                        original_size,
-                        compressed_size,
-                        block_type,
-                        param,
-                        block_limit,
-                    ) = (
-                        info.address,
-                        typing.cast(int, info.original_size),
-                        info.compressed_size,
-                        info.block_type,
-                        info.param,
-                        info.block_limit,
-                    )
-
-                    if rm and invalidation_size:
-                        invalidation_info = info.invalidation_block
-                    else:
-                        invalidation_info = None
-                except StopIteration:
-                    try:
-                        info = next(data_blocks_info_generator)
-                        (
-                            address,
-                            original_size,
-                            compressed_size,
-                            block_type,
-                            param,
-                            block_limit,
-                        ) = (
-                            info.address,
-                            typing.cast(int, info.original_size),
-                            info.compressed_size,
-                            info.block_type,
-                            info.param,
-                            info.block_limit,
-                        )
-
-                        if rm and invalidation_size:
-                            invalidation_info = info.invalidation_block
-                        else:
-                            invalidation_info = None
-                        group.data_blocks.append(info)
-                    except StopIteration:
-                        break
+            for info, new_data, new_invalidation_data in self._iter_data_blocks(
+                group,
+                stream,
+                record_offset=record_offset,
+                samples_size=samples_size,
+                invalidation_size=invalidation_size if rm else 0,
+            ):
+                original_size = typing.cast(int, info.original_size)
 
-                if offset + original_size < record_offset + 1:
+                if new_data is None:
                     offset += original_size
                     if rm and invalidation_size:
+                        invalidation_info = info.invalidation_block
                         if invalidation_info is None:
                             raise RuntimeError(
                                 "'invalidation_info' cannot be None if 'rm and invalidation_size' is True"
@@ -1609,73 +2009,16 @@ class MDF4(MDF_Common[Group]):
                             invalidation_offset += typing.cast(int, invalidation_info.original_size)
                     continue
 
-                seek(address)
-                new_data: bytes | memoryview[int] = read(typing.cast(int, compressed_size))
-
                 cc += 1
                 ss += original_size
 
-                match block_type:
-                    case v4c.DZ_BLOCK_DEFLATE:
-                        new_data = decompress(new_data, bufsize=original_size)
-                    case v4c.DZ_BLOCK_TRANSPOSED:
-                        new_data = decompress(new_data, bufsize=original_size)
-                        cols = typing.cast(int, param)
-                        lines = original_size // cols
-                        matrix_size = lines * cols
-
-                        if matrix_size != original_size:
-                            new_data = (
-                                frombuffer(new_data[:matrix_size], dtype=uint8)
-                                .reshape((cols, lines))
-                                .T.ravel()
-                                .tobytes()
-                                + new_data[matrix_size:]
-                            )
-                        else:
-                            new_data = frombuffer(new_data, dtype=uint8).reshape((cols, lines)).T.ravel().tobytes()
-
-                    case v4c.DZ_BLOCK_LZ:
-                        new_data = lz_decompress(new_data)
-
-                if block_limit is not None:
-                    new_data = new_data[:block_limit]
-
                 if len(new_data) > split_size - cur_size:
                     new_data = memoryview(new_data)
 
                 if rm and invalidation_size:
-                    if invalidation_info is None:
+                    if new_invalidation_data is None:
                         raise RuntimeError("'invalidation_info' cannot be None if 'rm and invalidation_size' is True")
 
-                    if invalidation_info.all_valid:
-                        count = original_size // samples_size
-                        new_invalidation_data = b"\0" * (count * invalidation_size)
-
-                    else:
-                        seek(invalidation_info.address)
-                        compressed_size = typing.cast(int, invalidation_info.compressed_size)
-                        new_invalidation_data = read(compressed_size)
-                        original_size = typing.cast(int, invalidation_info.original_size)
-                        if invalidation_info.block_type == v4c.DZ_BLOCK_DEFLATE:
-                            new_invalidation_data = decompress(
-                                new_invalidation_data,
-                                bufsize=original_size,
-                            )
-                        elif invalidation_info.block_type == v4c.DZ_BLOCK_TRANSPOSED:
-                            new_invalidation_data = decompress(
-                                new_invalidation_data,
-                                bufsize=original_size,
-                            )
-                            cols = typing.cast(int, invalidation_info.param)
-                            lines = original_size // cols
-
-                            nd = frombuffer(new_invalidation_data[: lines * cols], dtype=uint8)
-                            nd = nd.reshape((cols, lines))
-                            new_invalidation_data = nd.T.ravel().tobytes() + new_invalidation_data[lines * cols :]
-                        if invalidation_info.block_limit is not None:
-                            new_invalidation_data = new_invalidation_data[: invalidation_info.block_limit]
-
                     inv_size = len(new_invalidation_data)
 
                 if offset < record_offset:
@@ -2969,14 +3312,12 @@ class MDF4(MDF_Common[Group]):
                         t = unique(concatenate(times))
                         if t.dtype != float64:
                             t = t.astype(float64)
-                        signals = [
-                            s.interp(
-                                t,
-                                integer_interpolation_mode=self._integer_interpolation,
-                                float_interpolation_mode=self._float_interpolation,
-                            )
-                            for s in signals
-                        ]
+                        signals = interp_signals(
+                            signals,
+                            t,
+                            integer_interpolation_mode=self._integer_interpolation,
+                            float_interpolation_mode=self._float_interpolation,
+                        )
                     else:
                         t = t_
                 else:
@@ -3017,7 +3358,7 @@ class MDF4(MDF_Common[Group]):
 
         self.groups.append(gp)
 
-        fields: list[tuple[bytes | NDArray[Any], int]] = []
+        fields: list[tuple[bytes | bytearray | NDArray[Any] | list[NDArray[Any] | None], int]] = []
 
         ch_cntr = 0
         offset = 0
@@ -3963,23 +4304,20 @@ class MDF4(MDF_Common[Group]):
 
             _unknown_pos_map = deque(list(range(len(inval_arrays), len(inval_arrays) + len(unknown_origin))))
 
-            invalidation_bits_list = typing.cast(list[NDArray[np.bool]], list(inval_arrays.values()) + unknown_origin)
-            invalidation_bytes_nr = len(invalidation_bits_list)
-
-            for _ in range(8 - invalidation_bytes_nr % 8):
-                invalidation_bits_list.append(zeros(cycles_nr, dtype=bool))
-
-            invalidation_bits_list.reverse()
-            invalidation_bytes_nr = len(invalidation_bits_list) // 8
+            # the bit i of the invalidation bytes is set by the i-th array and
+            # at least one spare bit is always reserved
+            invalidation_bits_list: list[NDArray[Any] | None] = [
+                bits if bits.itemsize == 1 else bits.astype(bool) for bits in (*inval_arrays.values(), *unknown_origin)
+            ]
+            invalidation_bytes_nr = len(invalidation_bits_list) // 8 + 1
 
             gp.channel_group.invalidation_bytes_nr = invalidation_bytes_nr
 
-            bytes_array = np.fliplr(
-                np.packbits(array(invalidation_bits_list).T).reshape((cycles_nr, invalidation_bytes_nr))
-            ).ravel()
-
+            bytes_array: bytearray | None = None
             if self.version < "4.20":
-                fields.append((bytes_array, invalidation_bytes_nr))
+                fields.append((invalidation_bits_list, invalidation_bytes_nr))
+            else:
+                bytes_array = data_block_from_arrays([(invalidation_bits_list, invalidation_bytes_nr)], cycles_nr)
 
             for ch in gp.channels:
                 if ch.flags & v4c.FLAG_CN_INVALIDATION_PRESENT:
@@ -4058,9 +4396,8 @@ class MDF4(MDF_Common[Group]):
 
                 if bytes_array is not None:
                     addr = tell()
-                    data = bytes_array.tobytes()
-                    raw_size = len(data)
-                    data = lz_compress(data, store_size=True)
+                    raw_size = len(bytes_array)
+                    data = lz_compress(bytes_array, store_size=True)
                     size = len(data)
                     self._tempfile.write(data)
 
@@ -6108,9 +6445,149 @@ class MDF4(MDF_Common[Group]):
             message = '"append" requires a non-empty list of Signal objects'
             raise MdfException(message)
 
+        added_cycles = len(signals[0][0])
+
+        samples_bytes, inval_bits_vals = self._build_records(index, signals)
+
+        if samples_bytes:
+            self._buffer_records(index, samples_bytes, inval_bits_vals, added_cycles)
+
+            gp.channel_group.cycles_nr += added_cycles
+            self.virtual_groups[index].cycles_nr += added_cycles
+
+    def _buffer_records(
+        self,
+        index: int,
+        data: bytes | bytearray,
+        invalidation_data: bytes | bytearray | None,
+        cycles_nr: int,
+    ) -> None:
+        """Add the records of an `extend` call to the append buffer of the
+        group.
+
+        Consecutive calls are merged and written as data blocks once the buffer
+        reaches `append_buffer_size` bytes or `append_buffer_samples` records,
+        or once it is older than `append_buffer_interval` seconds. The pending
+        records are also written as soon as the group's data blocks are
+        iterated (read, save, cut etc.).
+        """
+        group = self.groups[index]
+        buffer = self._append_buffers.get(index)
+
+        if buffer is None:
+            size = len(data) + (len(invalidation_data) if invalidation_data is not None else 0)
+            if self._is_append_buffer_full(size, cycles_nr, perf_counter()):
+                group.load_all_data_blocks()
+                group.data_blocks.extend(self._write_append_blocks(data, invalidation_data, cycles_nr))
+                return
+
+            buffer = self._append_buffers[index] = AppendBuffer(perf_counter())
+            group.data_blocks_info_generator = chain(
+                group.data_blocks_info_generator, self._iter_append_buffer_blocks(index)
+            )
+
+        if invalidation_data is not None:
+            if buffer.invalidation_data is None:
+                # the previously buffered records are valid
+                buffer.invalidation_data = bytearray(len(invalidation_data) // cycles_nr * buffer.cycles_nr)
+            buffer.invalidation_data += invalidation_data
+        elif buffer.invalidation_data is not None:
+            buffer.invalidation_data += bytes(len(buffer.invalidation_data) // buffer.cycles_nr * cycles_nr)
+
+        buffer.data += data
+        buffer.cycles_nr += cycles_nr
+
+        size = len(buffer.data) + (len(buffer.invalidation_data) if buffer.invalidation_data is not None else 0)
+        if self._is_append_buffer_full(size, buffer.cycles_nr, buffer.start_time):
+            group.load_all_data_blocks()
+
+    def _is_append_buffer_full(self, size: int, cycles_nr: int, start_time: float) -> bool:
+        return (
+            size >= self._append_buffer_size
+            or 0 < self._append_buffer_samples <= cycles_nr
+            or 0 < self._append_buffer_interval <= perf_counter() - start_time
+        )
+
+    def _iter_append_buffer_blocks(self, index: int) -> Iterator[DataBlockInfo]:
+        """Write the pending records of the group's append buffer and yield
+        the new data blocks info.
+        """
+        buffer = self._append_buffers.pop(index, None)
+        if buffer is not None and buffer.cycles_nr:
+            yield from self._write_append_blocks(buffer.data, buffer.invalidation_data, buffer.cycles_nr)
+
+    def _write_append_blocks(
+        self,
+        data: bytes | bytearray,
+        invalidation_data: bytes | bytearray | None,
+        cycles_nr: int,
+    ) -> list[DataBlockInfo]:
+        """Write the records to the temporary file as LZ4 compressed data
+        blocks of up to 32 MB.
+        """
+        stream = self._tempfile
+        stream.seek(0, 2)
+        write = stream.write
+        tell = stream.tell
+
+        record_size = len(data) // cycles_nr
+        invalidation_size = len(invalidation_data) // cycles_nr if invalidation_data is not None else 0
+        block_cycles = max(32 * 1024 * 1024 // record_size, 1) if record_size else cycles_nr
+
+        data_view = memoryview(data)
+        invalidation_view = memoryview(invalidation_data) if invalidation_data is not None else None
+
+        blocks = []
+        for start in range(0, cycles_nr, block_cycles):
+            stop = min(start + block_cycles, cycles_nr)
+
+            raw_data = data_view[start * record_size : stop * record_size]
+            compressed_data = lz_compress(raw_data, store_size=True)
+
+            info = DataBlockInfo(
+                address=tell(),
+                block_type=v4c.DZ_BLOCK_LZ,
+                original_size=len(raw_data),
+                compressed_size=len(compressed_data),
+                param=0,
+            )
+            write(compressed_data)
+
+            if invalidation_view is not None:
+                raw_data = invalidation_view[start * invalidation_size : stop * invalidation_size]
+                compressed_data = lz_compress(raw_data, store_size=True)
+
+                info.invalidation_block = InvalidationBlockInfo(
+                    address=tell(),
+                    block_type=v4c.DZ_BLOCK_LZ,
+                    original_size=len(raw_data),
+                    compressed_size=len(compressed_data),
+                    param=0,
+                )
+                write(compressed_data)
+
+            blocks.append(info)
+
+        return blocks
+
+    def _build_records(
+        self, index: int, signals: Sequence[tuple[NDArray[Any], NDArray[np.bool] | None]]
+    ) -> tuple[bytearray, bytearray | None]:
+        """Build the records of a row oriented group from the `extend`
+        (values, invalidation_bits) pairs.
+
+        The columns, including the packed invalidation bits, are interleaved
+        by `data_block_from_arrays` without intermediate record arrays. The
+        samples of the variable length signals are written to the temporary
+        file. The invalidation bytes are part of the records for versions older
+        than 4.20; otherwise they are returned separately (None is returned if
+        they are part of the records or if the group has no invalidation
+        bytes).
+        """
+        gp = self.groups[index]
         stream = self._tempfile
 
-        fields: list[tuple[bytes | NDArray[Any], int]] = []
+        fields: list[tuple[bytes | bytearray | NDArray[Any] | list[NDArray[Any] | None], int]] = []
         inval_bits_map: dict[tuple[int, int], list[InvalidationArray] | InvalidationArray] = {
             InvalidationArray.ORIGIN_UNKNOWN: []
         }
@@ -6152,12 +6629,9 @@ class MDF4(MDF_Common[Group]):
                         fields.append((signal, sig_size))
 
                     else:
-                        arrays: list[Any] = []
                         for field in ("ms", "min", "hour", "day", "month", "year"):
-                            arrays.append(signal[field])
-                        vals = np.rec.fromarrays(arrays).tobytes()
-
-                        fields.append((vals, sig_size))
+                            samples = signal[field]
+                            fields.append((samples, samples.itemsize))
 
                 case v4c.SIGNAL_TYPE_STRUCTURE_COMPOSITION:
                     if not signal.flags["C_CONTIGUOUS"]:
@@ -6243,15 +6717,14 @@ class MDF4(MDF_Common[Group]):
 
                         offsets_arr = arange(len(signal), dtype=uint64) * (signal.itemsize + 4)
 
-                        values = [full(len(signal), signal.itemsize, dtype=uint32), signal]
-
-                        types_ = [("", uint32), ("", signal.dtype)]
-
-                        values_arr = np.rec.fromarrays(values, dtype=types_)
+                        values_block = data_block_from_arrays(
+                            [(full(len(signal), signal.itemsize, dtype=uint32), 4), (signal, signal.itemsize)],
+                            len(signal),
+                        )
 
                         stream.seek(0, 2)
                         addr = stream.tell()
-                        block_size = len(values_arr) * values_arr.itemsize
+                        block_size = len(values_block)
                         if block_size:
                             info = SignalDataBlockInfo(
                                 address=addr,
@@ -6263,7 +6736,7 @@ class MDF4(MDF_Common[Group]):
                                 list[tuple[list[SignalDataBlockInfo], Iterator[SignalDataBlockInfo]]], gp.signal_data
                             )
                             signal_data[i][0].append(info)
-                            values_arr.tofile(stream)
+                            stream.write(values_block)
 
                         offsets_arr += cur_offset
                         if not offsets_arr.flags["C_CONTIGUOUS"]:
@@ -6274,141 +6747,64 @@ class MDF4(MDF_Common[Group]):
             unknown_origin = typing.cast(list[InvalidationArray], inval_bits_map.pop(InvalidationArray.ORIGIN_UNKNOWN))
             inval_array_map = typing.cast(dict[tuple[int, int], InvalidationArray], inval_bits_map)
 
-            inval_bits = typing.cast(list[NDArray[np.bool]], list(inval_array_map.values()) + unknown_origin)
-            cycles_nr = len(inval_bits[0])
-            new_invalidation_bytes_nr = len(inval_bits)
-
-            for _ in range(8 - new_invalidation_bytes_nr % 8):
-                inval_bits.append(zeros(cycles_nr, dtype=bool))
-
-            inval_bits.reverse()
-            new_invalidation_bytes_nr = len(inval_bits) // 8
+            # the bit i of the invalidation bytes is set by the i-th array
+            inval_bits: list[NDArray[Any] | None] = [
+                bits if bits.itemsize == 1 else bits.astype(bool)
+                for bits in (*inval_array_map.values(), *unknown_origin)
+            ]
 
-            if new_invalidation_bytes_nr != invalidation_bytes_nr:
+            # the append method always reserves at least one spare bit
+            if len(inval_bits) // 8 + 1 != invalidation_bytes_nr:
                 raise MdfException(
                     "The invalidation bytes number in the extend methods differs from the one from the append"
                 )
 
-            inval_bits_vals = np.fliplr(
-                np.packbits(array(inval_bits).T).reshape((cycles_nr, invalidation_bytes_nr))
-            ).ravel()
-
             if self.version < "4.20":
-                fields.append((inval_bits_vals, invalidation_bytes_nr))
+                fields.append((inval_bits, invalidation_bytes_nr))
+            else:
+                inval_bits_vals = data_block_from_arrays([(inval_bits, invalidation_bytes_nr)], added_cycles)
+                return data_block_from_arrays(fields, added_cycles, THREAD_COUNT), inval_bits_vals
 
-        samples_bytes = data_block_from_arrays(fields, added_cycles, THREAD_COUNT)
-        size = len(samples_bytes)
-        samples_view = memoryview(samples_bytes)
+        return data_block_from_arrays(fields, added_cycles, THREAD_COUNT), None
 
-        del fields
+    def _extend_column_oriented(
+        self, index: int, signals: Sequence[tuple[NDArray[Any], NDArray[np.bool] | None]]
+    ) -> None:
+        """Extend a group with new samples.
 
-        stream.seek(0, 2)
-        addr = stream.tell()
+        `signals` contains (values, invalidation_bits) pairs for each extended
+        signal. The first pair is the master channel's pair, and the next pairs
+        must respect the same order in which the signals were appended. The
+        samples must have raw or physical values according to the signals used
+        for the initial append.
 
-        record_size = gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
+        Parameters
+        ----------
+        index : int
+            Group index.
+        signals : sequence
+            Sequence of (np.ndarray, np.ndarray) tuples.
 
-        if size:
-            if self.version < "4.20":
-                block_size = 32 * 1024 * 1024 // record_size * record_size
+        Examples
+        --------
+        >>> from asammdf import MDF, Signal
+        >>> import numpy as np
+        >>> s1 = np.array([1, 2, 3, 4, 5])
+        >>> s2 = np.array([-1, -2, -3, -4, -5])
+        >>> s3 = np.array([0.1, 0.04, 0.09, 0.16, 0.25])
+        >>> t = np.array([0.001, 0.002, 0.003, 0.004, 0.005])
+        >>> s1 = Signal(samples=s1, timestamps=t, unit='+', name='Positive')
+        >>> s2 = Signal(samples=s2, timestamps=t, unit='-', name='Negative')
+        >>> s3 = Signal(samples=s3, timestamps=t, unit='flts', name='Floats')
+        >>> mdf = MDF(version='4.10')
+        >>> mdf.append([s1, s2, s3], comment='created by asammdf')
+        >>> t = np.array([0.006, 0.007, 0.008, 0.009, 0.010])
 
-                count = ceil(size / block_size)
+        Extend without invalidation bits.
 
-                for i in range(count):
-                    data_ = samples_view[i * block_size : (i + 1) * block_size]
-                    raw_size = len(data_)
-                    data_ = lz_compress(data_, store_size=True)
+        >>> mdf.extend(0, [(t, None), (s1.samples, None), (s2.samples, None), (s3.samples, None)])
 
-                    size = len(data_)
-                    data_address = self._tempfile.tell()
-                    self._tempfile.write(data_)
-
-                    gp.data_blocks.append(
-                        DataBlockInfo(
-                            address=data_address,
-                            block_type=v4c.DZ_BLOCK_LZ,
-                            original_size=raw_size,
-                            compressed_size=size,
-                            param=0,
-                        )
-                    )
-
-                gp.channel_group.cycles_nr += added_cycles
-                self.virtual_groups[index].cycles_nr += added_cycles
-
-            else:
-                raw_size = size
-                data = lz_compress(samples, store_size=True)
-                size = len(data)
-                stream.write(data)
-
-                gp.data_blocks.append(
-                    DataBlockInfo(
-                        address=addr,
-                        block_type=v4c.DZ_BLOCK_LZ,
-                        original_size=raw_size,
-                        compressed_size=size,
-                        param=0,
-                    )
-                )
-
-                gp.channel_group.cycles_nr += added_cycles
-                self.virtual_groups[index].cycles_nr += added_cycles
-
-                if invalidation_bytes_nr:
-                    addr = stream.tell()
-
-                    data = inval_bits_vals.tobytes()
-                    raw_size = len(data)
-                    data = lz_compress(data, store_size=True)
-                    size = len(data)
-                    stream.write(data)
-
-                    gp.data_blocks[-1].invalidation_block = InvalidationBlockInfo(
-                        address=addr,
-                        block_type=v4c.DZ_BLOCK_LZ,
-                        original_size=raw_size,
-                        compressed_size=size,
-                        param=0,
-                    )
-
-    def _extend_column_oriented(
-        self, index: int, signals: Sequence[tuple[NDArray[Any], NDArray[np.bool] | None]]
-    ) -> None:
-        """Extend a group with new samples.
-
-        `signals` contains (values, invalidation_bits) pairs for each extended
-        signal. The first pair is the master channel's pair, and the next pairs
-        must respect the same order in which the signals were appended. The
-        samples must have raw or physical values according to the signals used
-        for the initial append.
-
-        Parameters
-        ----------
-        index : int
-            Group index.
-        signals : sequence
-            Sequence of (np.ndarray, np.ndarray) tuples.
-
-        Examples
-        --------
-        >>> from asammdf import MDF, Signal
-        >>> import numpy as np
-        >>> s1 = np.array([1, 2, 3, 4, 5])
-        >>> s2 = np.array([-1, -2, -3, -4, -5])
-        >>> s3 = np.array([0.1, 0.04, 0.09, 0.16, 0.25])
-        >>> t = np.array([0.001, 0.002, 0.003, 0.004, 0.005])
-        >>> s1 = Signal(samples=s1, timestamps=t, unit='+', name='Positive')
-        >>> s2 = Signal(samples=s2, timestamps=t, unit='-', name='Negative')
-        >>> s3 = Signal(samples=s3, timestamps=t, unit='flts', name='Floats')
-        >>> mdf = MDF(version='4.10')
-        >>> mdf.append([s1, s2, s3], comment='created by asammdf')
-        >>> t = np.array([0.006, 0.007, 0.008, 0.009, 0.010])
-
-        Extend without invalidation bits.
-
-        >>> mdf.extend(0, [(t, None), (s1.samples, None), (s2.samples, None), (s3.samples, None)])
-
-        Extend with some invalidation bits.
+        Extend with some invalidation bits.
 
         >>> s1_inv = np.array([0, 0, 0, 1, 1], dtype=bool)
         >>> mdf.extend(0, [(t, None), (s1.samples, s1_inv), (s2.samples, None), (s3.samples, None)])
@@ -6443,10 +6839,13 @@ class MDF4(MDF_Common[Group]):
                         samples = signal
 
                     else:
-                        vals = []
-                        for field in ("ms", "min", "hour", "day", "month", "year"):
-                            vals.append(signal[field])
-                        samples = np.rec.fromarrays(vals)
+                        samples = data_block_from_arrays(
+                            [
+                                (signal[field], signal[field].itemsize)
+                                for field in ("ms", "min", "hour", "day", "month", "year")
+                            ],
+                            added_cycles,
+                        )
 
                 case v4c.SIGNAL_TYPE_STRUCTURE_COMPOSITION:
                     samples = signal
@@ -6459,14 +6858,13 @@ class MDF4(MDF_Common[Group]):
 
                     offsets = arange(len(signal), dtype=uint64) * (signal.itemsize + 4)
 
-                    arrays = [full(len(signal), signal.itemsize, dtype=uint32), signal]
-
-                    types_ = [("", uint32), ("", signal.dtype)]
-
-                    values = np.rec.fromarrays(arrays, dtype=types_)
+                    values = data_block_from_arrays(
+                        [(full(len(signal), signal.itemsize, dtype=uint32), 4), (signal, signal.itemsize)],
+                        len(signal),
+                    )
 
                     addr = tell()
-                    block_size = len(values) * values.itemsize
+                    block_size = len(values)
                     if block_size:
                         info = SignalDataBlockInfo(
                             address=addr,
@@ -6475,53 +6873,25 @@ class MDF4(MDF_Common[Group]):
                             location=v4c.LOCATION_TEMPORARY_FILE,
                         )
                         sd_block_infos = typing.cast(
-                            tuple[list[SignalDataBlockInfo], Iterator[SignalDataBlockInfo]], gp.signal_data[i]
+                            tuple[list[SignalDataBlockInfo], Iterator[SignalDataBlockInfo]], gp.signal_data[0]
                         )
                         sd_block_infos[0].append(info)
-                        write(values.tobytes())
+                        write(values)
 
                     offsets += cur_offset
 
                     samples = offsets
 
-            addr = tell()
-
             if added_cycles:
-                data = samples.tobytes()
-                raw_size = len(data)
-                data = lz_compress(data, store_size=True)
-
-                size = len(data)
-                write(data)
-
-                gp.data_blocks.append(
-                    DataBlockInfo(
-                        address=addr,
-                        block_type=v4c.DZ_BLOCK_LZ,
-                        original_size=raw_size,
-                        compressed_size=size,
-                        param=0,
-                    )
+                self._buffer_records(
+                    index + i,
+                    samples if isinstance(samples, bytearray) else samples.tobytes(),
+                    invalidation_bits.tobytes() if invalidation_bits is not None else None,
+                    added_cycles,
                 )
 
                 gp.channel_group.cycles_nr += added_cycles
 
-                if invalidation_bits is not None:
-                    addr = tell()
-                    data = invalidation_bits.tobytes()
-                    raw_size = len(data)
-                    data = lz_compress(data, store_size=True)
-                    size = len(data)
-                    write(data)
-
-                    gp.data_blocks[-1].invalidation_block = InvalidationBlockInfo(
-                        address=addr,
-                        block_type=v4c.DZ_BLOCK_LZ,
-                        original_size=raw_size,
-                        compressed_size=size,
-                        param=None,
-                    )
-
     def attach(
         self,
         data: bytes,
@@ -6683,10 +7053,32 @@ class MDF4(MDF_Common[Group]):
             self._closed = True
 
         self._parent = None
+
+        # keep the data blocks master summaries computed in this session
+        if self._master_summary_changed and self._metadata_cache_info is not None:
+            try:
+                self._dump_metadata_cache()
+            except Exception as e:
+                logger.debug(f"Could not update the metadata index: {e}")
+
+        if self._decompression_pool is not None:
+            self._decompression_pool.shutdown(wait=False, cancel_futures=True)
+            self._decompression_pool = None
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_pool = None
+        self._append_buffers.clear()
+        if self._channel_metadata_source is not None:
+            self._channel_metadata_source.stream = None
         if self._tempfile is not None:
             self._tempfile.close()
         if not self._from_filelike and self._file is not None:
-            self._file.close()
+            try:
+                self._file.close()
+            except BufferError:
+                # zero-copy samples still reference the memory mapped file;
+                # the mapping is released when the last of them is deleted
+                pass
 
         if self._mapped_file is not None:
             self._mapped_file.close()
@@ -6869,6 +7261,7 @@ class MDF4(MDF_Common[Group]):
         record_offset: int = ...,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        copy: bool = ...,
     ) -> Signal: ...
 
     @overload
@@ -6886,6 +7279,7 @@ class MDF4(MDF_Common[Group]):
         record_offset: int = ...,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        copy: bool = ...,
     ) -> tuple[NDArray[Any], NDArray[np.bool] | None]: ...
 
     @overload
@@ -6903,6 +7297,7 @@ class MDF4(MDF_Common[Group]):
         record_offset: int = ...,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        copy: bool = ...,
     ) -> tuple[NDArray[Any], None]: ...
 
     @overload
@@ -6920,6 +7315,7 @@ class MDF4(MDF_Common[Group]):
         record_offset: int = ...,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        copy: bool = ...,
     ) -> tuple[NDArray[Any], NDArray[np.bool] | None]: ...
 
     @overload
@@ -6936,6 +7332,7 @@ class MDF4(MDF_Common[Group]):
         record_offset: int = ...,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        copy: bool = ...,
     ) -> Signal | tuple[NDArray[Any], NDArray[np.bool] | None]: ...
 
     def get(
@@ -6951,6 +7348,7 @@ class MDF4(MDF_Common[Group]):
         record_offset: int = 0,
         record_count: int | None = None,
         skip_channel_validation: bool = False,
+        copy: bool = True,
     ) -> Signal | tuple[NDArray[Any], NDArray[np.bool] | None]:
         """Get channel samples. The raw data group samples are not loaded to
         memory so it is advised to use `filter` or `select` instead of
@@ -7004,6 +7402,19 @@ class MDF4(MDF_Common[Group]):
 
             .. versionadded:: 7.0.0
 
+        copy : bool, default True
+            If False and the file is memory mapped, the raw samples of
+            byte-aligned numeric channels are read directly from the file
+            mapping. If the records are stored in a single uncompressed data
+            block, the samples are a read-only view over the file, without any
+            copy; if they are spread over several uncompressed data blocks they
+            are gathered with a single copy. This only has effect if `data`
+            and `raster` are None and the channel has no invalidation bits;
+            otherwise the samples are loaded as usual. The views keep the file
+            mapping alive after the `MDF` object is closed.
+
+            .. versionadded:: 8.8.0
+
         Returns
         -------
         res : (np.ndarray, np.ndarray) | Signal
@@ -7125,7 +7536,20 @@ class MDF4(MDF_Common[Group]):
                 channel = deepcopy(channel)
                 channel.byte_offset = 0
 
-        if vals is None:
+        mapped_samples: NDArray[Any] | None = None
+        if not copy and vals is None and data is None and not raster and not dependency_list:
+            mapped_samples = self._get_mapped_samples(grp, ch_nr, record_offset, record_count)
+
+        if mapped_samples is not None:
+            samples = mapped_samples
+            if master_is_required:
+                timestamps = self.get_master(gp_nr, record_offset=record_offset, record_count=record_count)
+            else:
+                timestamps = None
+            invalidation_bits = None
+            encoding = None
+
+        elif vals is None:
             if dependency_list:
                 if not isinstance(dependency_list[0], ChannelArrayBlock):
                     dependency_list = typing.cast(list[tuple[int, int]], dependency_list)
@@ -8018,6 +8442,100 @@ class MDF4(MDF_Common[Group]):
 
         return vals, None, invalidation_bits, None
 
+    def _get_mapped_samples(
+        self,
+        group: Group,
+        channel_index: int,
+        record_offset: int = 0,
+        record_count: int | None = None,
+    ) -> NDArray[Any] | None:
+        """Get the channel raw samples directly from the memory mapped file.
+
+        If the requested records are stored in a single uncompressed data
+        block, a read-only strided view over the file is returned; if they are
+        spread over several uncompressed data blocks, the samples are gathered
+        from the block views with a single copy. None is returned if the group
+        data is compressed or if the channel samples are not byte-aligned
+        numeric values.
+        """
+        if not isinstance(self._file, mmap.mmap) or group.data_location != v4c.LOCATION_ORIGINAL_FILE or group.uses_ld:
+            return None
+
+        channel = group.channels[channel_index]
+        if (
+            channel.channel_type not in (v4c.CHANNEL_TYPE_VALUE, v4c.CHANNEL_TYPE_MASTER)
+            or not channel.standard_C_size
+            or (
+                not self._ignore_invalidation_bits
+                and channel.flags & (v4c.FLAG_CN_ALL_INVALID | v4c.FLAG_CN_INVALIDATION_PRESENT)
+            )
+        ):
+            return None
+
+        info = self._prepare_record(group)[channel_index]
+        if info is None:
+            return None
+
+        dtype_, byte_size, byte_offset, bit_offset = info
+        if bit_offset or dtype_.kind not in "uif":
+            return None
+
+        channel_group = group.channel_group
+        record_size = channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr
+        cycles_nr = channel_group.cycles_nr
+
+        record_offset = min(record_offset, cycles_nr)
+        if record_count is None:
+            record_count = cycles_nr - record_offset
+        else:
+            record_count = min(record_count, cycles_nr - record_offset)
+        record_end = record_offset + record_count
+
+        # np.frombuffer keeps the mapping exported (it cannot be closed) while
+        # the views exist
+        record_dtype = np.dtype(
+            {"names": ["samples"], "formats": [dtype_], "offsets": [byte_offset], "itemsize": record_size}
+        )
+        views: list[NDArray[Any]] = []
+        position = 0
+        for block in group.get_data_blocks():
+            original_size = typing.cast(int, block.original_size)
+            if not original_size:
+                continue
+
+            # the records must not be split between the blocks
+            if block.block_type != v4c.DT_BLOCK or block.block_limit is not None or position % record_size:
+                return None
+
+            first = position // record_size
+            end = min((position + original_size) // record_size, cycles_nr)
+            position += original_size
+
+            if block.address + (end - first) * record_size > len(self._file):
+                return None
+
+            if end <= record_offset:
+                continue
+            elif first >= record_end:
+                break
+
+            start = max(first, record_offset)
+            records = frombuffer(
+                self._file,
+                dtype=record_dtype,
+                count=min(end, record_end) - start,
+                offset=block.address + (start - first) * record_size,
+            )
+            views.append(records["samples"])
+
+        if len(views) == 1:
+            return views[0]
+        elif views:
+            # several blocks: the samples are gathered with a single copy
+            return concatenate(views)
+        else:
+            return None
+
     @overload
     def _get_scalar(
         self,
@@ -9073,7 +9591,7 @@ class MDF4(MDF_Common[Group]):
 
                 self._invalidation_cache.clear()
 
-                if 1 and len(channels) >= 100:
+                if len(channels) > 1:
                     # prepare the invalidation bytes for this group and fragment
                     invalidation_bytes = get_channel_raw_bytes(
                         fragment.data,
@@ -9086,7 +9604,7 @@ class MDF4(MDF_Common[Group]):
                         fragment.data,
                         grp.channel_group.samples_byte_nr + grp.channel_group.invalidation_bytes_nr,
                         group_info[group_index],
-                        THREAD_COUNT,
+                        self._extraction_thread_count,
                     )
 
                     if idx == 0:
@@ -9417,8 +9935,307 @@ class MDF4(MDF_Common[Group]):
         if t.dtype != float64:
             t = t.astype(float64)
 
+        if fragment is None and not record_offset and record_count is None and time_ch_nr is not None:
+            self._set_master_summary(index, t)
+
+        return t
+
+    def _get_data_blocks_records(self, group: Group) -> list[tuple[DataBlockInfo, int, int]]:
+        """Get the (first record, end record) range of each non-empty data
+        block of the group, based on the blocks original size.
+        """
+        channel_group = group.channel_group
+        record_size = channel_group.samples_byte_nr
+        if not group.uses_ld:
+            record_size += channel_group.invalidation_bytes_nr
+
+        ranges: list[tuple[DataBlockInfo, int, int]] = []
+        if not record_size:
+            return ranges
+
+        position = 0
+        for info in group.get_data_blocks():
+            original_size = typing.cast(int, info.original_size)
+            first = position // record_size
+            position += original_size
+            end = min(position // record_size, channel_group.cycles_nr)
+            if end > first:
+                ranges.append((info, first, end))
+
+        return ranges
+
+    def _get_record_layout(self, index: int, channels: Sequence[int] | None = None) -> tuple[object, ...] | None:
+        """Get the record layout of the group: the record size and the position,
+        size and data type of the master channel followed by the `channels` (all
+        the group channels in their original order if `channels` is None).
+
+        Groups with equal layouts have interchangeable records, so their data
+        blocks can be copied verbatim from one group to the other. None is
+        returned if the group records cannot be copied without decoding them
+        (column oriented storage, unsorted data, remote master, signal data
+        and composed channels).
+        """
+        group = self.groups[index]
+        channel_group = group.channel_group
+
+        if (
+            group.uses_ld
+            or not group.sorted
+            or group.data_group.record_id_len
+            or channel_group.flags & (v4c.FLAG_CG_VLSD | v4c.FLAG_CG_REMOTE_MASTER)
+            or group.data_location not in (v4c.LOCATION_ORIGINAL_FILE, v4c.LOCATION_TEMPORARY_FILE)
+        ):
+            return None
+
+        if channels is None:
+            channels = range(len(group.channels))
+        elif (master_index := self.masters_db.get(index, None)) is None:
+            return None
+        else:
+            channels = [master_index, *channels]
+
+        layout: list[tuple[int, ...]] = []
+        for channel_index in channels:
+            channel = group.channels[channel_index]
+            if (
+                channel.channel_type in (v4c.CHANNEL_TYPE_VLSD, v4c.CHANNEL_TYPE_MLSD, v4c.CHANNEL_TYPE_VLSC)
+                or group.channel_dependencies[channel_index]
+            ):
+                return None
+
+            layout.append(
+                (
+                    channel.channel_type,
+                    channel.sync_type,
+                    channel.data_type,
+                    channel.byte_offset,
+                    channel.bit_offset,
+                    channel.bit_count,
+                    channel.flags & v4c.FLAG_CN_INVALIDATION_PRESENT,
+                    channel.pos_invalidation_bit,
+                )
+            )
+
+        return channel_group.samples_byte_nr, channel_group.invalidation_bytes_nr, tuple(layout)
+
+    def _copy_records(
+        self,
+        group: Group,
+        destination: "MDF4",
+        index: int,
+        record_offset: int = 0,
+        record_count: int | None = None,
+        append: bool = False,
+    ) -> None:
+        """Copy the group records to the group `index` of the `destination`
+        file; the two groups must have the same record layout (see
+        `_get_record_layout`).
+
+        The data blocks found completely inside the records range are copied
+        verbatim, without decompressing them, and only the blocks that
+        contain the range limits are decompressed, cut and compressed again.
+        If `append` is True the records are added after the destination
+        records; otherwise they replace the destination records.
+        """
+        channel_group = group.channel_group
+        record_size = channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr
+
+        if record_count is None:
+            record_count = channel_group.cycles_nr - record_offset
+        start = record_offset * record_size
+        end = start + record_count * record_size
+
+        stream: FileLike | mmap.mmap | tempfile._TemporaryFileWrapper[bytes]
+        if group.data_location == v4c.LOCATION_ORIGINAL_FILE:
+            stream = typing.cast(FileLike | mmap.mmap, self._file)
+        else:
+            stream = self._tempfile
+
+        out = destination._tempfile
+        blocks: list[DataBlockInfo] = []
+
+        position = 0
+        if end > start:
+            for info, data, _ in self._read_data_blocks(group, stream, start):
+                block_start = position
+                size = typing.cast(int, info.original_size)
+                if info.block_limit is not None:
+                    size = min(size, info.block_limit)
+                position += size
+
+                if data is None or position <= start:
+                    continue
+                elif block_start >= end:
+                    break
+
+                if block_start < start or position > end:
+                    data = _inflate_block(data, info)[max(start - block_start, 0) : end - block_start]
+                    original_size = len(data)
+                    data = lz_compress(data, store_size=True)
+                    new_info = DataBlockInfo(
+                        address=0,
+                        block_type=v4c.DZ_BLOCK_LZ,
+                        original_size=original_size,
+                        compressed_size=len(data),
+                        param=0,
+                    )
+                else:
+                    new_info = DataBlockInfo(
+                        address=0,
+                        block_type=info.block_type,
+                        original_size=info.original_size,
+                        compressed_size=info.compressed_size,
+                        param=info.param,
+                        block_limit=info.block_limit,
+                    )
+
+                out.seek(0, 2)
+                new_info.address = out.tell()
+                out.write(data)
+                blocks.append(new_info)
+
+        destination_group = destination.groups[index]
+        if append:
+            blocks = [*destination_group.get_data_blocks(), *blocks]
+            record_count += destination_group.channel_group.cycles_nr
+        else:
+            destination._append_buffers.pop(index, None)
+
+        destination_group.data_blocks = blocks
+        destination_group.data_blocks_info_generator = iter(EMPTY_TUPLE)
+        destination_group.data_location = v4c.LOCATION_TEMPORARY_FILE
+        destination_group.channel_group.cycles_nr = record_count
+        if index in destination.virtual_groups:
+            destination.virtual_groups[index].cycles_nr = record_count
+
+    def _set_master_summary(self, index: int, t: NDArray[Any]) -> None:
+        """Store the first and last master timestamp of each data block of
+        the group using the complete master channel samples.
+        """
+        for info, first, end in self._get_data_blocks_records(self.groups[index]):
+            if end > len(t):
+                break
+            if info.first_timestamp is None or info.last_timestamp is None:
+                info.first_timestamp = float(t[first])
+                info.last_timestamp = float(t[end - 1])
+                self._master_summary_changed = True
+
+    def _get_block_master(self, index: int, info: DataBlockInfo, first: int, end: int) -> NDArray[Any]:
+        """Load the master samples of a single data block and store the block's
+        first and last timestamp.
+        """
+        t = self.get_master(index, record_offset=first, record_count=end - first)
+        if len(t):
+            info.first_timestamp = float(t[0])
+            info.last_timestamp = float(t[-1])
+            self._master_summary_changed = True
         return t
 
+    def get_record_range(
+        self,
+        index: int,
+        start: float | None = None,
+        stop: float | None = None,
+    ) -> tuple[int, int]:
+        """Get the records of the group whose master timestamps are inside the
+        [`start`, `stop`] interval. The master channel must be monotonically
+        increasing.
+
+        The data blocks are binary searched using the first and last master
+        timestamp of each block. The block summaries are computed when the
+        block master samples are loaded for the first time and are kept in the
+        metadata index if the metadata cache is enabled, so that repeated
+        queries load at most the master samples of the two blocks that contain
+        the interval limits.
+
+        .. versionadded:: 8.8.0
+
+        Parameters
+        ----------
+        index : int
+            Group index.
+        start : float, optional
+            Interval start time; default is None and in this case the range
+            starts with the first record.
+        stop : float, optional
+            Interval stop time; default is None and in this case the range
+            ends with the last record.
+
+        Returns
+        -------
+        record_offset, record_count : (int, int)
+            Offset of the first record inside the interval and the number of
+            records inside the interval; these can be used as `record_offset`
+            and `record_count` arguments for the `get` method.
+        """
+        group = self.groups[index]
+        cycles_nr = group.channel_group.cycles_nr
+
+        if start is None and stop is None:
+            return 0, cycles_nr
+
+        if self._master is not None:
+            t = self._master
+            first = 0 if start is None else int(searchsorted(t, start, side="left"))
+            end = len(t) if stop is None else int(searchsorted(t, stop, side="right"))
+            return first, max(end - first, 0)
+
+        master_index = index
+        if group.channel_group.flags & v4c.FLAG_CG_REMOTE_MASTER:
+            master_index = typing.cast(int, group.channel_group.cg_master_index)
+
+        if self.masters_db.get(master_index, None) is None:
+            # the timestamps are the record indexes
+            first = 0 if start is None else min(max(ceil(start), 0), cycles_nr)
+            end = cycles_nr if stop is None else min(max(floor(stop) + 1, 0), cycles_nr)
+            return first, max(end - first, 0)
+
+        blocks = self._get_data_blocks_records(self.groups[master_index])
+        if not blocks:
+            t = self.get_master(master_index)
+            first = 0 if start is None else int(searchsorted(t, start, side="left"))
+            end = len(t) if stop is None else int(searchsorted(t, stop, side="right"))
+            return first, max(end - first, 0)
+
+        masters: dict[int, NDArray[Any]] = {}
+
+        def block_master(block_index: int) -> NDArray[Any]:
+            if block_index not in masters:
+                masters[block_index] = self._get_block_master(master_index, *blocks[block_index])
+            return masters[block_index]
+
+        def block_summary(block_index: int) -> tuple[float, float]:
+            info = blocks[block_index][0]
+            if info.first_timestamp is None or info.last_timestamp is None:
+                block_master(block_index)
+            return typing.cast(float, info.first_timestamp), typing.cast(float, info.last_timestamp)
+
+        def search(timestamp: float, side: Literal["left", "right"]) -> int:
+            # first block whose last timestamp is after the searched timestamp
+            low, high = 0, len(blocks)
+            while low < high:
+                mid = (low + high) // 2
+                last = block_summary(mid)[1]
+                if last < timestamp or (side == "right" and last == timestamp):
+                    low = mid + 1
+                else:
+                    high = mid
+
+            if low == len(blocks):
+                return blocks[-1][2]
+
+            block_first = blocks[low][1]
+            first_timestamp = block_summary(low)[0]
+            if first_timestamp > timestamp or (side == "left" and first_timestamp == timestamp):
+                return block_first
+
+            return block_first + int(searchsorted(block_master(low), timestamp, side=side))
+
+        first = 0 if start is None else search(start, "left")
+        end = cycles_nr if stop is None else search(stop, "right")
+
+        return first, max(end - first, 0)
+
     def get_bus_signal(
         self,
         bus: BusType,
@@ -10597,6 +11414,76 @@ class MDF4(MDF_Common[Group]):
     def start_time(self, timestamp: datetime) -> None:
         self.header.start_time = timestamp
 
+    @staticmethod
+    def _build_data_blocks(
+        builders: Iterable[tuple[_T, Callable[[], DataBlock | DataZippedBlock]]],
+        pool: ThreadPoolExecutor | None = None,
+    ) -> Iterator[tuple[_T, DataBlock | DataZippedBlock]]:
+        """Build the data blocks and yield them in the order of `builders`.
+
+        Each builder creates (and compresses) a single block. If `pool` is
+        given the builders run in the worker threads, with a bounded number of
+        blocks in flight, so that the caller can write the finished blocks
+        while the next ones are compressed.
+        """
+        if pool is None:
+            for tag, builder in builders:
+                yield tag, builder()
+            return
+
+        pending: deque[tuple[_T, Future[DataBlock | DataZippedBlock]]] = deque()
+        max_pending = 2 * pool._max_workers
+
+        try:
+            for tag, builder in builders:
+                pending.append((tag, pool.submit(builder)))
+                if len(pending) >= max_pending:
+                    tag, future = pending.popleft()
+                    yield tag, future.result()
+
+            while pending:
+                tag, future = pending.popleft()
+                yield tag, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def _can_save_incremental(self) -> bool:
+        """Check if the metadata can be appended to the opened file while the
+        data blocks are left in place.
+        """
+        if self._from_filelike or self._delete_on_close or self._file is None or not self.name.is_file():
+            return False
+
+        for group in self.groups:
+            if (
+                group.data_location != v4c.LOCATION_ORIGINAL_FILE
+                or not group.sorted
+                or group.channel_group.flags & v4c.FLAG_CG_VLSD
+            ):
+                return False
+
+        return True
+
+    def _is_attachment_unchanged(self, at_block: AttachmentBlock) -> bool:
+        """Check if the attachment block is stored unchanged in the opened file;
+        the next attachment link is not compared.
+        """
+        if not at_block.address or self._file is None:
+            return False
+
+        try:
+            stored = AttachmentBlock(
+                address=at_block.address,
+                stream=self._file,
+                mapped=isinstance(self._file, mmap.mmap),
+                file_limit=self.file_limit,
+            )
+        except MdfException:
+            return False
+
+        return all(stored[attr] == at_block[attr] for attr in AttachmentBlock.__slots__ if attr != "next_at_addr")
+
     def save(
         self,
         dst: FileLike | StrPath,
@@ -10604,6 +11491,8 @@ class MDF4(MDF_Common[Group]):
         compression: CompressionType = v4c.CompressionAlgorithm.NO_COMPRESSION,
         progress: Any | None = None,
         add_history_block: bool = True,
+        incremental: bool = False,
+        compression_level: CompressionLevelType | None = None,
     ) -> Path:
         """Save `MDF` to `dst`. If `overwrite` is True, then the destination
         file is overwritten, otherwise the file name is appended with '.<cntr>',
@@ -10626,16 +11515,60 @@ class MDF4(MDF_Common[Group]):
 
         add_history_block : bool, default True
             Option to add file history block.
+        incremental : bool, default False
+            When saving to the opened file (`dst` is the file name and
+            `overwrite` is True), append the metadata blocks to the end of
+            the file and relink the header block, instead of rewriting the
+            file. The existing data blocks are left in place (and keep their
+            compression), so saving metadata changes like comments,
+            attachments or events only writes a few KB. If the file cannot be
+            updated in place (new channel groups or unsorted data) the file is
+            rewritten as usual.
+
+            .. versionadded:: 8.8.0
+
+        compression_level : {'fastest', 'balanced', 'smallest'}, optional
+            Compression level policy used when `compression` is enabled; if
+            None, then the `compression_level` option of `MDF.configure` is
+            used.
+
+            * 'fastest' - lowest level of the fastest available backend (isal
+              for deflate)
+            * 'balanced' - medium level, using libdeflate for deflate if the
+              `deflate` package is installed (`compression` extra), otherwise
+              zlib
+            * 'smallest' - highest level, using libdeflate for deflate if the
+              `deflate` package is installed (`compression` extra), otherwise
+              zlib
+
+            With a policy, the blocks that do not compress well (for example
+            float signals with noise) are stored uncompressed, based on a
+            trial compression of the first bytes of the block.
+
+            .. versionadded:: 8.8.0
 
         Returns
         -------
         output_file : pathlib.Path
             Path to saved file.
+
+        Notes
+        -----
+        When saving with compression, the data blocks are compressed in a
+        thread pool (see the `compression_thread_count` option of
+        `MDF.configure`); the blocks are written in the original order so the
+        output does not depend on the number of threads.
         """
 
+        if compression_level is None:
+            compression_level = self._compression_level
+        if compression_level not in (None, "fastest", "balanced", "smallest"):
+            raise MdfException(f'Unknown compression level "{compression_level}"')
+
         if is_file_like(dst):
             dst_ = dst
             file_like = True
+            incremental = False
             if hasattr(dst, "name"):
                 dst = Path(dst.name)
             else:
@@ -10666,12 +11599,24 @@ class MDF4(MDF_Common[Group]):
                     logger.warning(message)
                     dst = name
 
-            if dst == self.name:
-                destination = dst.with_suffix(".savetemp")
-            else:
+            if dst == self.name and incremental and suffix == ".mf4" and self._can_save_incremental():
                 destination = dst
+                dst_ = open(destination, "r+b")
+
+                # the new blocks are appended after the existing ones
+                dst_.seek(0, 2)
+                align = dst_.tell() % 8
+                if align:
+                    dst_.write(b"\0" * (8 - align))
+
+            else:
+                incremental = False
+                if dst == self.name:
+                    destination = dst.with_suffix(".savetemp")
+                else:
+                    destination = dst
 
-            dst_ = open(destination, "wb+")
+                dst_ = open(destination, "wb+")
 
         if not self.file_history:
             comment = "created"
@@ -10691,6 +11636,14 @@ class MDF4(MDF_Common[Group]):
 
         cg_map = {}
 
+        compression_thread_count = self._compression_thread_count or THREAD_COUNT
+        if compression and not incremental and compression_thread_count > 1:
+            compression_pool: ThreadPoolExecutor | None = ThreadPoolExecutor(
+                max_workers=compression_thread_count, thread_name_prefix="asammdf_compression"
+            )
+        else:
+            compression_pool = None
+
         try:
             defined_texts: dict[bytes | str, int] = {"": 0, b"": 0}
             cc_map: dict[bytes | int, int] = {}
@@ -10704,9 +11657,15 @@ class MDF4(MDF_Common[Group]):
 
             blocks: list[bytes | SupportsBytes] = []
 
-            write(bytes(self.identification))
+            if incremental:
+                # the header block stays in place and is relinked at the end
+                tx_block = TextBlock(text=self.header.comment, meta=True)
+                tx_block.address = self.header.comment_addr = tell()
+                blocks.append(tx_block)
+            else:
+                write(bytes(self.identification))
 
-            self.header.to_blocks(dst_.tell(), blocks)
+                self.header.to_blocks(dst_.tell(), blocks)
             for block in blocks:
                 write(bytes(block))
 
@@ -10738,7 +11697,8 @@ class MDF4(MDF_Common[Group]):
             for gp_nr, gp in enumerate(self.groups):
                 original_data_addresses.append(gp.data_group.data_block_addr)
 
-                if gp.channel_group.flags & v4c.FLAG_CG_VLSD:
+                # the incremental save keeps the existing data blocks
+                if incremental or gp.channel_group.flags & v4c.FLAG_CG_VLSD:
                     continue
 
                 address = tell()
@@ -10765,6 +11725,18 @@ class MDF4(MDF_Common[Group]):
                         chunks = 1
 
                     data = self._load_data(gp)
+                    if compression_pool is not None:
+                        # the fragments can share the loading buffer, which is
+                        # overwritten while the previous blocks are compressed
+                        data = (
+                            Fragment(
+                                bytes(fragment.data),
+                                fragment.record_offset,
+                                fragment.record_count,
+                                None if fragment.invalidation_data is None else bytes(fragment.invalidation_data),
+                            )
+                            for fragment in data
+                        )
 
                     if chunks == 1:
                         fragment = next(data)
@@ -10786,8 +11758,9 @@ class MDF4(MDF_Common[Group]):
                                     "zip_type": current_zip_type,
                                     "param": param,
                                     "original_type": b"DV",
+                                    "compression_level": compression_level,
                                 }
-                                data_block: DataZippedBlock | DataBlock = DataZippedBlock(**dz_kwargs)
+                                data_block: DataZippedBlock | DataBlock = compress_data_block(**dz_kwargs)
                             else:
                                 data_block = DataBlock(data=data_, type="DV")
                             write(bytes(data_block))
@@ -10809,8 +11782,9 @@ class MDF4(MDF_Common[Group]):
                                         "zip_type": zip_type,
                                         "param": param,
                                         "original_type": b"DI",
+                                        "compression_level": compression_level,
                                     }
-                                    inval_block: DataZippedBlock | DataBlock = DataZippedBlock(**dz_kwargs)
+                                    inval_block: DataZippedBlock | DataBlock = compress_data_block(**dz_kwargs)
                                 else:
                                     inval_block = DataBlock(data=inval_, type="DI")
                                 write(bytes(inval_block))
@@ -10852,8 +11826,9 @@ class MDF4(MDF_Common[Group]):
                                     "data": data_,
                                     "zip_type": zip_type,
                                     "param": param,
+                                    "compression_level": compression_level,
                                 }
-                                data_block = DataZippedBlock(**dz_kwargs)
+                                data_block = compress_data_block(**dz_kwargs)
                             else:
                                 data_block = DataBlock(data=data_)
                             write(bytes(data_block))
@@ -10871,52 +11846,65 @@ class MDF4(MDF_Common[Group]):
                             dv_addr = []
                             di_addr = []
                             block_size = 0
-                            for i, fragment in enumerate(data):
-                                data_, inval_ = fragment.data, fragment.invalidation_data
-                                if i == 0:
-                                    block_size = len(data_)
-                                if compression:
-                                    if compression == 1:
-                                        param = 0
-                                    else:
-                                        param = gp.channel_group.samples_byte_nr
-                                    dz_kwargs = {
-                                        "data": data_,
-                                        "zip_type": zip_type,
-                                        "param": param,
-                                        "original_type": b"DV",
-                                    }
-                                    data_block = DataZippedBlock(**dz_kwargs)
-                                else:
-                                    data_block = DataBlock(data=data_, type="DV")
-                                dv_addr.append(tell())
-                                write(bytes(data_block))
-
-                                align = data_block.block_len % 8
-                                if align:
-                                    write(b"\0" * (8 - align))
 
-                                if inval_ is not None:
+                            def ld_builders(
+                                data: Iterator[Fragment], gp: Group = gp, zip_type: int = zip_type
+                            ) -> Iterator[tuple[tuple[bytes, int], Callable[[], DataBlock | DataZippedBlock]]]:
+                                for fragment in data:
+                                    data_, inval_ = fragment.data, fragment.invalidation_data
                                     if compression:
                                         if compression == 1:
                                             param = 0
                                         else:
-                                            param = gp.channel_group.invalidation_bytes_nr
-                                        dz_kwargs = {
-                                            "data": inval_,
-                                            "zip_type": zip_type,
-                                            "param": param,
-                                            "original_type": b"DI",
-                                        }
-                                        inval_block = DataZippedBlock(**dz_kwargs)
+                                            param = gp.channel_group.samples_byte_nr
+                                        yield (
+                                            (b"DV", len(data_)),
+                                            partial(
+                                                compress_data_block,
+                                                data=data_,
+                                                zip_type=zip_type,
+                                                param=param,
+                                                original_type=b"DV",
+                                                compression_level=compression_level,
+                                            ),
+                                        )
                                     else:
-                                        inval_block = DataBlock(data=inval_, type="DI")
+                                        yield (b"DV", len(data_)), partial(DataBlock, data=data_, type="DV")
+
+                                    if inval_ is not None:
+                                        if compression:
+                                            if compression == 1:
+                                                param = 0
+                                            else:
+                                                param = gp.channel_group.invalidation_bytes_nr
+                                            yield (
+                                                (b"DI", len(inval_)),
+                                                partial(
+                                                    compress_data_block,
+                                                    data=inval_,
+                                                    zip_type=zip_type,
+                                                    param=param,
+                                                    original_type=b"DI",
+                                                    compression_level=compression_level,
+                                                ),
+                                            )
+                                        else:
+                                            yield (b"DI", len(inval_)), partial(DataBlock, data=inval_, type="DI")
+
+                            for (block_type, size), data_block in self._build_data_blocks(
+                                ld_builders(data), compression_pool
+                            ):
+                                if block_type == b"DV":
+                                    if not dv_addr:
+                                        block_size = size
+                                    dv_addr.append(tell())
+                                else:
                                     di_addr.append(tell())
-                                    write(bytes(inval_block))
+                                write(bytes(data_block))
 
-                                    align = inval_block.block_len % 8
-                                    if align:
-                                        write(b"\0" * (8 - align))
+                                align = data_block.block_len % 8
+                                if align:
+                                    write(b"\0" * (8 - align))
 
                             address = tell()
 
@@ -10960,28 +11948,32 @@ class MDF4(MDF_Common[Group]):
                             }
                             dl_block = DataList(**dl_kwargs)
 
-                            for i, fragment in enumerate(data):
-                                data_ = fragment.data
-
-                                if compression and self.version >= "4.10":
-                                    if compression == 1:
-                                        zip_type = v4c.FLAG_DZ_DEFLATE
-                                    else:
-                                        zip_type = v4c.FLAG_DZ_TRANSPOSED_DEFLATE
-                                    if compression == 1:
-                                        param = 0
-                                    else:
-                                        param = (
-                                            gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
-                                        )
-                                    dz_kwargs = {
-                                        "data": data_,
-                                        "zip_type": zip_type,
-                                        "param": param,
-                                    }
-                                    block = DataZippedBlock(**dz_kwargs)
+                            if compression and self.version >= "4.10":
+                                if compression == 1:
+                                    zip_type = v4c.FLAG_DZ_DEFLATE
+                                    param = 0
                                 else:
-                                    block = DataBlock(data=data_)
+                                    zip_type = v4c.FLAG_DZ_TRANSPOSED_DEFLATE
+                                    param = gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
+                                block_builders: Iterator[tuple[int, Callable[[], DataBlock | DataZippedBlock]]] = (
+                                    (
+                                        i,
+                                        partial(
+                                            compress_data_block,
+                                            data=fragment.data,
+                                            zip_type=zip_type,
+                                            param=param,
+                                            compression_level=compression_level,
+                                        ),
+                                    )
+                                    for i, fragment in enumerate(data)
+                                )
+                            else:
+                                block_builders = (
+                                    (i, partial(DataBlock, data=fragment.data)) for i, fragment in enumerate(data)
+                                )
+
+                            for i, block in self._build_data_blocks(block_builders, compression_pool):
                                 address = tell()
                                 block.address = address
 
@@ -11060,6 +12052,9 @@ class MDF4(MDF_Common[Group]):
                     if channel.channel_type == v4c.CHANNEL_TYPE_SYNC:
                         if channel.attachment is not None:
                             channel.data_block_addr = self.attachments[channel.attachment].address
+                    elif incremental:
+                        # the signal data blocks are left in place
+                        pass
                     else:
                         sdata = self._load_signal_data(group=gp, index=j)
                         if sdata:
@@ -11072,10 +12067,11 @@ class MDF4(MDF_Common[Group]):
 
                             if chunks == 1:
                                 if compression and self.version > "4.00":
-                                    signal_data: DataZippedBlock | DataBlock = DataZippedBlock(
+                                    signal_data: DataZippedBlock | DataBlock = compress_data_block(
                                         data=sdata,
                                         zip_type=v4c.FLAG_DZ_DEFLATE,
                                         original_type=b"SD",
+                                        compression_level=compression_level,
                                     )
                                     signal_data.address = address
                                     address += signal_data.block_len
@@ -11104,21 +12100,33 @@ class MDF4(MDF_Common[Group]):
                                 }
                                 dl_block = DataList(**dl_kwargs)
 
-                                for k in range(chunks):
-                                    data_ = sdata[k * split_size : (k + 1) * split_size]
-                                    if compression and self.version > "4.00":
-                                        zip_type = v4c.FLAG_DZ_DEFLATE
-                                        param = 0
+                                if compression and self.version > "4.00":
+                                    sd_builders: Iterator[tuple[int, Callable[[], DataBlock | DataZippedBlock]]] = (
+                                        (
+                                            k,
+                                            partial(
+                                                compress_data_block,
+                                                data=sdata[k * split_size : (k + 1) * split_size],
+                                                zip_type=v4c.FLAG_DZ_DEFLATE,
+                                                param=0,
+                                                original_type=b"SD",
+                                                compression_level=compression_level,
+                                            ),
+                                        )
+                                        for k in range(chunks)
+                                    )
+                                else:
+                                    sd_builders = (
+                                        (
+                                            k,
+                                            partial(
+                                                DataBlock, data=sdata[k * split_size : (k + 1) * split_size], type="SD"
+                                            ),
+                                        )
+                                        for k in range(chunks)
+                                    )
 
-                                        dz_kwargs = {
-                                            "data": data_,
-                                            "zip_type": zip_type,
-                                            "param": param,
-                                            "original_type": b"SD",
-                                        }
-                                        block = DataZippedBlock(**dz_kwargs)
-                                    else:
-                                        block = DataBlock(data=data_, type="SD")
+                                for k, block in self._build_data_blocks(sd_builders, compression_pool):
                                     blocks.append(block)
                                     block.address = address
                                     address += block.block_len
@@ -11273,7 +12281,8 @@ class MDF4(MDF_Common[Group]):
             position = tell()
 
             for gp in self.groups:
-                gp.data_group.record_id_len = 0
+                if not incremental:
+                    gp.data_group.record_id_len = 0
 
                 cg_master_index = gp.channel_group.cg_master_index
                 if cg_master_index is not None:
@@ -11337,9 +12346,15 @@ class MDF4(MDF_Common[Group]):
 
             # attachments
             at_map: dict[int, int] = {}
+            # the incremental save keeps the unchanged attachments in place
+            kept_attachments = [
+                at_block for at_block in self.attachments if incremental and self._is_attachment_unchanged(at_block)
+            ]
             if self.attachments:
                 # put the attachment texts before the attachments
                 for at_block in self.attachments:
+                    if at_block in kept_attachments:
+                        continue
                     for text in (at_block.file_name, at_block.mime, at_block.comment):
                         if text not in defined_texts:
                             tx_block = TextBlock(text=str(text))
@@ -11349,7 +12364,8 @@ class MDF4(MDF_Common[Group]):
                             blocks.append(tx_block)
 
                 for at_block in self.attachments:
-                    address = at_block.to_blocks(address, blocks, defined_texts)
+                    if at_block not in kept_attachments:
+                        address = at_block.to_blocks(address, blocks, defined_texts)
 
                 for i in range(len(self.attachments) - 1):
                     at_block = self.attachments[i]
@@ -11388,6 +12404,12 @@ class MDF4(MDF_Common[Group]):
                 for block in blocks:
                     write(bytes(block))
 
+            # only the next attachment link of the attachments kept in place
+            # is updated
+            for at_block in kept_attachments:
+                seek(at_block.address + COMMON_SIZE)
+                write(UINT64_p(at_block.next_at_addr))
+
             for gp, rec_id in zip(self.groups, gp_rec_ids, strict=False):
                 gp.data_group.record_id_len = rec_id
 
@@ -11425,6 +12447,9 @@ class MDF4(MDF_Common[Group]):
         else:
             if not file_like:
                 dst_.close()
+        finally:
+            if compression_pool is not None:
+                compression_pool.shutdown(wait=True, cancel_futures=True)
 
         if suffix in (".zip", ".mf4z"):
             output_fname = dst.with_suffix(suffix)
@@ -11443,12 +12468,15 @@ class MDF4(MDF_Common[Group]):
 
         if dst == self.name:
             self.close()
-            try:
-                Path.unlink(self.name)
-                Path.rename(destination, self.name)
-            except:
-                pass
+            if not incremental:
+                try:
+                    Path.unlink(self.name)
+                    Path.rename(destination, self.name)
+                except:
+                    pass
 
+            # the object is opened again, so the next save can close it
+            self._closed = False
             self._tempfile = NamedTemporaryFile(dir=self.temporary_folder)
             self._file = open(self.name, "rb")
             self._read(self._file)
@@ -4,7 +4,7 @@ from typing import Final, Literal
 
 from typing_extensions import Any, TypedDict
 
-from .types import StrPath
+from .types import CompressionLevelType, StrPath
 
 
 class IntegerInterpolation(IntEnum):
@@ -21,6 +21,15 @@ class FloatInterpolation(IntEnum):
 class _GlobalOptions(TypedDict):
     read_fragment_size: int
     write_fragment_size: int
+    decompression_thread_count: int
+    compression_thread_count: int
+    extraction_thread_count: int
+    group_thread_count: int
+    prefetch_depth: int
+    compression_level: CompressionLevelType | None
+    append_buffer_size: int
+    append_buffer_samples: int
+    append_buffer_interval: float
     use_display_names: bool
     single_bit_uint_as_bool: bool
     integer_interpolation: IntegerInterpolation
@@ -31,11 +40,23 @@ class _GlobalOptions(TypedDict):
     fill_0_for_missing_computation_channels: bool
     ignore_invalidation_bits: bool
     check_unsaved_display_file: bool
+    use_metadata_cache: bool
+    lazy_channel_metadata: bool
+    metadata_cache_folder: StrPath | None
 
 
 GLOBAL_OPTIONS: Final[_GlobalOptions] = {
     "read_fragment_size": 256 * 1024 * 1024,
     "write_fragment_size": 4 * 1024 * 1024,
+    "decompression_thread_count": 0,
+    "compression_thread_count": 0,
+    "extraction_thread_count": 0,
+    "group_thread_count": 0,
+    "prefetch_depth": 4,
+    "compression_level": None,
+    "append_buffer_size": 4 * 1024 * 1024,
+    "append_buffer_samples": 0,
+    "append_buffer_interval": 0.0,
     "use_display_names": True,
     "single_bit_uint_as_bool": False,
     "integer_interpolation": IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE,
@@ -46,11 +67,23 @@ GLOBAL_OPTIONS: Final[_GlobalOptions] = {
     "fill_0_for_missing_computation_channels": False,
     "ignore_invalidation_bits": False,
     "check_unsaved_display_file": False,
+    "use_metadata_cache": False,
+    "lazy_channel_metadata": False,
+    "metadata_cache_folder": None,
 }
 
 _Opt = Literal[
     "read_fragment_size",
     "write_fragment_size",
+    "decompression_thread_count",
+    "compression_thread_count",
+    "extraction_thread_count",
+    "group_thread_count",
+    "prefetch_depth",
+    "compression_level",
+    "append_buffer_size",
+    "append_buffer_samples",
+    "append_buffer_interval",
     "use_display_names",
     "single_bit_uint_as_bool",
     "integer_interpolation",
@@ -61,6 +94,9 @@ _Opt = Literal[
     "fill_0_for_missing_computation_channels",
     "ignore_invalidation_bits",
     "check_unsaved_display_file",
+    "use_metadata_cache",
+    "metadata_cache_folder",
+    "lazy_channel_metadata",
 ]
 
 
@@ -72,6 +108,22 @@ def set_global_option(opt: _Opt, value: Any) -> None:
         GLOBAL_OPTIONS[opt] = int(value)
     elif opt == "write_fragment_size":
         GLOBAL_OPTIONS[opt] = min(int(value), 4 * 1024 * 1024)
+    elif opt in (
+        "decompression_thread_count",
+        "compression_thread_count",
+        "extraction_thread_count",
+        "group_thread_count",
+        "prefetch_depth",
+        "append_buffer_size",
+        "append_buffer_samples",
+    ):
+        GLOBAL_OPTIONS[opt] = max(int(value), 0)
+    elif opt == "append_buffer_interval":
+        GLOBAL_OPTIONS[opt] = max(float(value), 0.0)
+    elif opt == "compression_level":
+        if value not in (None, "fastest", "balanced", "smallest"):
+            raise ValueError(f'Unknown compression level "{value}"')
+        GLOBAL_OPTIONS[opt] = value
     elif opt in (
         "use_display_names",
         "single_bit_uint_as_bool",
@@ -80,13 +132,15 @@ def set_global_option(opt: _Opt, value: Any) -> None:
         "fill_0_for_missing_computation_channels",
         "ignore_invalidation_bits",
         "check_unsaved_display_file",
+        "use_metadata_cache",
+        "lazy_channel_metadata",
     ):
         GLOBAL_OPTIONS[opt] = bool(value)
     elif opt == "integer_interpolation":
         GLOBAL_OPTIONS[opt] = IntegerInterpolation(value)
     elif opt == "float_interpolation":
         GLOBAL_OPTIONS[opt] = FloatInterpolation(value)
-    elif opt == "temporary_folder":
+    elif opt in ("temporary_folder", "metadata_cache_folder"):
         value = value or None
         if value is not None:
             os.makedirs(value, exist_ok=True)
@@ -21,6 +21,7 @@ BusType = Literal["CAN", "LIN"]
 ChannelConversionType = Union["v3b.ChannelConversion", "v4b.ChannelConversion"]
 ChannelsType = Sequence[str | tuple[str | None, int, int] | tuple[str, int]]
 CompressionType = Union[Literal[0, 1, 2, 3, 4, 5], "v4c.CompressionAlgorithm"]
+CompressionLevelType = Literal["fastest", "balanced", "smallest"]
 DbcFileType = tuple[StrPath | CanMatrix, int]
 EmptyChannelsType = Literal["skip", "zeros"]
 FloatInterpolationModeType = Literal[0, 1]
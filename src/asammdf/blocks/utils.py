@@ -43,6 +43,7 @@ from typing_extensions import (
 from . import v2_v3_constants as v3c
 from . import v4_constants as v4c
 from .blocks_common import UnpackFrom
+from .cutils import scan_block_headers
 from .options import GLOBAL_OPTIONS
 from .types import StrPath
 
@@ -82,6 +83,7 @@ UINT8_u: Callable[[Buffer], tuple[int]] = Struct("<B").unpack
 UINT16_u: Callable[[Buffer], tuple[int]] = Struct("<H").unpack
 UINT32_p = Struct("<I").pack
 UINT32_u: Callable[[Buffer], tuple[int]] = Struct("<I").unpack
+UINT64_p = Struct("<Q").pack
 UINT64_u: Callable[[Buffer], tuple[int]] = Struct("<Q").unpack
 UINT8_uf: UnpackFrom[tuple[int]] = Struct("<B").unpack_from
 UINT16_uf: UnpackFrom[tuple[int]] = Struct("<H").unpack_from
@@ -1480,8 +1482,8 @@ class DataBlockInfo:
         param: int | None,
         invalidation_block: Optional["InvalidationBlockInfo"] = None,
         block_limit: int | None = None,
-        first_timestamp: bytes | None = None,
-        last_timestamp: bytes | None = None,
+        first_timestamp: float | None = None,
+        last_timestamp: float | None = None,
     ) -> None:
         self.address = address
         self.block_type = block_type
@@ -1531,6 +1533,27 @@ class Fragment:
         )
 
 
+class AppendBuffer:
+    """Records of a channel group collected by consecutive `extend` calls
+    that are not yet written as data blocks.
+    """
+
+    __slots__ = ("cycles_nr", "data", "invalidation_data", "start_time")
+
+    def __init__(self, start_time: float) -> None:
+        self.data = bytearray()
+        self.invalidation_data: bytearray | None = None
+        self.cycles_nr = 0
+        self.start_time = start_time
+
+    def __repr__(self) -> str:
+        return (
+            f"AppendBuffer({len(self.data)} bytes, "
+            f"cycles_nr={self.cycles_nr}, "
+            f"invalidation_data={None if self.invalidation_data is None else len(self.invalidation_data)})"
+        )
+
+
 class InvalidationBlockInfo(DataBlockInfo):
     __slots__ = ("all_valid",)
 
@@ -1781,13 +1804,23 @@ def load_can_database(
 
 
 def all_blocks_addresses(obj: FileLike | mmap.mmap) -> tuple[dict[int, bytes], dict[bytes, list[int]], list[int]]:
-    DG = "DG\x00\x00\x00\x00\x40\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00"
-    others = "(D[VTZIL]|AT|C[AGHNC]|EV|FH|HL|LD|MD|R[DVI]|S[IRD]|TX|GD)\x00\x00\x00\x00"
-    pattern = re.compile(
-        f"(?P<block>##({DG}|{others}))".encode("ascii"),
-        re.DOTALL | re.MULTILINE,
-    )
+    """Find the MDF v4 block headers by scanning the whole file.
 
+    The scanning is done in a single pass by the compiled `scan_block_headers`
+    function, which checks the 8 bytes aligned addresses for a known block id
+    followed by the zero reserved bytes.
+
+    Parameters
+    ----------
+    obj : file-like | mmap.mmap
+        MDF v4 file handle.
+
+    Returns
+    -------
+    blocks, block_groups, addresses : (dict, dict, list)
+        Block id for each block address, block addresses for each block id and
+        all the block addresses in increasing order.
+    """
     try:
         obj.seek(0)
     except:
@@ -1795,26 +1828,18 @@ def all_blocks_addresses(obj: FileLike | mmap.mmap) -> tuple[dict[int, bytes], d
 
     source: Buffer | bytes
     if isinstance(obj, Buffer):
-        re.search(pattern, obj)
         source = obj
     else:
         source = obj.read()
 
-    addresses: list[int] = []
-    block_groups: dict[bytes, list[int]] = {}
-    blocks: dict[int, bytes] = {}
-
-    for match in re.finditer(pattern, source):
-        btype: bytes = match.group("block")[:4]
-        start = match.start()
+    found_addresses, ids, _, _ = scan_block_headers(source)
 
-        if start % 8:
-            continue
+    addresses: list[int] = found_addresses.tolist()
+    blocks: dict[int, bytes] = dict(zip(addresses, ids.tolist(), strict=True))
+    block_groups: dict[bytes, list[int]] = {}
 
-        btype_addresses = block_groups.setdefault(btype, [])
-        btype_addresses.append(start)
-        addresses.append(start)
-        blocks[start] = btype
+    for address, btype in blocks.items():
+        block_groups.setdefault(btype, []).append(address)
 
     return blocks, block_groups, addresses
 
@@ -2,9 +2,11 @@
 
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from hashlib import md5
 import inspect
 import logging
+import mmap
 from pathlib import Path
 import re
 from struct import pack, unpack, unpack_from
@@ -27,13 +29,14 @@ from typing_extensions import Any, Buffer, overload, SupportsBytes, TypedDict, U
 from .. import tool
 from . import v4_constants as v4c
 from .cutils import bytes_dtype_size
-from .types import StrPath
+from .types import CompressionLevelType, StrPath
 from .utils import (
     block_fields,
     BlockKwargs,
     escape_xml_string,
     extract_display_names,
     extract_ev_tool,
+    FileLike,
     FLOAT64_u,
     get_text_v4,
     handle_incomplete_block,
@@ -54,6 +57,7 @@ try:
     from isal.isal_zlib import compress, decompress
 
     COMPRESSION_LEVEL = 2
+    ISAL_AVAILABLE = True
 
 except ImportError:
     from zlib import (  # type: ignore[assignment, no-redef, unused-ignore]
@@ -62,6 +66,17 @@ except ImportError:
     )
 
     COMPRESSION_LEVEL = 1
+    ISAL_AVAILABLE = False
+
+from zlib import compress as zlib_compress
+
+try:
+    from deflate import zlib_compress as libdeflate_compress
+
+    LIBDEFLATE_AVAILABLE = True
+
+except ImportError:
+    LIBDEFLATE_AVAILABLE = False
 
 try:
     from sympy import lambdify, symbols
@@ -72,6 +87,15 @@ except:
 if TYPE_CHECKING:
     from .source_utils import Source
 
+# size of the data compressed to check if a block is worth compressing
+COMPRESSION_TRIAL_SIZE: Final = 64 * 1024
+# the blocks are stored uncompressed above this compressed to original size ratio
+COMPRESSION_SKIP_RATIO: Final[dict[str, float]] = {
+    "fastest": 0.8,
+    "balanced": 0.9,
+    "smallest": 1.0,
+}
+
 SEEK_START: Final = v4c.SEEK_START
 SEEK_END: Final = v4c.SEEK_END
 COMMON_SIZE: Final = v4c.COMMON_SIZE
@@ -427,9 +451,182 @@ class ChannelKwargs(BlockKwargs, total=False):
     upper_ext_limit: float
     attachment_addr: int
     file_limit: int | float
+    units_map: dict[int, str]
+    metadata_source: "LazyChannelMetadata | None"
 
 
 CN = b"##CN"
+ZERO_LIMITS: Final = (0.0,) * 6
+ZERO_LIMITS_BYTES: Final = bytes(48)
+
+
+def _is_md_block(address: int, stream: FileLike | mmap.mmap, mapped: bool, file_limit: int | float) -> bool:
+    """Check if the block found at `address` is a MDBLOCK."""
+    if not address or address + 4 > file_limit:
+        return False
+
+    if mapped:
+        return stream[address : address + 4] == b"##MD"
+    else:
+        stream.seek(address)
+        return stream.read(4) == b"##MD"
+
+
+def _read_conversion(
+    address: int,
+    stream: FileLike | mmap.mmap,
+    mapped: bool,
+    file_limit: int | float,
+    cc_map: dict[bytes | int, "ChannelConversion"],
+) -> "ChannelConversion | None":
+    """Read the channel conversion found at `address`; the identical
+    conversions are shared using `cc_map`. Parsing errors are logged and None
+    is returned.
+    """
+    if not address:
+        return None
+
+    try:
+        if address in cc_map:
+            conv = cc_map[address]
+        else:
+            if address + 16 > file_limit:
+                handle_incomplete_block(address)
+                raise MdfException(f"Incomplete block at {address:x}")
+
+            if mapped:
+                (size,) = UINT64_uf(stream, address + 8)
+            else:
+                stream.seek(address + 8)
+                (size,) = UINT64_u(stream.read(8))
+
+            if address + size > file_limit:
+                handle_incomplete_block(address)
+                raise MdfException(f"Incomplete block at {address:x}")
+
+            if mapped:
+                raw_bytes = stream[address : address + size]
+            else:
+                stream.seek(address)
+                raw_bytes = stream.read(size)
+
+            if raw_bytes in cc_map:
+                conv = cc_map[raw_bytes]
+            else:
+                conv = ChannelConversion(
+                    raw_bytes=raw_bytes,
+                    stream=stream,
+                    address=address,
+                    mapped=mapped,
+                    file_limit=file_limit,
+                )
+                cc_map[raw_bytes] = cc_map[address] = conv
+    except:
+        logger.warning(
+            f"Channel conversion parsing error: {format_exc()}. The error is ignored and the channel conversion is None"
+        )
+        conv = None
+
+    return conv
+
+
+def _read_source(
+    address: int,
+    stream: FileLike | mmap.mmap,
+    mapped: bool,
+    file_limit: int | float,
+    si_map: dict[Union[bytes, int, "Source"], "SourceInformation"],
+) -> "SourceInformation | None":
+    """Read the source information found at `address`; the identical sources
+    are shared using `si_map`. Parsing errors are logged and None is returned.
+    """
+    if not address:
+        return None
+
+    try:
+        if address in si_map:
+            source = si_map[address]
+        else:
+            if address + v4c.SI_BLOCK_SIZE > file_limit:
+                handle_incomplete_block(address)
+                raise MdfException(f"Incomplete block at {address:x}")
+
+            if mapped:
+                raw_bytes = stream[address : address + v4c.SI_BLOCK_SIZE]
+            else:
+                stream.seek(address)
+                raw_bytes = stream.read(v4c.SI_BLOCK_SIZE)
+
+            if raw_bytes in si_map:
+                source = si_map[raw_bytes]
+            else:
+                source = SourceInformation(
+                    raw_bytes=raw_bytes,
+                    stream=stream,
+                    address=address,
+                    mapped=mapped,
+                    file_limit=file_limit,
+                )
+                si_map[raw_bytes] = si_map[address] = source
+    except:
+        logger.warning(
+            f"Channel source parsing error: {format_exc()}. The error is ignored and the channel source is None"
+        )
+        source = None
+
+    return source
+
+
+class LazyChannelMetadata:
+    """Loads the deferred metadata (comment, unit and conversion) of the
+    channels created with the `metadata_source` argument, on the first access
+    to one of these attributes.
+
+    The file handle is not pickled, so `stream` must be set again when the
+    channels are restored from the metadata index; the loading fails after the
+    file is closed.
+    """
+
+    __slots__ = ("cc_map", "file_limit", "mapped", "stream", "units_map")
+
+    def __init__(self, stream: FileLike | mmap.mmap | None, mapped: bool, file_limit: int | float) -> None:
+        self.stream = stream
+        self.mapped = mapped
+        self.file_limit = file_limit
+        self.cc_map: dict[bytes | int, ChannelConversion] = {}
+        self.units_map: dict[int, str] = {}
+
+    def __getstate__(self) -> tuple[bool, int | float]:
+        return self.mapped, self.file_limit
+
+    def __setstate__(self, state: tuple[bool, int | float]) -> None:
+        self.__init__(None, *state)  # type: ignore[misc]
+
+    def __copy__(self) -> "LazyChannelMetadata":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "LazyChannelMetadata":
+        return self
+
+    def load(self, channel: "Channel") -> None:
+        stream = self.stream
+        if stream is None:
+            raise MdfException(f'Cannot load the metadata of channel "{channel.name}" after the file was closed')
+
+        if channel._comment is None:
+            channel._comment = get_text_v4(channel.comment_addr, stream, mapped=self.mapped, file_limit=self.file_limit)
+
+        unit_addr = channel.unit_addr
+        if unit_addr in self.units_map:
+            channel._unit = self.units_map[unit_addr]
+        else:
+            channel._unit = self.units_map[unit_addr] = get_text_v4(
+                unit_addr, stream, mapped=self.mapped, file_limit=self.file_limit
+            )
+
+        channel._conversion = _read_conversion(
+            channel.conversion_addr, stream, self.mapped, self.file_limit, self.cc_map
+        )
 
 
 class Channel:
@@ -503,6 +700,9 @@ class Channel:
       channel has no source information
     * ``unit`` - str : channel unit
 
+    The comment, unit and conversion of the channels created with the
+    `metadata_source` argument are loaded on the first access.
+
     Parameters
     ----------
     address : int
@@ -519,6 +719,10 @@ class Channel:
     """
 
     __slots__ = (
+        "_comment",
+        "_conversion",
+        "_metadata_source",
+        "_unit",
         "address",
         "attachment",
         "attachment_addr",
@@ -528,10 +732,8 @@ class Channel:
         "block_len",
         "byte_offset",
         "channel_type",
-        "comment",
         "comment_addr",
         "component_addr",
-        "conversion",
         "conversion_addr",
         "data_block_addr",
         "data_type",
@@ -559,13 +761,13 @@ class Channel:
         "source_addr",
         "standard_C_size",
         "sync_type",
-        "unit",
         "unit_addr",
         "upper_ext_limit",
         "upper_limit",
     )
 
     def __init__(self, **kwargs: Unpack[ChannelKwargs]) -> None:
+        self._metadata_source: LazyChannelMetadata | None = None
         self.dtype_fmt: np.dtype[Any] = np.dtype(np.void)
 
         if "stream" in kwargs:
@@ -731,104 +933,6 @@ class Channel:
                         self.upper_ext_limit,
                     ) = params
 
-                parsed_strings = kwargs["parsed_strings"]
-                if parsed_strings is None:
-                    self.name = get_text_v4(self.name_addr, stream, mapped=mapped, file_limit=file_limit)
-                    self.comment = get_text_v4(
-                        self.comment_addr, stream, mapped=mapped, file_limit=file_limit
-                    )
-
-                    if kwargs["use_display_names"]:
-                        self.display_names = extract_display_names(self.comment)
-                    else:
-                        self.display_names = {}
-                else:
-                    self.name, self.display_names, self.comment = parsed_strings
-
-                cache = kwargs.get("units_map", {})
-                if self.unit_addr in cache:
-                    self.unit = cache[self.unit_addr]
-                else:
-                    self.unit = get_text_v4(self.unit_addr, stream, mapped=mapped, file_limit=file_limit)
-                    cache[self.unit_addr] = self.unit
-
-                address = self.conversion_addr
-                if address:
-                    cc_map = kwargs["cc_map"]
-                    try:
-                        if address in cc_map:
-                            conv = cc_map[address]
-                        else:
-                            if address + 16 > file_limit:
-                                handle_incomplete_block(address)
-                                raise MdfException(f"Incomplete block at {address:x}")
-
-                            (size,) = UINT64_uf(stream, address + 8)
-
-                            if address + size > file_limit:
-                                handle_incomplete_block(address)
-                                raise MdfException(f"Incomplete block at {address:x}")
-
-                            raw_bytes = stream[address : address + size]
-
-                            if raw_bytes in cc_map:
-                                conv = cc_map[raw_bytes]
-                            else:
-                                conv = ChannelConversion(
-                                    raw_bytes=raw_bytes,
-                                    stream=stream,
-                                    address=address,
-                                    mapped=mapped,
-                                   
-                                    file_limit=file_limit,
-                                )
-                                cc_map[raw_bytes] = cc_map[address] = conv
-                    except:
-                        logger.warning(
-                            f"Channel conversion parsing error: {format_exc()}. The error is ignored and the channel conversion is None"
-                        )
-                        conv = None
-
-                    self.conversion = conv
-                else:
-                    self.conversion = None
-
-                address = self.source_addr
-                if address:
-                    si_map = kwargs["si_map"]
-
-                    try:
-                        if address in si_map:
-                            source = si_map[address]
-                        else:
-                            if address + v4c.SI_BLOCK_SIZE > file_limit:
-                                handle_incomplete_block(address)
-                                raise MdfException(f"Incomplete block at {address:x}")
-
-                            raw_bytes = stream[address : address + v4c.SI_BLOCK_SIZE]
-
-                            if raw_bytes in si_map:
-                                source = si_map[raw_bytes]
-                            else:
-                                source = SourceInformation(
-                                    raw_bytes=raw_bytes,
-                                    stream=stream,
-                                    address=address,
-                                    mapped=mapped,
-                                   
-                                    file_limit=file_limit,
-                                )
-                                si_map[raw_bytes] = si_map[address] = source
-                    except:
-                        logger.warning(
-                            f"Channel source parsing error: {format_exc()}. The error is ignored and the channel source is None"
-                        )
-                        source = None
-
-                    self.source = source
-                else:
-                    self.source = None
-
             else:
                 stream.seek(address)
 
@@ -988,98 +1092,70 @@ class Channel:
                         self.upper_ext_limit,
                     ) = params
 
-                parsed_strings = kwargs["parsed_strings"]
-
-                if parsed_strings is None:
-                    self.name = get_text_v4(self.name_addr, stream, file_limit=file_limit)
-                    self.comment = get_text_v4(self.comment_addr, stream, file_limit=file_limit)
-
-                    if kwargs["use_display_names"]:
-                        self.display_names = extract_display_names(self.comment)
+            # all channels share the same block id object and, most of the time,
+            # the same (zero) limits; the float objects take a lot of memory on
+            # files with many channels
+            self.id = CN
+            limits = (
+                self.min_raw_value,
+                self.max_raw_value,
+                self.lower_limit,
+                self.upper_limit,
+                self.lower_ext_limit,
+                self.upper_ext_limit,
+            )
+            if pack("<6d", *limits) == ZERO_LIMITS_BYTES:
+                (
+                    self.min_raw_value,
+                    self.max_raw_value,
+                    self.lower_limit,
+                    self.upper_limit,
+                    self.lower_ext_limit,
+                    self.upper_ext_limit,
+                ) = ZERO_LIMITS
+
+            parsed_strings = kwargs["parsed_strings"]
+            metadata_source = kwargs.get("metadata_source", None)
+
+            if parsed_strings is None:
+                self.name = get_text_v4(self.name_addr, stream, mapped=mapped, file_limit=file_limit)
+
+                use_display_names = kwargs["use_display_names"]
+
+                # the display names can only be found in the XML comments (MDBLOCK)
+                if metadata_source is not None and not (
+                    use_display_names and _is_md_block(self.comment_addr, stream, mapped, file_limit)
+                ):
+                    self._comment = None
+                    self.display_names = {}
+                else:
+                    self._comment = get_text_v4(self.comment_addr, stream, mapped=mapped, file_limit=file_limit)
+                    if use_display_names:
+                        self.display_names = extract_display_names(self._comment)
                     else:
                         self.display_names = {}
-                else:
-                    self.name, self.display_names, self.comment = parsed_strings
-
-                self.unit = get_text_v4(self.unit_addr, stream, mapped=mapped, file_limit=file_limit)
-
-                si_map = kwargs["si_map"]
-                cc_map = kwargs["cc_map"]
-
-                address = self.conversion_addr
-                if address:
-                    try:
-                        if address in cc_map:
-                            conv = cc_map[address]
-                        else:
-                            if address + 16 > file_limit:
-                                handle_incomplete_block(address)
-                                raise MdfException(f"Incomplete block at {address:x}")
-
-                            stream.seek(address + 8)
-                            (size,) = UINT64_u(stream.read(8))
-
-                            if address + size > file_limit:
-                                handle_incomplete_block(address)
-                                raise MdfException(f"Incomplete block at {address:x}")
-
-                            stream.seek(address)
-                            raw_bytes = stream.read(size)
-                            if raw_bytes in cc_map:
-                                conv = cc_map[raw_bytes]
-                            else:
-                                conv = ChannelConversion(
-                                    raw_bytes=raw_bytes,
-                                    stream=stream,
-                                    address=address,
-                                   
-                                    mapped=mapped,
-                                    file_limit=file_limit,
-                                )
-                                cc_map[raw_bytes] = cc_map[address] = conv
-                    except:
-                        logger.warning(
-                            f"Channel conversion parsing error: {format_exc()}. The error is ignored and the channel conversion is None"
-                        )
-                        conv = None
+            else:
+                self.name, self.display_names, self._comment = parsed_strings
 
-                    self.conversion = conv
+            if metadata_source is None:
+                units_map = kwargs.get("units_map", {})
+                if self.unit_addr in units_map:
+                    self._unit = units_map[self.unit_addr]
                 else:
-                    self.conversion = None
+                    self._unit = units_map[self.unit_addr] = get_text_v4(
+                        self.unit_addr, stream, mapped=mapped, file_limit=file_limit
+                    )
 
-                address = self.source_addr
-                if address:
-                    try:
-                        if address in si_map:
-                            source = si_map[address]
-                        else:
-                            if address + v4c.SI_BLOCK_SIZE > file_limit:
-                                handle_incomplete_block(address)
-                                raise MdfException(f"Incomplete block at {address:x}")
+                self._conversion = _read_conversion(self.conversion_addr, stream, mapped, file_limit, kwargs["cc_map"])
+            else:
+                # the comment, unit and conversion are loaded on the first access
+                self._unit = ""
+                self._conversion = None
+                self._metadata_source = metadata_source
 
-                            stream.seek(address)
-                            raw_bytes = stream.read(v4c.SI_BLOCK_SIZE)
-                            if raw_bytes in si_map:
-                                source = si_map[raw_bytes]
-                            else:
-                                source = SourceInformation(
-                                    raw_bytes=raw_bytes,
-                                    stream=stream,
-                                    address=address,
-                                   
-                                    mapped=mapped,
-                                    file_limit=file_limit,
-                                )
-                                si_map[raw_bytes] = si_map[address] = source
-                    except:
-                        logger.warning(
-                            f"Channel source parsing error: {format_exc()}. The error is ignored and the channel source is None"
-                        )
-                        source = None
+            # the source is needed to build the bus logging display names
+            self.source = _read_source(self.source_addr, stream, mapped, file_limit, kwargs["si_map"])
 
-                    self.source = source
-                else:
-                    self.source = None
         else:
             self.address = 0
             self.name = self.comment = self.unit = ""
@@ -1165,6 +1241,46 @@ class Channel:
         self.standard_C_size = True
         self.fast_path: tuple[int, int, int, int, int, np.dtype[Any]] | None = None
 
+    @property
+    def comment(self) -> str:
+        if self._metadata_source is not None:
+            self._load_metadata()
+        return typing.cast(str, self._comment)
+
+    @comment.setter
+    def comment(self, comment: str) -> None:
+        if self._metadata_source is not None:
+            self._load_metadata()
+        self._comment = comment
+
+    @property
+    def conversion(self) -> "ChannelConversion | None":
+        if self._metadata_source is not None:
+            self._load_metadata()
+        return self._conversion
+
+    @conversion.setter
+    def conversion(self, conversion: "ChannelConversion | None") -> None:
+        if self._metadata_source is not None:
+            self._load_metadata()
+        self._conversion = conversion
+
+    @property
+    def unit(self) -> str:
+        if self._metadata_source is not None:
+            self._load_metadata()
+        return self._unit
+
+    @unit.setter
+    def unit(self, unit: str) -> None:
+        if self._metadata_source is not None:
+            self._load_metadata()
+        self._unit = unit
+
+    def _load_metadata(self) -> None:
+        typing.cast(LazyChannelMetadata, self._metadata_source).load(self)
+        self._metadata_source = None
+
     def __getitem__(self, item: str) -> object:
         return getattr(self, item)
 
@@ -2413,6 +2529,9 @@ class _ChannelConversionBase:
     )
 
 
+CC = b"##CC"
+
+
 class ChannelConversionKwargs(BlockKwargs, total=False):
     raw_bytes: bytes
     name: str
@@ -2459,7 +2578,58 @@ class _ValsCache(TypedDict):
     type: Literal["big", "small"]
 
 
-_Cache = _BoundCache | _ValsCache
+class _FormulaCache(TypedDict):
+    type: Literal["formula"]
+    formula: str
+    expression: str
+    lambdify_dtypes: set[np.dtype[Any]]
+
+
+class _TableCache(TypedDict):
+    type: Literal["table"]
+    val_param_nr: int
+    raw: NDArray[Any]
+    phys: NDArray[Any]
+
+
+class _RangeTableCache(TypedDict):
+    type: Literal["range_table"]
+    val_param_nr: int
+    lower: NDArray[Any]
+    upper: NDArray[Any]
+    phys: NDArray[Any]
+
+
+_Cache = _BoundCache | _ValsCache | _FormulaCache | _TableCache | _RangeTableCache
+
+
+@lru_cache(maxsize=1024)
+def _lambdify_formula(expression: str) -> Callable[[NDArray[Any]], NDArray[Any]] | None:
+    """Compile the algebraic conversion formula that cannot be evaluated by
+    numexpr; the compiled functions are shared by all the conversions with
+    the same formula.
+    """
+    if lambdify is None:
+        return None
+
+    return typing.cast(
+        Callable[[NDArray[Any]], NDArray[Any]],
+        lambdify(
+            symbols("X"),
+            expression,
+            modules=[{"INF": np.inf, "NaN": np.nan}, "numpy"],
+            dummify=False,
+            cse=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def _identical_conversion() -> "ChannelConversion":
+    """Shared identical conversion used for the value to text conversions
+    when the text values are ignored.
+    """
+    return ChannelConversion(conversion_type=v4c.CONVERSION_TYPE_NON)
 
 
 class ChannelConversion(_ChannelConversionBase):
@@ -2560,6 +2730,10 @@ class ChannelConversion(_ChannelConversionBase):
     * ``unit`` - str : channel conversion unit
     """
 
+    # the instance dict is only needed for the variable fields of the tabular
+    # and text conversions (val_<N>, upper_<N>, text_<N> etc.)
+    __slots__ = ("__dict__", "_cache", "is_user_defined")
+
     def __init__(self, **kwargs: Unpack[ChannelConversionKwargs]) -> None:
         self._cache: _Cache | None = None
         self.is_user_defined = False
@@ -2605,6 +2779,9 @@ class ChannelConversion(_ChannelConversionBase):
 
                 tx_block = stream.read(self.block_len - COMMON_SIZE)
 
+            # all conversions share the same block id object
+            self.id = CC
+
             (conv,) = UINT8_uf(tx_block, self.links_nr * 8)
 
             if conv == v4c.CONVERSION_TYPE_NON:
@@ -3389,7 +3566,7 @@ class ChannelConversion(_ChannelConversionBase):
         as_bytes: bool = False,
         ignore_value2text_conversions: bool = False,
     ) -> NDArray[Any] | np.number[Any]:
-        identical = ChannelConversion(conversion_type=v4c.CONVERSION_TYPE_NON)
+        identical = _identical_conversion()
         scalar = False
 
         if not isinstance(values, np.ndarray):
@@ -3481,27 +3658,46 @@ class ChannelConversion(_ChannelConversionBase):
                         new_values = (P1 * X**2 + P2 * X + P3) / (P4 * X**2 + P5 * X + P6)
 
         elif conversion_type == v4c.CONVERSION_TYPE_ALG:
-            try:
-                X = new_values
-                INF = np.inf
-                NaN = np.nan
-                new_values = evaluate(self.formula.replace("X1", "X"))
-            except:
-                if lambdify is not None:
-                    X_symbol = symbols("X")
-                    expr = lambdify(
-                        X_symbol,
-                        self.formula.replace("X1", "X"),
-                        modules=[{"INF": np.inf, "NaN": np.nan}, "numpy"],
-                        dummify=False,
-                        cse=True,
-                    )
-                    new_values = expr(new_values)
+            formula_cache = typing.cast(_FormulaCache | None, self._cache)
+            if formula_cache is None or formula_cache["type"] != "formula" or formula_cache["formula"] != self.formula:
+                formula_cache = self._cache = {
+                    "type": "formula",
+                    "formula": self.formula,
+                    "expression": self.formula.replace("X1", "X"),
+                    "lambdify_dtypes": set(),
+                }
+
+            expression = formula_cache["expression"]
+            dtype = new_values.dtype
+            # numexpr is retried only for the input types it has not rejected
+            if dtype not in formula_cache["lambdify_dtypes"]:
+                try:
+                    new_values = evaluate(expression, local_dict={"X": new_values, "INF": np.inf, "NaN": np.nan})
+                except:
+                    formula_cache["lambdify_dtypes"].add(dtype)
+
+            if dtype in formula_cache["lambdify_dtypes"]:
+                function = _lambdify_formula(expression)
+                if function is not None:
+                    new_values = function(new_values)
 
         elif conversion_type in (v4c.CONVERSION_TYPE_TABI, v4c.CONVERSION_TYPE_TAB):
-            nr = self.val_param_nr // 2
-            raw_vals = np.array([self[f"raw_{i}"] for i in range(nr)])
-            phys_vals = np.array([self[f"phys_{i}"] for i in range(nr)])
+            table_cache = typing.cast(_TableCache | None, self._cache)
+            if (
+                table_cache is None
+                or table_cache["type"] != "table"
+                or table_cache["val_param_nr"] != self.val_param_nr
+            ):
+                nr = self.val_param_nr // 2
+                table_cache = self._cache = {
+                    "type": "table",
+                    "val_param_nr": self.val_param_nr,
+                    "raw": np.array([self[f"raw_{i}"] for i in range(nr)]),
+                    "phys": np.array([self[f"phys_{i}"] for i in range(nr)]),
+                }
+
+            raw_vals = table_cache["raw"]
+            phys_vals = table_cache["phys"]
 
             if conversion_type == v4c.CONVERSION_TYPE_TABI:
                 new_values = np.interp(new_values, raw_vals, phys_vals)
@@ -3520,10 +3716,24 @@ class ChannelConversion(_ChannelConversionBase):
                 new_values = np.where(cond, phys_vals[inds2], phys_vals[inds])
 
         elif conversion_type == v4c.CONVERSION_TYPE_RTAB:
-            nr = (self.val_param_nr - 1) // 3
-            lower_vals = np.array([self[f"lower_{i}"] for i in range(nr)])
-            upper_vals = np.array([self[f"upper_{i}"] for i in range(nr)])
-            phys_vals = np.array([self[f"phys_{i}"] for i in range(nr)])
+            range_table_cache = typing.cast(_RangeTableCache | None, self._cache)
+            if (
+                range_table_cache is None
+                or range_table_cache["type"] != "range_table"
+                or range_table_cache["val_param_nr"] != self.val_param_nr
+            ):
+                nr = (self.val_param_nr - 1) // 3
+                range_table_cache = self._cache = {
+                    "type": "range_table",
+                    "val_param_nr": self.val_param_nr,
+                    "lower": np.array([self[f"lower_{i}"] for i in range(nr)]),
+                    "upper": np.array([self[f"upper_{i}"] for i in range(nr)]),
+                    "phys": np.array([self[f"phys_{i}"] for i in range(nr)]),
+                }
+
+            lower_vals = range_table_cache["lower"]
+            upper_vals = range_table_cache["upper"]
+            phys_vals = range_table_cache["phys"]
 
             if new_values.dtype.kind == "f":
                 idx1 = np.searchsorted(lower_vals, new_values, side="right") - 1
@@ -3569,21 +3779,7 @@ class ChannelConversion(_ChannelConversionBase):
                     default = ref
 
             else:
-                self._cache = typing.cast(_ValsCache | None, self._cache)
-                if self._cache is None or self._cache["type"] != "big":
-                    nr = self.val_param_nr
-                    raw = [self[f"val_{i}"] for i in range(nr)]
-
-                    phys = [self.referenced_blocks[f"text_{i}"] for i in range(nr)]
-
-                    pairs = sorted(zip(raw, phys, strict=False))
-                    raw_vals = np.array([e[0] for e in pairs], dtype="<i8")
-                    phys = [e[1] for e in pairs]
-
-                    self._cache = {"phys": phys, "raw_vals": raw_vals, "type": "big"}
-                else:
-                    phys = self._cache["phys"]
-                    raw_vals = typing.cast(NDArray[Any], self._cache["raw_vals"])
+                raw_vals, phys = self._value_table()
 
                 ref_block = self.referenced_blocks["default_addr"]
                 if ref_block is None:
@@ -3899,30 +4095,7 @@ class ChannelConversion(_ChannelConversionBase):
                 default_is_bytes = False
 
             else:
-                self._cache = typing.cast(_BoundCache | None, self._cache)
-                if self._cache is None or self._cache["type"] != "big":
-                    nr = self.val_param_nr // 2
-
-                    phys = [self.referenced_blocks[f"text_{i}"] for i in range(nr)]
-
-                    lower = [self[f"lower_{i}"] for i in range(nr)]
-                    upper = [self[f"upper_{i}"] for i in range(nr)]
-
-                    triplets = sorted(zip(lower, upper, phys, strict=False))
-                    lower_vals = np.array([e[0] for e in triplets], dtype="<i8")
-                    upper_vals = np.array([e[1] for e in triplets], dtype="<i8")
-                    phys = [e[2] for e in triplets]
-
-                    self._cache = {
-                        "phys": phys,
-                        "lower": lower_vals,
-                        "upper": upper_vals,
-                        "type": "big",
-                    }
-                else:
-                    phys = self._cache["phys"]
-                    lower_vals = typing.cast(NDArray[Any], self._cache["lower"])
-                    upper_vals = typing.cast(NDArray[Any], self._cache["upper"])
+                lower_vals, upper_vals, phys = self._range_table()
 
                 ref = self.referenced_blocks["default_addr"]
                 if ref is None:
@@ -4112,15 +4285,18 @@ class ChannelConversion(_ChannelConversionBase):
             raw = [self[f"val_{i}"] for i in range(nr)]
             val_default = self.val_default
 
+            # the table is searched once for each unique text
+            unique, inverse = np.unique(new_values, return_inverse=True)
+
             ret = []
-            for val in new_values:
+            for val in unique.tolist():
                 try:
                     obj = raw[phys_2.index(val)]
                 except ValueError:
                     obj = val_default
                 ret.append(obj)
 
-            new_values = np.array(ret)
+            new_values = np.array(ret)[inverse.ravel()]
 
         elif conversion_type == v4c.CONVERSION_TYPE_TRANS:
             if not ignore_value2text_conversions:
@@ -4131,15 +4307,18 @@ class ChannelConversion(_ChannelConversionBase):
                 out_ = [self.referenced_blocks[f"output_{i}_addr"] for i in range(nr)]
                 default_addr = self.referenced_blocks["default_addr"]
 
+                # the table is searched once for each unique input text
+                unique, inverse = np.unique(new_values, return_inverse=True)
+
                 ret = []
-                for val in new_values:
+                for val in unique.tolist():
                     try:
                         obj = out_[in_.index(val.strip(b"\0"))]
                     except ValueError:
                         obj = default_addr
                     ret.append(obj)
 
-                new_values = np.array(ret)
+                new_values = np.array(ret)[inverse.ravel()]
 
         elif conversion_type == v4c.CONVERSION_TYPE_BITFIELD:
             if not ignore_value2text_conversions:
@@ -4191,6 +4370,129 @@ class ChannelConversion(_ChannelConversionBase):
         else:
             return new_values
 
+    def _value_table(self) -> tuple[NDArray[Any], list[Union[bytes, "ChannelConversion"]]]:
+        """Sorted raw values and texts of the value to text conversion, used
+        for the large arrays.
+        """
+        cache = typing.cast(_ValsCache | None, self._cache)
+        if cache is None or cache["type"] != "big":
+            nr = self.val_param_nr
+            raw = [self[f"val_{i}"] for i in range(nr)]
+
+            phys = [self.referenced_blocks[f"text_{i}"] for i in range(nr)]
+
+            pairs = sorted(zip(raw, phys, strict=False))
+            raw_vals = np.array([e[0] for e in pairs], dtype="<i8")
+            phys = [e[1] for e in pairs]
+
+            cache = self._cache = {"phys": phys, "raw_vals": raw_vals, "type": "big"}
+
+        return typing.cast(NDArray[Any], cache["raw_vals"]), cache["phys"]
+
+    def _range_table(self) -> tuple[NDArray[Any], NDArray[Any], list[Union[bytes, "ChannelConversion"]]]:
+        """Sorted lower limits, upper limits and texts of the range to text
+        conversion, used for the large arrays.
+        """
+        cache = typing.cast(_BoundCache | None, self._cache)
+        if cache is None or cache["type"] != "big":
+            nr = self.val_param_nr // 2
+
+            phys = [self.referenced_blocks[f"text_{i}"] for i in range(nr)]
+
+            lower = [self[f"lower_{i}"] for i in range(nr)]
+            upper = [self[f"upper_{i}"] for i in range(nr)]
+
+            triplets = sorted(zip(lower, upper, phys, strict=False))
+            lower_vals = np.array([e[0] for e in triplets], dtype="<i8")
+            upper_vals = np.array([e[1] for e in triplets], dtype="<i8")
+            phys = [e[2] for e in triplets]
+
+            cache = self._cache = {
+                "phys": phys,
+                "lower": lower_vals,
+                "upper": upper_vals,
+                "type": "big",
+            }
+
+        return (
+            typing.cast(NDArray[Any], cache["lower"]),
+            typing.cast(NDArray[Any], cache["upper"]),
+            cache["phys"],
+        )
+
+    def convert_to_categories(
+        self, values: ArrayLike
+    ) -> tuple[NDArray[np.signedinteger[Any]], NDArray[np.bytes_]] | None:
+        """Dictionary-encoded value to text or range to text conversion.
+
+        The texts are not created for each sample; the result holds the
+        integer code of each sample and the table of unique texts, so the text
+        of the sample `i` is ``categories[codes[i]]``. The texts are the same
+        as the texts returned by `convert`.
+
+        Parameters
+        ----------
+        values : array-like
+            Raw values.
+
+        Returns
+        -------
+        result : tuple | None
+            The integer codes and the unique texts, or None if this is not a
+            value to text or range to text conversion, or if some values are
+            converted to numbers by a referenced conversion.
+        """
+        conversion_type = self.conversion_type
+        if conversion_type not in (v4c.CONVERSION_TYPE_TABX, v4c.CONVERSION_TYPE_RTABX):
+            return None
+
+        new_values = np.asarray(values)
+        if new_values.dtype.names or new_values.ndim > 1:
+            return None
+        new_values = new_values.ravel()
+
+        # `convert` looks up the texts of the small arrays sample by sample
+        if len(new_values) < (150 if conversion_type == v4c.CONVERSION_TYPE_TABX else 100):
+            texts = self.convert(new_values)
+            if texts.dtype.kind != "S":
+                return None
+
+            categories, codes = np.unique(texts, return_inverse=True)
+
+        else:
+            if conversion_type == v4c.CONVERSION_TYPE_TABX:
+                lower_vals, phys = self._value_table()
+                upper_vals = lower_vals
+            else:
+                lower_vals, upper_vals, phys = self._range_table()
+
+            # the same lookup as `convert`; the last position holds the default text
+            phys = [*phys, self.referenced_blocks["default_addr"]]
+
+            # the texts are stored as fixed size bytes, without the trailing zeros
+            unique_texts: dict[bytes, int] = {}
+            lookup = np.full(len(phys), -1, dtype=np.int32)
+            for position, text in enumerate(phys):
+                if isinstance(text, bytes):
+                    lookup[position] = unique_texts.setdefault(text.rstrip(b"\0"), len(unique_texts))
+
+            idx1 = np.searchsorted(lower_vals, new_values, side="right") - 1
+            idx2 = np.searchsorted(upper_vals, new_values, side="left")
+
+            codes = lookup.take(np.where(idx1 == idx2, idx1, len(lower_vals)))
+
+            if codes.size and codes.min() < 0:
+                return None
+
+            categories = np.array(list(unique_texts), dtype=bytes)
+
+        if len(categories) <= np.iinfo(np.int8).max:
+            return codes.astype(np.int8), categories
+        elif len(categories) <= np.iinfo(np.int16).max:
+            return codes.astype(np.int16), categories
+        else:
+            return codes, categories
+
     def metadata(self, indent: str = "") -> str:
         keys: tuple[str, ...]
         if self.conversion_type == v4c.CONVERSION_TYPE_NON:
@@ -4737,6 +5039,7 @@ class DataZippedBlockKwargs(BlockKwargs, total=False):
     zip_type: int
     param: int
     transposed: bool
+    compression_level: CompressionLevelType | None
     file_limit: int | float
 
 
@@ -4771,9 +5074,12 @@ class DataZippedBlock:
         DTBLOCK address inside the file.
     stream : int
         File handle.
+    compression_level : {'fastest', 'balanced', 'smallest'}, optional
+        Compression level policy used for new blocks, see `get_compressor`.
     """
 
     __slots__ = (
+        "_compression_level",
         "_prevent_data_setitem",
         "_transposed",
         "address",
@@ -4794,6 +5100,7 @@ class DataZippedBlock:
     def __init__(self, **kwargs: Unpack[DataZippedBlockKwargs]) -> None:
         self.data: bytes | bytearray
         self._prevent_data_setitem = True
+        self._compression_level = kwargs.get("compression_level", None)
         self._transposed = False
         try:
             self.address = address = kwargs["address"]
@@ -4863,16 +5170,7 @@ class DataZippedBlock:
             original_size = len(data)
             self.original_size = original_size
 
-            compress_func: Callable[[Buffer, int], bytes]
-            if self.zip_type in (v4c.FLAG_DZ_DEFLATE, v4c.FLAG_DZ_TRANSPOSED_DEFLATE):
-                compress_func = compress
-                compression_level = COMPRESSION_LEVEL
-            elif self.zip_type in (v4c.FLAG_DZ_LZ4, v4c.FLAG_DZ_TRANSPOSED_LZ4):
-                compress_func = lz_compress
-                compression_level = 1
-            elif self.zip_type in (v4c.FLAG_DZ_ZSTD, v4c.FLAG_DZ_TRANSPOSED_ZSTD):
-                compress_func = zstd_compress
-                compression_level = 1
+            compress_func, compression_level = get_compressor(self.zip_type, self._compression_level)
 
             if self.zip_type in (v4c.FLAG_DZ_DEFLATE, v4c.FLAG_DZ_LZ4, v4c.FLAG_DZ_ZSTD):
                 data = compress_func(data, compression_level)
@@ -4969,6 +5267,125 @@ class DataZippedBlock:
         return data
 
 
+def get_compressor(
+    zip_type: int, compression_level: CompressionLevelType | None = None
+) -> tuple[Callable[[Buffer, int], bytes], int]:
+    """Get the compression function and level for the DZ block zip type.
+
+    Parameters
+    ----------
+    zip_type : int
+        DZ block zip type.
+    compression_level : {'fastest', 'balanced', 'smallest'}, optional
+        Compression level policy. The deflate blocks use the fastest available
+        backend for the policy: isal for 'fastest', and libdeflate (the
+        optional `deflate` package, installed with the `compression` extra)
+        for 'balanced' and 'smallest'; zlib is used if they are not
+        installed. If None, then the default level of each algorithm is used.
+
+    Returns
+    -------
+    compress_func, level : (callable, int)
+        Function called with the block bytes and the level.
+    """
+    if compression_level not in (None, *COMPRESSION_SKIP_RATIO):
+        raise MdfException(f'Unknown compression level "{compression_level}"')
+
+    if zip_type in (v4c.FLAG_DZ_DEFLATE, v4c.FLAG_DZ_TRANSPOSED_DEFLATE):
+        match compression_level:
+            case "fastest":
+                if ISAL_AVAILABLE:
+                    return compress, 1
+                elif LIBDEFLATE_AVAILABLE:
+                    return libdeflate_compress, 1
+                else:
+                    return zlib_compress, 1
+            case "balanced":
+                if LIBDEFLATE_AVAILABLE:
+                    return libdeflate_compress, 6
+                elif ISAL_AVAILABLE:
+                    return compress, 2
+                else:
+                    return zlib_compress, 6
+            case "smallest":
+                if LIBDEFLATE_AVAILABLE:
+                    return libdeflate_compress, 12
+                else:
+                    return zlib_compress, 9
+            case _:
+                return compress, COMPRESSION_LEVEL
+
+    elif zip_type in (v4c.FLAG_DZ_LZ4, v4c.FLAG_DZ_TRANSPOSED_LZ4):
+        match compression_level:
+            case "fastest":
+                return lz_compress, 0
+            case "balanced":
+                return lz_compress, 3
+            case "smallest":
+                return lz_compress, 12
+            case _:
+                return lz_compress, 1
+
+    elif zip_type in (v4c.FLAG_DZ_ZSTD, v4c.FLAG_DZ_TRANSPOSED_ZSTD):
+        match compression_level:
+            case "balanced":
+                return zstd_compress, 3
+            case "smallest":
+                return zstd_compress, 19
+            case _:
+                return zstd_compress, 1
+
+    raise MdfException(f"Unknown DZ block zip type {zip_type}")
+
+
+def compress_data_block(
+    data: bytes | bytearray,
+    zip_type: int,
+    param: int = 0,
+    original_type: bytes = b"DT",
+    compression_level: CompressionLevelType | None = None,
+) -> "DataZippedBlock | DataBlock":
+    """Build the DZ block for the data, or a plain data block (DT, SD, DV or DI
+    block) if compression does not pay off.
+
+    For the compression level policies, the first `COMPRESSION_TRIAL_SIZE`
+    bytes of large blocks are compressed first, and the block is stored
+    uncompressed if the compressed size is above `COMPRESSION_SKIP_RATIO` of
+    the original size (for example float signals with noise). This saves the
+    compression time when saving and the decompression time when reading.
+    If `compression_level` is None, then the block is always compressed.
+    """
+    dz_kwargs: DataZippedBlockKwargs = {
+        "zip_type": zip_type,
+        "param": param,
+        "original_type": original_type,
+        "compression_level": compression_level,
+    }
+
+    if compression_level is None:
+        return DataZippedBlock(data=data, **dz_kwargs)
+
+    skip_ratio = COMPRESSION_SKIP_RATIO[compression_level]
+    block_type = typing.cast(Literal["DT", "SD", "DV", "DI"], original_type.decode("ascii"))
+
+    size = len(data)
+    if size > 4 * COMPRESSION_TRIAL_SIZE:
+        # the trial data keeps whole records for the transposition
+        trial_size = COMPRESSION_TRIAL_SIZE
+        if param and zip_type not in (v4c.FLAG_DZ_DEFLATE, v4c.FLAG_DZ_LZ4, v4c.FLAG_DZ_ZSTD):
+            trial_size = max(trial_size // param, 1) * param
+
+        trial_block = DataZippedBlock(data=memoryview(data)[:trial_size], **dz_kwargs)
+        if trial_block.zip_size > skip_ratio * trial_size:
+            return DataBlock(data=data, type=block_type)
+
+    block = DataZippedBlock(data=data, **dz_kwargs)
+    if block.zip_size > skip_ratio * size:
+        return DataBlock(data=data, type=block_type)
+
+    return block
+
+
 class DataGroupKwargs(BlockKwargs, total=False):
     id: bytes
     reserved0: int
@@ -1,7 +1,9 @@
 """Common MDF file format module"""
 
 import bz2
-from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from collections import deque
+from collections.abc import Callable, Generator, Hashable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 import csv
 from datetime import datetime, timezone
@@ -9,6 +11,7 @@ from enum import Enum
 from functools import reduce
 import gzip
 from io import BufferedIOBase, BytesIO
+from itertools import chain
 import logging
 import mmap
 import os
@@ -17,6 +20,7 @@ import re
 from shutil import copy, move
 import sys
 from tempfile import gettempdir, mkdtemp
+from threading import Lock
 from traceback import format_exc
 from types import TracebackType
 import typing
@@ -31,19 +35,6 @@ import pandas as pd
 from pandas import DataFrame
 from typing_extensions import Any, LiteralString, Never, overload, TypedDict, Unpack
 
-try:
-    from isal.isal_zlib import decompress
-except ImportError:
-    from zlib import decompress
-import tempfile
-
-from lz4.frame import compress as lz_compress
-from lz4.frame import decompress as lz_decompress
-from numpy import (
-    frombuffer,
-    uint8,
-)
-
 from . import tool
 from .blocks import mdf_v2, mdf_v3, mdf_v4
 from .blocks import v2_v3_blocks as v3b
@@ -63,6 +54,7 @@ from .blocks.source_utils import Source
 from .blocks.types import (
     BusType,
     ChannelsType,
+    CompressionLevelType,
     CompressionType,
     DbcFileType,
     EmptyChannelsType,
@@ -77,7 +69,6 @@ from .blocks.utils import (
     components,
     csv_bytearray2hex,
     csv_int2hex,
-    DataBlockInfo,
     downcast,
     FileLike,
     Fragment,
@@ -108,7 +99,7 @@ from .blocks.v4_blocks import (
     FileIdentificationBlock,
     SourceInformation,
 )
-from .signal import InvalidationArray, Signal
+from .signal import ChunkedSignal, interp_signals, InvalidationArray, Signal
 
 try:
     import fsspec
@@ -275,6 +266,28 @@ class MDF:
 
         .. versionadded:: 8.7.0
 
+    use_metadata_cache : bool, default False
+        For MDF v4 files, store the parsed metadata (channels, groups and data
+        blocks address tables) in a persistent index file and reuse it when
+        the same unmodified file is opened again; the index is invalidated
+        automatically when the file size, modification time or header change.
+        By default the indexes are stored in the per-user cache folder
+        ("~/.cache/asammdf/metadata" on Linux); use the global option
+        "metadata_cache_folder" to store them in another folder. The indexes
+        are authenticated with a per-user key before they are loaded, so the
+        index files that were not written by the user are ignored.
+
+        .. versionadded:: 8.8.0
+
+    lazy_channel_metadata : bool, default False
+        For MDF v4 files, only read the channel names, display names and
+        sources when the file is loaded; the channel comment, unit and
+        conversion are loaded on the first access to the channel. This reduces
+        the loading time and the memory usage for files with many channels.
+        The deferred metadata cannot be loaded after the file is closed.
+
+        .. versionadded:: 8.8.0
+
     Examples
     --------
     >>> mdf = MDF(version='3.30')  # new MDF object with version 3.30
@@ -673,6 +686,147 @@ class MDF:
         self._transfer_events(other)
         self._transfer_header_data(other, message)
 
+    def _iter_groups_in_threads(
+        self,
+        group_indexes: Sequence[int],
+        read: Callable[[int], Any],
+        lock: Lock,
+        process: Callable[[int, Any], Any] | None = None,
+    ) -> Iterator[tuple[int, Any]]:
+        """Yield the (group index, result) pairs in the order of
+        `group_indexes`.
+
+        `read` gets the group data from this file and `process` transforms it.
+        If `group_thread_count` allows more than one thread, both run in a
+        thread pool: the `read` calls are serialized by `lock`, so they
+        overlap only with the `process` calls and with the caller (which
+        typically appends the results to the output file). At most two groups
+        per thread are handled ahead of the caller, which bounds the memory
+        usage.
+        """
+        thread_count = min(self._mdf._group_thread_count or THREAD_COUNT, len(group_indexes))
+
+        def run(group_index: int) -> Any:
+            with lock:
+                data = read(group_index)
+
+            if process is not None:
+                data = process(group_index, data)
+
+            return data
+
+        if thread_count <= 1:
+            for group_index in group_indexes:
+                yield group_index, run(group_index)
+            return
+
+        pending: deque[tuple[int, Future[Any]]] = deque()
+        max_pending = 2 * thread_count
+
+        with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="asammdf_groups") as pool:
+            try:
+                for group_index in group_indexes:
+                    pending.append((group_index, pool.submit(run, group_index)))
+                    if len(pending) >= max_pending:
+                        group_index, future = pending.popleft()
+                        yield group_index, future.result()
+
+                while pending:
+                    group_index, future = pending.popleft()
+                    yield group_index, future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _iter_opened_files(
+        files: Sequence[Union["MDF", FileLike, StrPath]], **kwargs: Any
+    ) -> Generator[tuple["MDF", bool], None, None]:
+        """Yield the (`MDF` object, close flag) pairs of the input files.
+
+        The next file is opened by a worker thread while the caller processes
+        the current one. The close flag is True for the files that are opened
+        here; they must be closed by the caller.
+        """
+
+        def open_file(file: Union["MDF", FileLike, StrPath]) -> "MDF":
+            return file if isinstance(file, MDF) else MDF(file, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="asammdf_inputs") as pool:
+            future: Future[MDF] | None = pool.submit(open_file, files[0])
+            next_index = 1
+
+            try:
+                for file in files:
+                    mdf = typing.cast(Future[MDF], future).result()
+
+                    if next_index < len(files):
+                        future = pool.submit(open_file, files[next_index])
+                        next_index += 1
+                    else:
+                        future = None
+
+                    yield mdf, not isinstance(file, MDF)
+            finally:
+                # the caller stopped early; close the file opened in advance
+                if future is not None and not future.cancel() and not isinstance(files[next_index - 1], MDF):
+                    try:
+                        future.result().close()
+                    except Exception:
+                        pass
+
+    def _get_channel_groups_structure(self) -> list[list[str]]:
+        """Get the sorted names of the included channels of each virtual
+        channel group; only the file metadata is used.
+        """
+        structure = []
+        for group_index in self.virtual_groups:
+            included_channels = self.included_channels(group_index)[group_index]
+            structure.append(
+                sorted(
+                    self.groups[gp_index].channels[ch_index].name
+                    for gp_index, channels in included_channels.items()
+                    for ch_index in channels
+                )
+            )
+
+        return structure
+
+    def _get_passthrough_signals(
+        self, group_index: int, channels: list[int], version: str | Version
+    ) -> list[Signal] | None:
+        """Get the signals used to append the copy of the group to a new file
+        with the given `version` if the group records can be copied verbatim
+        (raw data blocks passthrough); otherwise return None and the group
+        samples must be decoded and encoded again.
+
+        The signals hold only the first group record; the appended record is
+        replaced when the data blocks are copied.
+        """
+        if not isinstance(self._mdf, mdf_v4.MDF4) or not "4.00" <= version < "4.20":
+            return None
+
+        layout = self._mdf._get_record_layout(group_index, channels)
+        if layout is None:
+            return None
+
+        selected_signals = self._mdf._yield_selected_signals(
+            group_index, groups={group_index: channels}, record_count=1
+        )
+        signals = typing.cast(list[Signal] | None, next(selected_signals, None))
+        selected_signals.close()
+        self._mdf.groups[group_index].read_split_count = 0
+
+        if not signals:
+            return None
+
+        # the record layout of the new group is checked using a scratch file
+        with MDF(version=version) as scratch:
+            scratch.append(signals, common_timebase=True)
+            new_layout = typing.cast(mdf_v4.MDF4, scratch._mdf)._get_record_layout(0)
+
+        return signals if new_layout == layout else None
+
     def __contains__(self, channel: str) -> bool:
         """If *'channel name'* in *'mdf file'*"""
         return channel in self.channels_db
@@ -696,6 +850,15 @@ class MDF:
         raise_on_multiple_occurrences: bool | None = None,
         temporary_folder: str | None = None,
         fill_0_for_missing_computation_channels: bool | None = None,
+        decompression_thread_count: int | None = None,
+        compression_thread_count: int | None = None,
+        extraction_thread_count: int | None = None,
+        group_thread_count: int | None = None,
+        prefetch_depth: int | None = None,
+        compression_level: CompressionLevelType | None = None,
+        append_buffer_size: int | None = None,
+        append_buffer_samples: int | None = None,
+        append_buffer_interval: float | None = None,
     ) -> None:
         """Configure `MDF` parameters.
 
@@ -710,6 +873,15 @@ class MDF:
         * raise_on_multiple_occurrences = True
         * temporary_folder = ""
         * fill_0_for_missing_computation_channels = False
+        * decompression_thread_count = 0 (automatic)
+        * compression_thread_count = 0 (automatic)
+        * extraction_thread_count = 0 (automatic)
+        * group_thread_count = 0 (automatic)
+        * prefetch_depth = 4
+        * compression_level = None (default level of each algorithm)
+        * append_buffer_size = 4 MB
+        * append_buffer_samples = 0 (no limit)
+        * append_buffer_interval = 0 (no limit)
 
         Parameters
         ----------
@@ -768,6 +940,80 @@ class MDF:
             computed channel will be marked as not existing.
 
             .. versionadded:: 7.1.0
+
+        decompression_thread_count : int, optional
+            Number of worker threads used to decompress the DZ blocks of MDF
+            v4 files when the channel group data is loaded. Use 0 for the
+            automatic thread count (number of CPUs minus one) and 1 to
+            decompress on the caller's thread.
+
+            .. versionadded:: 8.8.0
+
+        compression_thread_count : int, optional
+            Number of worker threads used to compress (and transpose) the data
+            blocks when MDF v4 files are saved with compression. The blocks
+            are still written in the same order, so the output file does not
+            depend on the thread count. Use 0 for the automatic thread count
+            (number of CPUs minus one) and 1 to compress on the caller's
+            thread.
+
+            .. versionadded:: 8.8.0
+
+        extraction_thread_count : int, optional
+            Number of native threads used to extract the channels' bytes from
+            the records when several channels of the same MDF v4 channel group
+            are read (`select`, `to_dataframe`, `iter_channels` etc.). Use 0
+            for the automatic thread count (number of CPUs).
+
+            .. versionadded:: 8.8.0
+
+        group_thread_count : int, optional
+            Number of worker threads used by `convert` and `resample` to read
+            (and resample) the channel groups, while the previous groups are
+            appended to the output file in the original order. At most two
+            groups per thread are processed ahead of the output. Use 0 for the
+            automatic thread count (number of CPUs minus one) and 1 to process
+            the groups one after the other.
+
+            .. versionadded:: 8.8.0
+
+        prefetch_depth : int, optional
+            Number of MDF v4 data blocks that are read ahead while the current
+            data is decoded; the read ahead size is also limited by
+            `read_fragment_size`. Memory mapped files get a read ahead hint
+            for the kernel, the other files are read on a background thread.
+            Use 0 to disable the read ahead.
+
+            .. versionadded:: 8.8.0
+
+        compression_level : {'fastest', 'balanced', 'smallest'}, optional
+            Default compression level policy used when MDF v4 files are saved
+            with compression, see `MDF.save`.
+
+            .. versionadded:: 8.8.0
+
+        append_buffer_size : int, optional
+            The records added by consecutive `extend` calls to a MDF v4
+            channel group are collected in memory and written as a single set
+            of data blocks once their size reaches this number of bytes. The
+            pending records are also written when the group's data is read or
+            the file is saved. Use 0 to write the data blocks of each `extend`
+            call right away.
+
+            .. versionadded:: 8.8.0
+
+        append_buffer_samples : int, optional
+            Write the collected `extend` records once the channel group has
+            this number of pending records. Use 0 for no limit.
+
+            .. versionadded:: 8.8.0
+
+        append_buffer_interval : float, optional
+            Write the collected `extend` records if the oldest of them was
+            added more than this number of seconds ago; the age is checked by
+            the `extend` calls. Use 0 for no limit.
+
+            .. versionadded:: 8.8.0
         """
 
         if from_other is not None:
@@ -778,6 +1024,16 @@ class MDF:
             self._mdf._integer_interpolation = from_other._mdf._integer_interpolation
             self._mdf._float_interpolation = from_other._mdf._float_interpolation
             self._mdf._raise_on_multiple_occurrences = from_other._mdf._raise_on_multiple_occurrences
+            self._mdf._group_thread_count = from_other._mdf._group_thread_count
+            if isinstance(self._mdf, mdf_v4.MDF4) and isinstance(from_other._mdf, mdf_v4.MDF4):
+                self._mdf._decompression_thread_count = from_other._mdf._decompression_thread_count
+                self._mdf._compression_thread_count = from_other._mdf._compression_thread_count
+                self._mdf._extraction_thread_count = from_other._mdf._extraction_thread_count
+                self._mdf._prefetch_depth = from_other._mdf._prefetch_depth
+                self._mdf._compression_level = from_other._mdf._compression_level
+                self._mdf._append_buffer_size = from_other._mdf._append_buffer_size
+                self._mdf._append_buffer_samples = from_other._mdf._append_buffer_samples
+                self._mdf._append_buffer_interval = from_other._mdf._append_buffer_interval
 
         if read_fragment_size is not None:
             self._mdf._read_fragment_size = int(read_fragment_size)
@@ -807,6 +1063,35 @@ class MDF:
         if raise_on_multiple_occurrences is not None:
             self._mdf._raise_on_multiple_occurrences = bool(raise_on_multiple_occurrences)
 
+        if decompression_thread_count is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._decompression_thread_count = max(int(decompression_thread_count), 0)
+
+        if compression_thread_count is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._compression_thread_count = max(int(compression_thread_count), 0)
+
+        if extraction_thread_count is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._extraction_thread_count = max(int(extraction_thread_count), 0)
+
+        if group_thread_count is not None:
+            self._mdf._group_thread_count = max(int(group_thread_count), 0)
+
+        if prefetch_depth is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._prefetch_depth = max(int(prefetch_depth), 0)
+
+        if compression_level is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            if compression_level not in ("fastest", "balanced", "smallest"):
+                raise MdfException(f'Unknown compression level "{compression_level}"')
+            self._mdf._compression_level = compression_level
+
+        if append_buffer_size is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._append_buffer_size = max(int(append_buffer_size), 0)
+
+        if append_buffer_samples is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._append_buffer_samples = max(int(append_buffer_samples), 0)
+
+        if append_buffer_interval is not None and isinstance(self._mdf, mdf_v4.MDF4):
+            self._mdf._append_buffer_interval = max(float(append_buffer_interval), 0.0)
+
     @property
     def original_name(self) -> str | Path | None:
         return self._mdf.original_name
@@ -1068,9 +1353,8 @@ class MDF:
                 if progress.stop:
                     raise Terminated
 
-        # walk through all groups and get all channels
-        for i, virtual_group in enumerate(self.virtual_groups):
-            for idx, sigs in enumerate(self._mdf._yield_selected_signals(virtual_group, version=version)):
+        def append_group(virtual_group: int, chunks: Iterable[list[Signal] | list[tuple[NDArray[Any], None]]]) -> None:
+            for idx, sigs in enumerate(chunks):
                 if idx == 0:
                     sigs = typing.cast(list[Signal], sigs)
                     if sigs:
@@ -1090,6 +1374,33 @@ class MDF:
                 if progress and progress.stop:
                     raise Terminated
 
+        read_fragment_size = self._mdf._read_fragment_size or 64 * 1024 * 1024
+
+        def read_group(virtual_group: int) -> list[list[Signal] | list[tuple[NDArray[Any], None]]] | None:
+            # the fragments of the larger groups share the loading buffer, so
+            # they are appended while they are read
+            record_size = sum(
+                self.groups[group_index].channel_group.samples_byte_nr
+                + getattr(self.groups[group_index].channel_group, "invalidation_bytes_nr", 0)
+                for group_index in self.virtual_groups[virtual_group].groups
+            )
+            if self.virtual_groups[virtual_group].cycles_nr * record_size > read_fragment_size:
+                return None
+
+            return list(self._mdf._yield_selected_signals(virtual_group, version=version))
+
+        lock = Lock()
+
+        # walk through all groups and get all channels
+        for i, (virtual_group, chunks) in enumerate(
+            self._iter_groups_in_threads(list(self.virtual_groups), read_group, lock)
+        ):
+            if chunks is None:
+                with lock:
+                    append_group(virtual_group, self._mdf._yield_selected_signals(virtual_group, version=version))
+            else:
+                append_group(virtual_group, chunks)
+
             if progress is not None:
                 if callable(progress):
                     progress(i + 1, groups_nr)
@@ -1158,7 +1469,7 @@ class MDF:
 
         if (
             inplace 
-            and all(not gp.uses_ld for gp in self.groups) 
+            and all(not gp.uses_ld and gp.sorted for gp in self.groups) 
             and self.version>= "4.00"
         ):
             return self._cut_inplace(start=start, stop=stop, whence=whence, progress=progress)
@@ -1202,6 +1513,15 @@ class MDF:
             delta = 0
             out.header.start_time = self.header.start_time
 
+        if start:
+            start_ = f"{start}s"
+        else:
+            start_ = "start of measurement"
+        if stop:
+            stop_ = f"{stop}s"
+        else:
+            stop_ = "end of measurement"
+
         groups_nr = len(self.virtual_groups)
 
         if progress is not None:
@@ -1217,9 +1537,73 @@ class MDF:
             if not included_channels:
                 continue
 
+            record_offset, record_count_ = self._mdf.get_record_range(group_index, start, stop)
+
+            # the data blocks are copied verbatim if the records are not
+            # changed: no time shift and no interpolated samples at the ends
+            if record_count_ and not time_from_zero and list(included_channels) == [group_index]:
+                interpolated_ends = False
+                if include_ends:
+                    record_end = record_offset + record_count_
+                    if start is not None and record_offset:
+                        first = self._mdf.get_master(group_index, record_offset=record_offset, record_count=1)
+                        interpolated_ends = first[0] != start
+                    if stop is not None and record_end < virtual_group.cycles_nr:
+                        last = self._mdf.get_master(group_index, record_offset=record_end - 1, record_count=1)
+                        interpolated_ends = interpolated_ends or last[0] != stop
+
+                if not interpolated_ends and (
+                    passthrough_signals := self._get_passthrough_signals(
+                        group_index, included_channels[group_index], version
+                    )
+                ):
+                    cg = self.groups[group_index].channel_group
+                    cg_nr = out.append(
+                        passthrough_signals,
+                        common_timebase=True,
+                        comment=cg.comment,
+                    )
+                    MDF._transfer_channel_group_data(out.groups[cg_nr].channel_group, cg)
+
+                    mdf = typing.cast(mdf_v4.MDF4, self._mdf)
+                    mdf._copy_records(
+                        mdf.groups[group_index],
+                        typing.cast(mdf_v4.MDF4, out._mdf),
+                        cg_nr,
+                        record_offset,
+                        record_count_,
+                    )
+
+                    if progress is not None:
+                        if callable(progress):
+                            progress(i + 1, groups_nr)
+                        else:
+                            progress.signals.setValue.emit(i + 1)
+
+                            if progress.stop:
+                                raise Terminated
+
+                    continue
+
+            # only load the records inside the cut interval and their neighbours
+            # that are needed for the interpolation at the interval ends
+            if record_offset:
+                record_offset -= 1
+                record_count_ += 1
+            record_count: int | None = min(record_count_ + 1, virtual_group.cycles_nr - record_offset)
+            if record_count == virtual_group.cycles_nr:
+                record_count = None
+
             idx = 0
             signals: list[Signal] = []
-            for j, sigs in enumerate(self._mdf._yield_selected_signals(group_index, groups=included_channels)):
+            for j, sigs in enumerate(
+                self._mdf._yield_selected_signals(
+                    group_index,
+                    groups=included_channels,
+                    record_offset=record_offset,
+                    record_count=record_count,
+                )
+            ):
                 if not sigs:
                     break
                 if j == 0:
@@ -1318,14 +1702,6 @@ class MDF:
                         sig.timestamps = master
 
                 if idx == 0:
-                    if start:
-                        start_ = f"{start}s"
-                    else:
-                        start_ = "start of measurement"
-                    if stop:
-                        stop_ = f"{stop}s"
-                    else:
-                        stop_ = "end of measurement"
                     cg = self.groups[group_index].channel_group
                     cg_nr = out.append(
                         signals,
@@ -1353,14 +1729,6 @@ class MDF:
                     if sig.invalidation_bits is not None:
                         sig.invalidation_bits = InvalidationArray(sig.invalidation_bits[:0])
 
-                if start:
-                    start_ = f"{start}s"
-                else:
-                    start_ = "start of measurement"
-                if stop:
-                    stop_ = f"{stop}s"
-                else:
-                    stop_ = "end of measurement"
                 cg = self.groups[group_index].channel_group
                 cg_nr = out.append(
                     signals,
@@ -1391,7 +1759,9 @@ class MDF:
     ) -> "MDF":
         """Cut `MDF`. `start` and `stop` are absolute values or values relative
         to the first timestamp depending on the `whence` argument. This
-        function is a lot faster than `cut`.
+        function is a lot faster than `cut`: the data blocks inside the cut
+        interval are kept verbatim and only the two blocks that contain the
+        interval limits are decompressed and cut.
 
         .. versionadded:: 8.7.0
 
@@ -1446,155 +1816,24 @@ class MDF:
                 progress.signals.setValue.emit(0)
                 progress.signals.setMaximum.emit(groups_nr)
 
-        for i, group in enumerate(self.groups):
-            
-            channel_group = group.channel_group
-            record_size = channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr
-
-            stream: FileLike | mmap.mmap | tempfile._TemporaryFileWrapper[bytes]
-            if group.data_location == v4c.LOCATION_ORIGINAL_FILE:
-                stream = typing.cast(FileLike | mmap.mmap, self._mdf._file)
-            else:
-                stream = self._mdf._tempfile
-
-            out_seek = self._mdf._tempfile.seek
-            out_tell = self._mdf._tempfile.tell
-            out_write = self._mdf._tempfile.write
-
-            read = stream.read
-            seek = stream.seek
-
-            new_blocks = []
-            new_cycles_nr = 0
-
-            for j, info in enumerate(group.data_blocks):
-                if progress and progress.stop:
-                    raise Terminated
-                (
-                    address,
-                    original_size,
-                    compressed_size,
-                    block_type,
-                    param,
-                    block_limit,
-                ) = (
-                    info.address,
-                    typing.cast(int, info.original_size),
-                    info.compressed_size,
-                    info.block_type,
-                    info.param,
-                    info.block_limit,
-                )
-
-                seek(address)
-                new_data: bytes | memoryview[int] = read(typing.cast(int, compressed_size))
-
-                match block_type:
-                    case v4c.DZ_BLOCK_DEFLATE:
-                        new_data = decompress(new_data, bufsize=original_size)
-                    case v4c.DZ_BLOCK_TRANSPOSED:
-                        new_data = decompress(new_data, bufsize=original_size)
-                        cols = typing.cast(int, param)
-                        lines = original_size // cols
-                        matrix_size = lines * cols
-
-                        if matrix_size != original_size:
-                            new_data = (
-                                frombuffer(new_data[:matrix_size], dtype=uint8)
-                                .reshape((cols, lines))
-                                .T.ravel()
-                                .tobytes()
-                                + new_data[matrix_size:]
-                            )
-                        else:
-                            new_data = frombuffer(new_data, dtype=uint8).reshape((cols, lines)).T.ravel().tobytes()
-
-                    case v4c.DZ_BLOCK_LZ:
-                        new_data = lz_decompress(new_data)
-
-                if block_limit is not None:
-                    new_data = new_data[:block_limit]
-
-                count = len(new_data) // record_size
-
-                fragment = Fragment(
-                    new_data,
-                    0,
-                    count,
-                    None,
-                )
-
-                master = self.get_master(i, data=fragment, one_piece=True)
-
-                if not len(master):
-                    continue
-
-                needs_cutting = True
-
-                if start is None:
-                    start_index = 0
-                    if master[0] > stop:
-                        break
-                    else:
-                        fragment_stop = min(stop, master[-1])
-                        stop_index = np.searchsorted(master, fragment_stop, side="right")
-                        if stop_index == len(master):
-                            needs_cutting = False
-
-                elif stop is None:
-                    start_index = 0
-                    if master[-1] < start:
-                        continue
-                    else:
-                        fragment_start = max(start, master[0])
-                        start_index = np.searchsorted(master, fragment_start, side="left")
-                        stop_index = len(master)
-                        if start_index == 0:
-                            needs_cutting = False
-                else:
-                    if master[0] > stop:
-                        break
-                    elif master[-1] < start:
-                        continue
-                    else:
-                        fragment_start = max(start, master[0])
-                        start_index = np.searchsorted(master, fragment_start, side="left")
-                        fragment_stop = min(stop, master[-1])
-                        stop_index = np.searchsorted(master, fragment_stop, side="right")
-                        if start_index == 0 and stop_index == len(master):
-                            needs_cutting = False
-
-                if needs_cutting:
-                    data = new_data[start_index * record_size : stop_index * record_size]
-                    count = (stop_index - start_index)
+        mdf = typing.cast(mdf_v4.MDF4, self._mdf)
 
-                else:
-                    data = new_data
-                
-                out_seek(0, 2)
-
-                raw_size = len(data)
-                data = lz_compress(data, store_size=True)
-
-                size = len(data)
-                out_seek(0, 2)
-                data_address = out_tell()
-                out_write(data)
-
-                info = DataBlockInfo(
-                        address=data_address,
-                        block_type=v4c.DZ_BLOCK_LZ,
-                        original_size=raw_size,
-                        compressed_size=size,
-                        param=0,
-                    )
+        # the ranges are found before the groups data is replaced because the
+        # groups can use the master channel of another group
+        records_ranges = [
+            None if group.channel_group.flags & v4c.FLAG_CG_VLSD else mdf.get_record_range(i, start, stop)
+            for i, group in enumerate(mdf.groups)
+        ]
 
-                new_blocks.append(info)
-                new_cycles_nr += count
+        for i, (group, records_range) in enumerate(zip(mdf.groups, records_ranges, strict=False)):
+            if progress and progress.stop:
+                raise Terminated
 
-            channel_group.cycles_nr = new_cycles_nr
-            group.data_blocks = new_blocks
-            group.data_location = v4c.LOCATION_TEMPORARY_FILE
+            # the VLSD channel groups are kept unchanged since the records
+            # offsets in the signal data are still valid after the cut
+            if records_range is not None:
+                record_offset, record_count = records_range
+                mdf._copy_records(group, mdf, i, record_offset, record_count)
 
             if progress is not None:
                 if callable(progress):
@@ -1622,6 +1861,9 @@ class MDF:
         record_offset: int = 0,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
+        copy: bool = ...,
     ) -> Signal: ...
 
     @overload
@@ -1639,6 +1881,9 @@ class MDF:
         record_offset: int = 0,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
+        copy: bool = ...,
     ) -> tuple[NDArray[Any], None]: ...
 
     @overload
@@ -1656,6 +1901,9 @@ class MDF:
         record_offset: int = 0,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
+        copy: bool = ...,
     ) -> tuple[NDArray[Any], NDArray[np.bool] | None]: ...
 
     @overload
@@ -1672,6 +1920,9 @@ class MDF:
         record_offset: int = 0,
         record_count: int | None = ...,
         skip_channel_validation: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
+        copy: bool = ...,
     ) -> Signal | tuple[NDArray[Any], NDArray[np.bool] | None]: ...
 
     def get(
@@ -1687,7 +1938,40 @@ class MDF:
         record_offset: int = 0,
         record_count: int | None = None,
         skip_channel_validation: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
+        copy: bool = True,
     ) -> Signal | tuple[NDArray[Any], NDArray[np.bool] | None]:
+        """Get channel samples. See `MDF4.get` and `MDF3.get` for the
+        description of the arguments.
+
+        Parameters
+        ----------
+        start : float, optional
+            Start time of the records range; only the data blocks that overlap
+            the [`start`, `stop`] interval are loaded. If `start` or `stop` is
+            given, the `record_offset` and `record_count` arguments are
+            ignored; both are ignored if `data` is given.
+
+            .. versionadded:: 8.8.0
+
+        stop : float, optional
+            Stop time of the records range.
+
+            .. versionadded:: 8.8.0
+
+        copy : bool, default True
+            If False, return zero-copy read-only samples for memory mapped MDF
+            version 4 files when possible (see `MDF4.get`); this is ignored for
+            MDF version 2 and 3 files.
+
+            .. versionadded:: 8.8.0
+        """
+        if data is None and (start is not None or stop is not None):
+            group, index = self._mdf._validate_channel_selection(name, group, index)
+            name = None
+            record_offset, record_count = self._mdf.get_record_range(group, start, stop)
+
         if isinstance(self._mdf, mdf_v4.MDF4):
             if data is not None and not isinstance(data, Fragment):
                 raise TypeError("'data' must be of type Fragment")
@@ -1704,6 +1988,7 @@ class MDF:
                 record_offset=record_offset,
                 record_count=record_count,
                 skip_channel_validation=skip_channel_validation,
+                copy=copy,
             )
 
         if data is not None and not isinstance(data, tuple):
@@ -2857,35 +3142,60 @@ class MDF:
                     raise Terminated
 
         for i, (group_index, groups) in enumerate(gps.items()):
-            for idx, sigs in enumerate(self._mdf._yield_selected_signals(group_index, groups=groups, version=version)):
-                if not sigs:
-                    break
+            # the data blocks are copied verbatim if all the group channels
+            # are kept and the records layout is unchanged
+            if list(groups) == [group_index] and (
+                passthrough_signals := self._get_passthrough_signals(group_index, groups[group_index], version)
+            ):
+                for sig in passthrough_signals:
+                    entry = sig.group_index, sig.channel_index
+                    if entry in names_map:
+                        sig.name = names_map[entry]
+                cg = self.groups[group_index].channel_group
+                cg_nr = mdf.append(
+                    passthrough_signals,
+                    common_timebase=True,
+                    comment=cg.comment,
+                    acq_name=getattr(cg, "acq_name", None),
+                    acq_source=getattr(cg, "acq_source", None),
+                )
+                MDF._transfer_channel_group_data(mdf.groups[cg_nr].channel_group, cg)
 
-                if idx == 0:
-                    sigs = typing.cast(list[Signal], sigs)
-                    if sigs:
-                        for sig in sigs:
-                            entry = sig.group_index, sig.channel_index
-                            if entry in names_map:
-                                sig.name = names_map[entry]
-                        cg = self.groups[group_index].channel_group
-                        cg_nr = mdf.append(
-                            sigs,
-                            common_timebase=True,
-                            comment=cg.comment,
-                            acq_name=getattr(cg, "acq_name", None),
-                            acq_source=getattr(cg, "acq_source", None),
-                        )
-                        MDF._transfer_channel_group_data(mdf.groups[cg_nr].channel_group, cg)
-                    else:
+                source = typing.cast(mdf_v4.MDF4, self._mdf)
+                source._copy_records(source.groups[group_index], typing.cast(mdf_v4.MDF4, mdf._mdf), cg_nr)
+
+            else:
+                for idx, sigs in enumerate(
+                    self._mdf._yield_selected_signals(group_index, groups=groups, version=version)
+                ):
+                    if not sigs:
                         break
 
-                else:
-                    sigs = typing.cast(list[tuple[NDArray[Any], None]], sigs)
-                    mdf.extend(cg_nr, sigs)
+                    if idx == 0:
+                        sigs = typing.cast(list[Signal], sigs)
+                        if sigs:
+                            for sig in sigs:
+                                entry = sig.group_index, sig.channel_index
+                                if entry in names_map:
+                                    sig.name = names_map[entry]
+                            cg = self.groups[group_index].channel_group
+                            cg_nr = mdf.append(
+                                sigs,
+                                common_timebase=True,
+                                comment=cg.comment,
+                                acq_name=getattr(cg, "acq_name", None),
+                                acq_source=getattr(cg, "acq_source", None),
+                            )
+                            MDF._transfer_channel_group_data(mdf.groups[cg_nr].channel_group, cg)
+                        else:
+                            break
 
-                if progress and progress.stop:
-                    raise Terminated
+                    else:
+                        sigs = typing.cast(list[tuple[NDArray[Any], None]], sigs)
+                        mdf.extend(cg_nr, sigs)
+
+                    if progress and progress.stop:
+                        raise Terminated
 
             if progress is not None:
                 if callable(progress):
@@ -2909,6 +3219,8 @@ class MDF:
         raster: float | None = ...,
         samples_only: Literal[False] = ...,
         raw: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
     ) -> Iterator[Signal]: ...
 
     @overload
@@ -2921,6 +3233,8 @@ class MDF:
         *,
         samples_only: Literal[True],
         raw: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
     ) -> Iterator[tuple[NDArray[Any], NDArray[Any] | None]]: ...
 
     @overload
@@ -2932,6 +3246,8 @@ class MDF:
         raster: float | None = ...,
         samples_only: bool = ...,
         raw: bool = ...,
+        start: float | None = ...,
+        stop: float | None = ...,
     ) -> Iterator[Signal] | Iterator[tuple[NDArray[Any], NDArray[Any] | None]]: ...
 
     def iter_get(
@@ -2942,6 +3258,8 @@ class MDF:
         raster: float | None = None,
         samples_only: bool = False,
         raw: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
     ) -> Iterator[Signal] | Iterator[tuple[NDArray[Any], NDArray[Any] | None]]:
         """Iterator over a channel.
 
@@ -2965,13 +3283,32 @@ class MDF:
             return a `Signal` object.
         raw : bool, default False
             Return channel samples without applying the conversion rule.
+        start : float, optional
+            Start time; only the records inside the [`start`, `stop`] interval
+            are yielded.
+
+            .. versionadded:: 8.8.0
+
+        stop : float, optional
+            Stop time.
+
+            .. versionadded:: 8.8.0
         """
 
         gp_nr, ch_nr = self._mdf._validate_channel_selection(name, group, index)
 
         grp = self.groups[gp_nr]
 
-        data = self._mdf._load_data(grp)  # type: ignore[arg-type]
+        if start is None and stop is None:
+            data = self._mdf._load_data(grp)  # type: ignore[arg-type]
+        else:
+            record_offset, record_count = self._mdf.get_record_range(gp_nr, start, stop)
+            if not record_count:
+                return
+
+            data = self._mdf._load_data(  # type: ignore[arg-type]
+                grp, record_offset=record_offset, record_count=record_count
+            )
 
         for fragment in data:
             yield self.get(
@@ -2984,6 +3321,63 @@ class MDF:
                 raw=raw,
             )
 
+    def get_chunked(
+        self,
+        name: str | None = None,
+        group: int | None = None,
+        index: int | None = None,
+        raw: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
+    ) -> ChunkedSignal:
+        """Get a channel as a `ChunkedSignal`; the samples are read from the
+        file one fragment at a time, only when they are needed, so that
+        channels that do not fit in the memory can be processed.
+
+        The fragment size is given by the `read_fragment_size` option (see
+        `configure`).
+
+        .. versionadded:: 8.8.0
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of channel.
+        group : int, optional
+            0-based group index.
+        index : int, optional
+            0-based channel index.
+        raw : bool, default False
+            The chunks hold the raw samples; the conversion is applied by the
+            reductions and the arithmetic operators of the `ChunkedSignal`.
+        start : float, optional
+            Start time; only the records inside the [`start`, `stop`] interval
+            are read.
+        stop : float, optional
+            Stop time.
+
+        Returns
+        -------
+        signal : ChunkedSignal
+            Chunked signal; no samples are read by this method.
+        """
+        gp_nr, ch_nr = self._mdf._validate_channel_selection(name, group, index)
+
+        # the metadata is taken from a signal without samples
+        signal = self.get(group=gp_nr, index=ch_nr, raw=True, record_count=0)
+
+        return ChunkedSignal._from_file(
+            self,
+            gp_nr,
+            ch_nr,
+            raw=raw,
+            start=start,
+            stop=stop,
+            name=signal.name,
+            unit=signal.unit,
+            comment=signal.comment,
+        )
+
     @staticmethod
     def concatenate(
         files: Sequence[Union["MDF", FileLike, StrPath]],
@@ -3000,6 +3394,12 @@ class MDF:
         The order of the input files is always preserved, only the samples'
         timestamps are influenced by the `sync` argument.
 
+        The structure of all the files is checked using their metadata before
+        any samples are written, and the next file is loaded while the
+        current file is written. The data blocks of MDF v4 groups with the same records layout are
+        copied without decoding them if the samples' timestamps are not
+        changed.
+
         Parameters
         ----------
         files : list | tuple
@@ -3132,314 +3532,383 @@ class MDF:
                 dict_conversion[f"text_{i}"] = str(file._mdf.original_name if isinstance(file, MDF) else str(file))
             origin_conversion = from_dict(dict_conversion)
 
-        for mdf_index, (offset, file) in enumerate(zip(offsets, files, strict=False)):
-            if not isinstance(file, MDF):
-                mdf = MDF(file, use_display_names=use_display_names)
-                close = True
-            else:
-                mdf = file
-                close = False
+        # the structure of all the files is checked using only their metadata
+        # before any samples are written; each file is closed right after it
+        # is checked, and the next file is opened while the current one is
+        # checked
+        vlds_channels: list[tuple[tuple[int, str], int, int]] = []
+        max_vlsd_length: dict[tuple[int, str], int] = {}
 
-            if progress is not None and not callable(progress):
-                progress.signals.setLabelText.emit(
-                    f"Concatenating the file {mdf_index + 1} of {mdf_nr}\n{mdf._mdf.original_name}"
-                )
+        for mdf_index, (mdf, close) in enumerate(
+            MDF._iter_opened_files(files, use_display_names=use_display_names, lazy_channel_metadata=True)
+        ):
+            try:
+                if mdf_index == 0:
+                    groups_nr = len(mdf.virtual_groups)
+                    structure = sorted(mdf._get_channel_groups_structure())
 
-            if mdf_index == 0:
-                version = validate_version_argument(version)
-                first_version = mdf.version
+                    if isinstance(mdf._mdf, mdf_v4.MDF4):
+                        for _gp_idx, _gp in enumerate(mdf._mdf.groups):
+                            for _ch_idx, _ch in enumerate(_gp.channels):
+                                if _ch.channel_type == v4c.CHANNEL_TYPE_VLSD:
+                                    key = (_gp_idx, _ch.name)
+                                    max_vlsd_length[key] = 0
 
-                kwargs = dict(mdf._mdf._kwargs)  # type: ignore[assignment]
+                                    for _second_gp_idx, _second_ch_idx in mdf.whereis(_ch.name):
+                                        if _second_gp_idx == _gp_idx:
+                                            vlds_channels.append((key, _second_gp_idx, _second_ch_idx))
+                                            break
 
-                merged = MDF(
-                    version=version,
-                    **mdf._mdf._kwargs.copy(),
-                )
+                else:
+                    _structure = mdf._get_channel_groups_structure()
+                    if len(_structure) != groups_nr:
+                        raise MdfException(
+                            f"internal structure of file <{mdf.name}> is different; different channel groups count"
+                        )
+                    elif sorted(_structure) != structure:
+                        raise MdfException(f"internal structure of file {mdf_index} is different; different channels")
 
-                merged.configure(from_other=mdf)
+                if vlds_channels:
+                    mdf._mdf.determine_max_vlsd_sample_size.cache_clear()
 
-                merged.header.start_time = oldest
+                    for key, _gp_idx, _ch_idx in vlds_channels:
+                        max_vlsd_length[key] = max(
+                            max_vlsd_length[key],
+                            mdf._mdf.determine_max_vlsd_sample_size(_gp_idx, _ch_idx),
+                        )
+            finally:
+                if close:
+                    mdf.close()
 
-            reorder_channel_groups = False
-            cg_translations: dict[int, int | None] = {}
+        # the next input file is opened while the current one is written
+        inputs = MDF._iter_opened_files(files, use_display_names=use_display_names)
+        first_mdf, first_close = next(inputs)
 
-            vlsd_max_length: dict[tuple[int, str], int] = {}
+        version = validate_version_argument(version)
+        first_version = first_mdf.version
 
-            if mdf_index == 0:
-                last_timestamps = [None for gp in mdf.virtual_groups]
-                groups_nr = len(last_timestamps)
-                first_mdf = mdf
+        kwargs = dict(first_mdf._mdf._kwargs)  # type: ignore[assignment]
 
-                if progress is not None:
-                    if callable(progress):
-                        progress(0, groups_nr * mdf_nr)
-                    else:
-                        progress.signals.setValue.emit(0)
-                        progress.signals.setMaximum.emit(groups_nr * mdf_nr)
+        merged = MDF(
+            version=version,
+            **first_mdf._mdf._kwargs.copy(),
+        )
 
-                        if progress.stop:
-                            raise Terminated
+        merged.configure(from_other=first_mdf)
 
-                if isinstance(first_mdf._mdf, mdf_v4.MDF4):
-                    w_mdf = first_mdf
+        merged.header.start_time = oldest
 
-                    vlds_channels: list[tuple[str, int, int]] = []
+        # the channel groups of the first file are used to match the channel
+        # groups of the next files after the first file is closed
+        first_channel_groups = [group.channel_group for group in first_mdf.groups]
 
-                    for _gp_idx, _gp in enumerate(first_mdf._mdf.groups):
-                        for _ch_idx, _ch in enumerate(_gp.channels):
-                            if _ch.channel_type == v4c.CHANNEL_TYPE_VLSD:
-                                vlds_channels.append((_ch.name, _gp_idx, _ch_idx))
+        try:
+            for mdf_index, ((mdf, close), offset) in enumerate(
+                zip(chain([(first_mdf, first_close)], inputs), offsets, strict=False)
+            ):
+                if progress is not None and not callable(progress):
+                    progress.signals.setLabelText.emit(
+                        f"Concatenating the file {mdf_index + 1} of {mdf_nr}\n{mdf._mdf.original_name}"
+                    )
 
-                                vlsd_max_length[(_gp_idx, _ch.name)] = 0
+                reorder_channel_groups = False
+                cg_translations: dict[int, int | None] = {}
 
-                    if vlsd_max_length:
-                        for i, _file in enumerate(files):
-                            if not isinstance(_file, MDF):
-                                _close = True
-                                _file = MDF(_file)
-                            else:
-                                _close = False
+                vlsd_max_length: dict[tuple[int, str], int] = {}
 
-                            _file._mdf.determine_max_vlsd_sample_size.cache_clear()
+                if mdf_index == 0:
+                    last_timestamps = [None for gp in mdf.virtual_groups]
 
-                            for _ch_name, _gp_idx, _ch_idx in vlds_channels:
-                                key = (_gp_idx, _ch_name)
-                                for _second_gp_idx, _second_ch_idx in w_mdf.whereis(_ch_name):
-                                    if _second_gp_idx == _gp_idx:
-                                        vlsd_max_length[key] = max(
-                                            vlsd_max_length[key],
-                                            _file._mdf.determine_max_vlsd_sample_size(_second_gp_idx, _second_ch_idx),
-                                        )
-                                        break
-                                else:
-                                    raise MdfException(
-                                        f"internal structure of file {i} is different; different channels"
-                                    )
+                    if progress is not None:
+                        if callable(progress):
+                            progress(0, groups_nr * mdf_nr)
+                        else:
+                            progress.signals.setValue.emit(0)
+                            progress.signals.setMaximum.emit(groups_nr * mdf_nr)
 
-                            if _close:
-                                _file.close()
+                            if progress.stop:
+                                raise Terminated
+
+                    # the VLSD channels are sized using all the input files
+                    vlsd_max_length = max_vlsd_length
 
-            else:
-                if len(mdf.virtual_groups) != groups_nr:
-                    raise MdfException(
-                        f"internal structure of file <{mdf.name}> is different; different channel groups count"
-                    )
                 else:
-                    cg_translations = dict.fromkeys(range(groups_nr))
+                    if len(mdf.virtual_groups) != groups_nr:
+                        raise MdfException(
+                            f"internal structure of file <{mdf.name}> is different; different channel groups count"
+                        )
+                    else:
+                        cg_translations = dict.fromkeys(range(groups_nr))
+
+                        make_translation = False
 
-                    make_translation = False
+                        # check if the order of the channel groups is the same
+                        for i, group_index in enumerate(mdf.virtual_groups):
+                            included_channels = mdf.included_channels(group_index)[group_index]
+                            names = [
+                                mdf.groups[gp_index].channels[ch_index].name
+                                for gp_index, channels in included_channels.items()
+                                for ch_index in channels
+                            ]
+
+                            if names != included_channel_names[i]:
+                                if sorted(names) != sorted(included_channel_names[i]):
+                                    make_translation = reorder_channel_groups = True
+                                    break
 
-                    # check if the order of the channel groups is the same
-                    for i, group_index in enumerate(mdf.virtual_groups):
-                        included_channels = mdf.included_channels(group_index)[group_index]
+                        # Make a channel group translation dictionary if the order is different
+                        if make_translation:
+                            first_channel_groups = typing.cast(list[v4b.ChannelGroup], first_channel_groups)
+                            mdf._mdf = typing.cast(mdf_v4.MDF4, mdf._mdf)
+                            for i, org_channel_group in enumerate(first_channel_groups):
+                                org_group_source = org_channel_group.acq_source
+                                for j, new_group in enumerate(mdf._mdf.groups):
+                                    new_group_source = new_group.channel_group.acq_source
+                                    if (
+                                        new_group.channel_group.acq_name == org_channel_group.acq_name
+                                        and (new_group_source and org_group_source)
+                                        and new_group_source.name == org_group_source.name
+                                        and new_group_source.path == org_group_source.path
+                                        and new_group.channel_group.samples_byte_nr == org_channel_group.samples_byte_nr
+                                    ):
+                                        new_included_channels = mdf.included_channels(j)[j]
+
+                                        new_names = [
+                                            mdf.groups[gp_index].channels[ch_index].name
+                                            for gp_index, channels in new_included_channels.items()
+                                            for ch_index in channels
+                                        ]
+
+                                        if sorted(new_names) == sorted(included_channel_names[i]):
+                                            cg_translations[i] = j
+                                            break
+
+                for i, group_index in enumerate(mdf.virtual_groups):
+                    # save original group index for extension
+                    # replace with the translated group index
+                    if reorder_channel_groups:
+                        cg_trans = typing.cast(dict[int, int], cg_translations)
+                        origin_gp_idx = group_index
+                        group_index = cg_trans[group_index]
+
+                    included_channels = mdf.included_channels(group_index)[group_index]
+
+                    if mdf_index == 0:
+                        included_channel_names.append(
+                            [
+                                mdf.groups[gp_index].channels[ch_index].name
+                                for gp_index, channels in included_channels.items()
+                                for ch_index in channels
+                            ]
+                        )
+                        different_channel_order = False
+                    else:
                         names = [
                             mdf.groups[gp_index].channels[ch_index].name
                             for gp_index, channels in included_channels.items()
                             for ch_index in channels
                         ]
-
+                        different_channel_order = False
                         if names != included_channel_names[i]:
                             if sorted(names) != sorted(included_channel_names[i]):
-                                make_translation = reorder_channel_groups = True
-                                break
-
-                    # Make a channel group translation dictionary if the order is different
-                    if make_translation:
-                        first_mdf._mdf = typing.cast(mdf_v4.MDF4, first_mdf._mdf)
-                        mdf._mdf = typing.cast(mdf_v4.MDF4, mdf._mdf)
-                        for i, org_group in enumerate(first_mdf._mdf.groups):
-                            org_group_source = org_group.channel_group.acq_source
-                            for j, new_group in enumerate(mdf._mdf.groups):
-                                new_group_source = new_group.channel_group.acq_source
-                                if (
-                                    new_group.channel_group.acq_name == org_group.channel_group.acq_name
-                                    and (new_group_source and org_group_source)
-                                    and new_group_source.name == org_group_source.name
-                                    and new_group_source.path == org_group_source.path
-                                    and new_group.channel_group.samples_byte_nr
-                                    == org_group.channel_group.samples_byte_nr
-                                ):
-                                    new_included_channels = mdf.included_channels(j)[j]
-
-                                    new_names = [
-                                        mdf.groups[gp_index].channels[ch_index].name
-                                        for gp_index, channels in new_included_channels.items()
-                                        for ch_index in channels
-                                    ]
-
-                                    if sorted(new_names) == sorted(included_channel_names[i]):
-                                        cg_translations[i] = j
-                                        break
-
-            for i, group_index in enumerate(mdf.virtual_groups):
-                # save original group index for extension
-                # replace with the translated group index
-                if reorder_channel_groups:
-                    cg_trans = typing.cast(dict[int, int], cg_translations)
-                    origin_gp_idx = group_index
-                    group_index = cg_trans[group_index]
-
-                included_channels = mdf.included_channels(group_index)[group_index]
-
-                if mdf_index == 0:
-                    included_channel_names.append(
-                        [
-                            mdf.groups[gp_index].channels[ch_index].name
-                            for gp_index, channels in included_channels.items()
-                            for ch_index in channels
-                        ]
-                    )
-                    different_channel_order = False
-                else:
-                    names = [
-                        mdf.groups[gp_index].channels[ch_index].name
-                        for gp_index, channels in included_channels.items()
-                        for ch_index in channels
-                    ]
-                    different_channel_order = False
-                    if names != included_channel_names[i]:
-                        if sorted(names) != sorted(included_channel_names[i]):
-                            raise MdfException(
-                                f"internal structure of file {mdf_index} is different; different channels"
-                            )
-                        else:
-                            original_names = included_channel_names[i]
-                            different_channel_order = True
-                            remap = [original_names.index(name) for name in names]
-
-                if not included_channels:
-                    continue
+                                raise MdfException(
+                                    f"internal structure of file {mdf_index} is different; different channels"
+                                )
+                            else:
+                                original_names = included_channel_names[i]
+                                different_channel_order = True
+                                remap = [original_names.index(name) for name in names]
 
-                last_timestamp = last_timestamps[i]
-                first_timestamp = None
-                original_first_timestamp = None
+                    if not included_channels:
+                        continue
 
-                mdf._mdf.vlsd_max_length.clear()
-                mdf._mdf.vlsd_max_length.update(vlsd_max_length)
+                    last_timestamp = last_timestamps[i]
+                    first_timestamp = None
+                    original_first_timestamp = None
+
+                    # the data blocks are copied verbatim if the samples timestamps
+                    # are not changed and the records layout is the same
+                    if (
+                        not offset
+                        and not add_samples_origin
+                        and not direct_timestamp_continuation
+                        and not reorder_channel_groups
+                        and not different_channel_order
+                        and isinstance(mdf._mdf, mdf_v4.MDF4)
+                        and list(included_channels) == [group_index]
+                    ):
+                        source = mdf._mdf
+                        channels = included_channels[group_index]
+                        passthrough = False
 
-                for idx, signals in enumerate(mdf._mdf._yield_selected_signals(group_index, groups=included_channels)):
-                    if not signals:
-                        break
-                    if mdf_index == 0 and idx == 0:
-                        signals = typing.cast(list[Signal], signals)
-                        first_signal = signals[0]
-                        if len(first_signal):
-                            if offset > 0:
-                                timestamps = first_signal.timestamps + offset
-                                for sig in signals:
-                                    sig.timestamps = timestamps
-                            last_timestamp = first_signal.timestamps[-1]
-                            first_timestamp = first_signal.timestamps[0]
-                            original_first_timestamp = first_timestamp
-
-                        if add_samples_origin:
-                            signals.append(
-                                Signal(
-                                    samples=np.ones(len(first_signal), dtype="<u2") * mdf_index,
-                                    timestamps=first_signal.timestamps,
-                                    conversion=origin_conversion,
-                                    name="__samples_origin",
+                        if mdf_index == 0:
+                            if passthrough_signals := mdf._get_passthrough_signals(
+                                group_index, channels, merged.version
+                            ):
+                                cg = source.groups[group_index].channel_group
+                                cg_nr = merged.append(
+                                    passthrough_signals,
+                                    common_timebase=True,
                                 )
+                                MDF._transfer_channel_group_data(merged.groups[cg_nr].channel_group, cg)
+                                cg_map[group_index] = cg_nr
+                                passthrough = True
+
+                        elif isinstance(merged._mdf, mdf_v4.MDF4):
+                            cg_nr = cg_map[group_index]
+                            layout = source._get_record_layout(group_index, channels)
+                            if layout is not None and layout == merged._mdf._get_record_layout(cg_nr):
+                                master = source.get_master(group_index, record_count=1)
+                                passthrough = last_timestamp is None or not len(master) or last_timestamp < master[0]
+
+                        if passthrough:
+                            cycles_nr = source.groups[group_index].channel_group.cycles_nr
+                            source._copy_records(
+                                source.groups[group_index],
+                                typing.cast(mdf_v4.MDF4, merged._mdf),
+                                cg_map[group_index],
+                                append=mdf_index > 0,
                             )
+                            if cycles_nr:
+                                last_timestamps[i] = source.get_master(
+                                    group_index, record_offset=cycles_nr - 1, record_count=1
+                                )[0]
+                            continue
 
-                        cg = mdf.groups[group_index].channel_group
-                        cg_nr = merged.append(
-                            signals,
-                            common_timebase=True,
-                        )
-                        MDF._transfer_channel_group_data(merged.groups[cg_nr].channel_group, cg)
-                        cg_map[group_index] = cg_nr
+                    mdf._mdf.vlsd_max_length.clear()
+                    mdf._mdf.vlsd_max_length.update(vlsd_max_length)
 
-                    else:
-                        if different_channel_order:
-                            new_signals = [
-                                typing.cast(Signal | tuple[NDArray[Any], None] | None, None) for _ in signals
-                            ]
-                            if idx == 0:
-                                signals = typing.cast(list[Signal], signals)
-                                for new_index, sig in zip(remap, signals, strict=False):
-                                    new_signals[new_index] = sig
-                            else:
-                                signals = typing.cast(list[tuple[NDArray[Any], None]], signals)
-                                for new_index, signal_samples in zip(remap, signals[1:], strict=False):
-                                    new_signals[new_index + 1] = signal_samples
-                                new_signals[0] = signals[0]
+                    for idx, signals in enumerate(
+                        mdf._mdf._yield_selected_signals(group_index, groups=included_channels)
+                    ):
+                        if not signals:
+                            break
+                        if mdf_index == 0 and idx == 0:
+                            signals = typing.cast(list[Signal], signals)
+                            first_signal = signals[0]
+                            if len(first_signal):
+                                if offset > 0:
+                                    timestamps = first_signal.timestamps + offset
+                                    for sig in signals:
+                                        sig.timestamps = timestamps
+                                last_timestamp = first_signal.timestamps[-1]
+                                first_timestamp = first_signal.timestamps[0]
+                                original_first_timestamp = first_timestamp
 
-                            signals = typing.cast(list[Signal] | list[tuple[NDArray[Any], None]], new_signals)
+                            if add_samples_origin:
+                                signals.append(
+                                    Signal(
+                                        samples=np.ones(len(first_signal), dtype="<u2") * mdf_index,
+                                        timestamps=first_signal.timestamps,
+                                        conversion=origin_conversion,
+                                        name="__samples_origin",
+                                    )
+                                )
+
+                            cg = mdf.groups[group_index].channel_group
+                            cg_nr = merged.append(
+                                signals,
+                                common_timebase=True,
+                            )
+                            MDF._transfer_channel_group_data(merged.groups[cg_nr].channel_group, cg)
+                            cg_map[group_index] = cg_nr
 
-                        if idx == 0:
-                            signals = typing.cast(list[Signal], signals)
-                            signals_samples = [(signals[0].timestamps, typing.cast(NDArray[np.bool] | None, None))] + [
-                                (sig.samples, sig.invalidation_bits) for sig in signals
-                            ]
                         else:
-                            signals_samples = typing.cast(list[tuple[NDArray[Any], NDArray[np.bool] | None]], signals)
+                            if different_channel_order:
+                                new_signals = [
+                                    typing.cast(Signal | tuple[NDArray[Any], None] | None, None) for _ in signals
+                                ]
+                                if idx == 0:
+                                    signals = typing.cast(list[Signal], signals)
+                                    for new_index, sig in zip(remap, signals, strict=False):
+                                        new_signals[new_index] = sig
+                                else:
+                                    signals = typing.cast(list[tuple[NDArray[Any], None]], signals)
+                                    for new_index, signal_samples in zip(remap, signals[1:], strict=False):
+                                        new_signals[new_index + 1] = signal_samples
+                                    new_signals[0] = signals[0]
 
-                        master = signals_samples[0][0]
-                        _copied = False
+                                signals = typing.cast(list[Signal] | list[tuple[NDArray[Any], None]], new_signals)
 
-                        if len(master):
-                            if original_first_timestamp is None:
-                                original_first_timestamp = master[0]
-                            if offset > 0:
-                                master = master + offset
-                                _copied = True
-                            if last_timestamp is None:
-                                last_timestamp = master[-1]
+                            if idx == 0:
+                                signals = typing.cast(list[Signal], signals)
+                                signals_samples = [
+                                    (signals[0].timestamps, typing.cast(NDArray[np.bool] | None, None))
+                                ] + [(sig.samples, sig.invalidation_bits) for sig in signals]
                             else:
-                                if last_timestamp >= master[0] or direct_timestamp_continuation:
-                                    if len(master) >= 2:
-                                        delta = master[1] - master[0]
-                                    else:
-                                        delta = 0.001
-                                    if _copied:
-                                        master -= master[0]
-                                    else:
-                                        master = master - master[0]
-                                        _copied = True
-                                    master += last_timestamp + delta
-                                last_timestamp = master[-1]
-
-                            signals_samples[0] = master, None
+                                signals_samples = typing.cast(
+                                    list[tuple[NDArray[Any], NDArray[np.bool] | None]], signals
+                                )
 
-                            if add_samples_origin:
-                                signals_samples.append(
-                                    (
-                                        np.ones(len(master), dtype="<u2") * mdf_index,
-                                        None,
+                            master = signals_samples[0][0]
+                            _copied = False
+
+                            if len(master):
+                                if original_first_timestamp is None:
+                                    original_first_timestamp = master[0]
+                                if offset > 0:
+                                    master = master + offset
+                                    _copied = True
+                                if last_timestamp is None:
+                                    last_timestamp = master[-1]
+                                else:
+                                    if last_timestamp >= master[0] or direct_timestamp_continuation:
+                                        if len(master) >= 2:
+                                            delta = master[1] - master[0]
+                                        else:
+                                            delta = 0.001
+                                        if _copied:
+                                            master -= master[0]
+                                        else:
+                                            master = master - master[0]
+                                            _copied = True
+                                        master += last_timestamp + delta
+                                    last_timestamp = master[-1]
+
+                                signals_samples[0] = master, None
+
+                                if add_samples_origin:
+                                    signals_samples.append(
+                                        (
+                                            np.ones(len(master), dtype="<u2") * mdf_index,
+                                            None,
+                                        )
                                     )
-                                )
-                            cg_nr = cg_map[group_index]
-                            # set the original channel group number back for extension
-                            if reorder_channel_groups:
-                                cg_nr = cg_map[origin_gp_idx]
-                            merged.extend(cg_nr, signals_samples)
+                                cg_nr = cg_map[group_index]
+                                # set the original channel group number back for extension
+                                if reorder_channel_groups:
+                                    cg_nr = cg_map[origin_gp_idx]
+                                merged.extend(cg_nr, signals_samples)
 
-                            if first_timestamp is None:
-                                first_timestamp = master[0]
+                                if first_timestamp is None:
+                                    first_timestamp = master[0]
 
-                    if progress and progress.stop:
-                        raise Terminated
+                        if progress and progress.stop:
+                            raise Terminated
 
-                last_timestamps[i] = last_timestamp
+                    last_timestamps[i] = last_timestamp
 
-            if mdf_index == 0:
-                merged._transfer_metadata(mdf)
+                if mdf_index == 0:
+                    merged._transfer_metadata(mdf)
 
-            if progress is not None:
-                if callable(progress):
-                    progress(i + 1 + mdf_index * groups_nr, mdf_nr * groups_nr)
-                else:
-                    progress.signals.setValue.emit(i + 1 + mdf_index * groups_nr)
+                if progress is not None:
+                    if callable(progress):
+                        progress(i + 1 + mdf_index * groups_nr, mdf_nr * groups_nr)
+                    else:
+                        progress.signals.setValue.emit(i + 1 + mdf_index * groups_nr)
 
-                    if progress.stop:
-                        raise Terminated
+                        if progress.stop:
+                            raise Terminated
 
-            if close and mdf_index:
+                if close:
+                    mdf.close()
+        except:
+            merged.close()
+            if close:
                 mdf.close()
-
-        if not isinstance(files[0], MDF):
-            first_mdf.close()
+            # closes the file that was opened in advance
+            inputs.close()
+            raise
 
         try:
             if kwargs.get("process_bus_logging", True):
@@ -3511,8 +3980,6 @@ class MDF:
 
         files_nr = len(files)
 
-        input_types = [isinstance(mdf, MDF) for mdf in files]
-
         if progress is not None:
             if callable(progress):
                 progress(0, files_nr)
@@ -3548,10 +4015,10 @@ class MDF:
         else:
             offsets = [0 for file in files]
 
-        for mdf_index, (offset, mdf) in enumerate(zip(offsets, files, strict=False)):
-            if not isinstance(mdf, MDF):
-                mdf = MDF(mdf, use_display_names=use_display_names)
+        # the next input file is opened while the current one is written
+        inputs = MDF._iter_opened_files(files, use_display_names=use_display_names)
 
+        for mdf_index, ((mdf, close), offset) in enumerate(zip(inputs, offsets, strict=False)):
             if progress is not None:
                 progress.signals.setLabelText.emit(f"Stacking file {mdf_index + 1} of {files_nr}\n{mdf.name.name}")
 
@@ -3577,34 +4044,55 @@ class MDF:
                 if not included_channels:
                     continue
 
-                for idx, signals in enumerate(
-                    mdf._mdf._yield_selected_signals(group, groups=included_channels, version=version)
+                dg_cntr: int | None = None
+
+                # the data blocks are copied verbatim if the samples timestamps
+                # are not changed and the records layout is the same
+                if (
+                    not offset
+                    and list(included_channels) == [group]
+                    and (passthrough_signals := mdf._get_passthrough_signals(group, included_channels[group], version))
                 ):
-                    if not signals:
-                        break
-                    if idx == 0:
-                        signals = typing.cast(list[Signal], signals)
-                        if sync:
-                            timestamps = signals[0].timestamps + offset
-                            for sig in signals:
-                                sig.timestamps = timestamps
-                        cg = mdf.groups[group].channel_group
-                        dg_cntr = stacked.append(
-                            signals,
-                            common_timebase=True,
-                        )
-                        MDF._transfer_channel_group_data(stacked.groups[dg_cntr].channel_group, cg)
-                    else:
-                        signals_samples = typing.cast(list[tuple[NDArray[Any], None]], signals)
-                        master = signals_samples[0][0]
-                        if sync:
-                            master = master + offset
-                            signals_samples[0] = master, None
+                    cg = mdf.groups[group].channel_group
+                    dg_cntr = stacked.append(
+                        passthrough_signals,
+                        common_timebase=True,
+                    )
+                    MDF._transfer_channel_group_data(stacked.groups[dg_cntr].channel_group, cg)
 
-                        stacked.extend(dg_cntr, signals_samples)
+                    source = typing.cast(mdf_v4.MDF4, mdf._mdf)
+                    source._copy_records(source.groups[group], typing.cast(mdf_v4.MDF4, stacked._mdf), dg_cntr)
 
-                    if progress and progress.stop:
-                        raise Terminated
+                else:
+                    # the group is decoded and appended one fragment at a time
+                    for idx, signals in enumerate(
+                        mdf._mdf._yield_selected_signals(group, groups=included_channels, version=version)
+                    ):
+                        if not signals:
+                            break
+                        if idx == 0:
+                            signals = typing.cast(list[Signal], signals)
+                            if sync:
+                                timestamps = signals[0].timestamps + offset
+                                for sig in signals:
+                                    sig.timestamps = timestamps
+                            cg = mdf.groups[group].channel_group
+                            dg_cntr = stacked.append(
+                                signals,
+                                common_timebase=True,
+                            )
+                            MDF._transfer_channel_group_data(stacked.groups[dg_cntr].channel_group, cg)
+                        else:
+                            signals_samples = typing.cast(list[tuple[NDArray[Any], None]], signals)
+                            master = signals_samples[0][0]
+                            if sync:
+                                master = master + offset
+                                signals_samples[0] = master, None
+
+                            stacked.extend(typing.cast(int, dg_cntr), signals_samples)
+
+                        if progress and progress.stop:
+                            raise Terminated
 
                 if dg_cntr is not None:
                     for index in range(dg_cntr, len(stacked.groups)):
@@ -3624,7 +4112,7 @@ class MDF:
             if mdf_index == 0:
                 stacked._transfer_metadata(mdf)
 
-            if not input_types[mdf_index]:
+            if close:
                 mdf.close()
 
             if progress is not None and progress.stop:
@@ -3981,7 +4469,7 @@ class MDF:
             new_raster = None
             mdf.header.start_time = self.header.start_time
 
-        for i, (group_index, virtual_group) in enumerate(self.virtual_groups.items()):
+        def read_group(group_index: int) -> list[Signal]:
             channels = [
                 (None, gp_index, ch_index)
                 for gp_index, channel_indexes in self.included_channels(group_index)[group_index].items()
@@ -3989,24 +4477,31 @@ class MDF:
             ]
 
             if not channels:
-                continue
+                return []
 
-            sigs = self.select(channels, raw=True)
+            return self.select(channels, raw=True)
 
-            sigs = [
-                sig.interp(
-                    raster,
-                    integer_interpolation_mode=integer_interpolation_mode,
-                    float_interpolation_mode=float_interpolation_mode,
-                )
-                for sig in sigs
-            ]
+        def resample_group(group_index: int, sigs: list[Signal]) -> list[Signal]:
+            sigs = interp_signals(
+                sigs,
+                raster,
+                integer_interpolation_mode=integer_interpolation_mode,
+                float_interpolation_mode=float_interpolation_mode,
+            )
 
             if new_raster is not None:
                 for sig in sigs:
                     if len(sig):
                         sig.timestamps = new_raster
 
+            return sigs
+
+        for i, (group_index, sigs) in enumerate(
+            self._iter_groups_in_threads(list(self.virtual_groups), read_group, Lock(), resample_group)
+        ):
+            if not sigs:
+                continue
+
             cg = self.groups[group_index].channel_group
             dg_cntr = mdf.append(
                 sigs,
@@ -4037,6 +4532,8 @@ class MDF:
         ignore_value2text_conversions: bool = False,
         record_count: int | None = None,
         validate: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
     ) -> list[Signal]:
         """Retrieve the channels listed in the `channels` argument as `Signal`
         objects.
@@ -4085,6 +4582,19 @@ class MDF:
 
             .. versionadded:: 5.16.0
 
+        start : float, optional
+            Start time; only the records of each channel group that are inside
+            the [`start`, `stop`] interval are loaded. If `start` or `stop` is
+            given, the `record_offset` and `record_count` arguments are
+            ignored.
+
+            .. versionadded:: 8.8.0
+
+        stop : float, optional
+            Stop time.
+
+            .. versionadded:: 8.8.0
+
         Returns
         -------
         signals : list
@@ -4142,10 +4652,20 @@ class MDF:
             or not self._mdf._mapped_file
             or record_offset
             or record_count is not None
+            or start is not None
+            or stop is not None
             or True  # disable for now
         ):
             return self._select_fallback(
-                channels, record_offset, raw, copy_master, ignore_value2text_conversions, record_count, validate
+                channels,
+                record_offset,
+                raw,
+                copy_master,
+                ignore_value2text_conversions,
+                record_count,
+                validate,
+                start,
+                stop,
             )
 
         if isinstance(raw, dict):
@@ -4160,7 +4680,15 @@ class MDF:
         for virtual_group, groups in virtual_groups.items():
             if len(self._mdf.virtual_groups[virtual_group].groups) > 1:
                 return self._select_fallback(
-                    channels, record_offset, raw, copy_master, ignore_value2text_conversions, record_count, validate
+                    channels,
+                    record_offset,
+                    raw,
+                    copy_master,
+                    ignore_value2text_conversions,
+                    record_count,
+                    validate,
+                    start,
+                    stop,
                 )
 
         output_signals: dict[tuple[int, int], Signal] = {}
@@ -4179,7 +4707,15 @@ class MDF:
             master_index = self.masters_db.get(group_index, None)
             if master_index is None or grp.record[master_index] is None:
                 return self._select_fallback(
-                    channels, record_offset, raw, copy_master, ignore_value2text_conversions, record_count, validate
+                    channels,
+                    record_offset,
+                    raw,
+                    copy_master,
+                    ignore_value2text_conversions,
+                    record_count,
+                    validate,
+                    start,
+                    stop,
                 )
 
             channel = grp.channels[master_index]
@@ -4194,7 +4730,15 @@ class MDF:
                 if (info := grp.record[ch_index]) is None:
                     print("NASOl")
                     return self._select_fallback(
-                        channels, record_offset, raw, copy_master, ignore_value2text_conversions, record_count, validate
+                        channels,
+                        record_offset,
+                        raw,
+                        copy_master,
+                        ignore_value2text_conversions,
+                        record_count,
+                        validate,
+                        start,
+                        stop,
                     )
                 else:
                     _, byte_size, byte_offset, _ = info
@@ -4207,7 +4751,7 @@ class MDF:
                 cycles_nr,
                 record_size,
                 grp.channel_group.invalidation_bytes_nr,
-                THREAD_COUNT,
+                self._mdf._extraction_thread_count,
             )
             master_bytes, _ = raw_and_invalidation[0]
             raw_and_invalidation = raw_and_invalidation[1:]
@@ -4343,6 +4887,8 @@ class MDF:
         ignore_value2text_conversions: bool = False,
         record_count: int | None = None,
         validate: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
     ) -> list[Signal]:
         """Retrieve the channels listed in the `channels` argument as `Signal`
         objects.
@@ -4391,6 +4937,19 @@ class MDF:
 
             .. versionadded:: 5.16.0
 
+        start : float, optional
+            Start time; only the records of each channel group that are inside
+            the [`start`, `stop`] interval are loaded. If `start` or `stop` is
+            given, the `record_offset` and `record_count` arguments are
+            ignored.
+
+            .. versionadded:: 8.8.0
+
+        stop : float, optional
+            Stop time.
+
+            .. versionadded:: 8.8.0
+
         Returns
         -------
         signals : list
@@ -4448,12 +5007,17 @@ class MDF:
 
         output_signals: dict[tuple[int, int], Signal] = {}
 
+        time_range = start is not None or stop is not None
+
         for virtual_group, groups in virtual_groups.items():
             cycles_nr = self._mdf.virtual_groups[virtual_group].cycles_nr
             pairs = [
                 (gp_index, ch_index) for gp_index, channel_indexes in groups.items() for ch_index in channel_indexes
             ]
 
+            if time_range:
+                record_offset, record_count = self._mdf.get_record_range(virtual_group, start, stop)
+
             if record_count is None:
                 cycles = cycles_nr - record_offset
             else:
@@ -5273,18 +5837,15 @@ class MDF:
 
                         cycles = len(group_master)
 
-                        signals = [
-                            (
-                                signal.interp(
-                                    master,
-                                    integer_interpolation_mode=self._mdf._integer_interpolation,
-                                    float_interpolation_mode=self._mdf._float_interpolation,
-                                )
-                                if not same_master or len(signal) != cycles
-                                else signal
-                            )
-                            for signal in signals
-                        ]
+                        positions = [i for i, signal in enumerate(signals) if not same_master or len(signal) != cycles]
+                        interpolated = interp_signals(
+                            [signals[i] for i in positions],
+                            master,
+                            integer_interpolation_mode=self._mdf._integer_interpolation,
+                            float_interpolation_mode=self._mdf._float_interpolation,
+                        )
+                        for i, signal in zip(positions, interpolated, strict=False):
+                            signals[i] = signal
 
                         if not same_master and interpolate_outwards_with_nan:
                             for sig in signals:
@@ -5440,6 +6001,7 @@ class MDF:
         numeric_1D_only: bool = ...,
         progress: Callable[[int, int], None] | Any | None = ...,
         use_polars: Literal[False] = ...,
+        value2text_as_categorical: bool = ...,
     ) -> pd.DataFrame: ...
 
     @overload
@@ -5460,6 +6022,7 @@ class MDF:
         numeric_1D_only: bool = ...,
         progress: Callable[[int, int], None] | Any | None = ...,
         use_polars: Literal[True] = ...,
+        value2text_as_categorical: bool = ...,
     ) -> "pl.DataFrame": ...
 
     @overload
@@ -5480,6 +6043,7 @@ class MDF:
         numeric_1D_only: bool = ...,
         progress: Callable[[int, int], None] | Any | None = ...,
         use_polars: bool = ...,
+        value2text_as_categorical: bool = ...,
     ) -> Union[pd.DataFrame, "pl.DataFrame"]: ...
 
     def to_dataframe(
@@ -5499,6 +6063,7 @@ class MDF:
         numeric_1D_only: bool = False,
         progress: Callable[[int, int], None] | Any | None = None,
         use_polars: bool = False,
+        value2text_as_categorical: bool = False,
     ) -> Union[pd.DataFrame, "pl.DataFrame"]:
         """Generate a pandas DataFrame.
 
@@ -5584,6 +6149,16 @@ class MDF:
 
             .. versionadded:: 8.1.0
 
+        value2text_as_categorical : bool, default False
+            Valid only for the MDF v4 channels that have value to text or range
+            to text conversions and if `raw=False`. If this is True, then the
+            columns are `pandas.Categorical` objects built from the integer
+            codes of the samples and the unique texts of the conversion,
+            instead of arrays that hold the text of each sample. The polars
+            DataFrame columns still hold the texts.
+
+            .. versionadded:: 8.8.0
+
         Returns
         -------
         dataframe : pandas.DataFrame or polars.DataFrame
@@ -5614,6 +6189,7 @@ class MDF:
                 interpolate_outwards_with_nan=interpolate_outwards_with_nan,
                 numeric_1D_only=numeric_1D_only,
                 use_polars=use_polars,
+                value2text_as_categorical=value2text_as_categorical,
             )
 
             mdf.close()
@@ -5697,14 +6273,27 @@ class MDF:
                         )
                         sig.timestamps = master if virtual_group.cycles_nr == 0 else group_master
 
+            # the integer codes and the texts of the dictionary-encoded channels
+            categories: dict[tuple[int, int], NDArray[np.bytes_]] = {}
+
             for signal in signals:
                 if (isinstance(raw, dict) and not raw.get(signal.name, __default__)) or not raw:
                     conversion = signal.conversion
                     if conversion:
-                        samples = conversion.convert(
-                            signal.samples, ignore_value2text_conversions=ignore_value2text_conversions
+                        encoded = (
+                            conversion.convert_to_categories(signal.samples)
+                            if value2text_as_categorical
+                            and not ignore_value2text_conversions
+                            and isinstance(conversion, v4b.ChannelConversion)
+                            else None
                         )
-                        signal.samples = samples
+                        if encoded is not None:
+                            signal.samples, categories[signal.group_index, signal.channel_index] = encoded
+                        else:
+                            samples = conversion.convert(
+                                signal.samples, ignore_value2text_conversions=ignore_value2text_conversions
+                            )
+                            signal.samples = samples
 
                     signal.raw = False
                     signal.conversion = None
@@ -5732,18 +6321,27 @@ class MDF:
 
                 cycles = len(group_master)
 
-                signals = [
-                    (
-                        signal.interp(
-                            master,
-                            integer_interpolation_mode=self._mdf._integer_interpolation,
-                            float_interpolation_mode=self._mdf._float_interpolation,
-                        )
-                        if not same_master or len(signal) != cycles
-                        else signal
+                for encoded in (False, True):
+                    positions = [
+                        i
+                        for i, signal in enumerate(signals)
+                        if (not same_master or len(signal) != cycles)
+                        and ((signal.group_index, signal.channel_index) in categories) is encoded
+                    ]
+                    if not positions:
+                        continue
+
+                    interpolated = interp_signals(
+                        [signals[i] for i in positions],
+                        master,
+                        # the codes of the texts are never interpolated
+                        integer_interpolation_mode=(
+                            IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE if encoded else self._mdf._integer_interpolation
+                        ),
+                        float_interpolation_mode=self._mdf._float_interpolation,
                     )
-                    for signal in signals
-                ]
+                    for i, signal in zip(positions, interpolated, strict=False):
+                        signals[i] = signal
 
                 if not same_master and interpolate_outwards_with_nan:
                     for sig in signals:
@@ -5849,6 +6447,21 @@ class MDF:
 
                     channel_name = used_names.get_unique_name(channel_name)
 
+                    if (sig.group_index, sig.channel_index) in categories:
+                        texts = categories[sig.group_index, sig.channel_index]
+
+                        if use_polars:
+                            data = typing.cast(dict[str, pl.DataFrame], data)
+                            data[channel_name] = pl.DataFrame(
+                                {"timestamps": sig_index, channel_name: texts.take(sig.samples)}
+                            )
+                        else:
+                            data = typing.cast(dict[str, Union[NDArray[Any], "pd.Series[Any]"]], data)
+                            data[channel_name] = pd.Series(
+                                pd.Categorical.from_codes(sig.samples, categories=texts), index=sig_index
+                            )
+                        continue
+
                     if reduce_memory_usage and sig.samples.dtype.kind not in "SU":
                         if sig.samples.size > 0:
                             sig.samples = downcast(sig.samples)
@@ -6076,6 +6689,8 @@ class MDF:
         compression: CompressionType = v4c.CompressionAlgorithm.NO_COMPRESSION,
         progress: Any | None = None,
         add_history_block: bool = True,
+        incremental: bool = False,
+        compression_level: CompressionLevelType | None = None,
     ) -> Path:
         if isinstance(self._mdf, mdf_v4.MDF4):
             return self._mdf.save(
@@ -6084,6 +6699,8 @@ class MDF:
                 compression=compression,
                 progress=progress,
                 add_history_block=add_history_block,
+                incremental=incremental,
+                compression_level=compression_level,
             )
 
         if isinstance(dst, FileLike):
@@ -1,10 +1,10 @@
 """asammdf `Signal` class module for time-correct signal processing"""
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 import logging
 from pathlib import Path
 from textwrap import fill
-from typing import TYPE_CHECKING, Union
+from typing import Final, TYPE_CHECKING, Union
 
 import numpy as np
 from numpy.typing import ArrayLike, DTypeLike, NDArray
@@ -27,6 +27,8 @@ from .version import __version__
 if TYPE_CHECKING:
     from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
+    from .mdf import MDF
+
 try:
     encode = np.strings.encode
 except:
@@ -36,6 +38,9 @@ logger = logging.getLogger("asammdf")
 
 ORIGIN_UNKNOWN = (-1, -1)
 
+# number of raw samples converted at once by the lazy physical values
+PHYSICAL_CHUNK_SIZE: Final = 64 * 1024
+
 
 class InvalidationArray(np.ndarray[tuple[int], np.dtype[np.bool]]):
     ORIGIN_UNKNOWN = ORIGIN_UNKNOWN
@@ -51,6 +56,120 @@ class InvalidationArray(np.ndarray[tuple[int], np.dtype[np.bool]]):
         self.origin: tuple[int, int] = getattr(obj, "origin", ORIGIN_UNKNOWN)
 
 
+class _PhysicalChunks:
+    """Physical values of raw samples, converted in fixed size chunks the
+    first time they are needed and memoized.
+    """
+
+    __slots__ = ("chunk_size", "chunks", "conversion", "samples")
+
+    def __init__(self, samples: NDArray[Any], conversion: ChannelConversionType, chunk_size: int) -> None:
+        self.samples = samples
+        self.conversion = conversion
+        self.chunk_size = chunk_size
+        self.chunks: dict[tuple[int, bool], NDArray[Any]] = {}
+
+    def get(self, start: int, stop: int, ignore_value2text_conversions: bool) -> NDArray[Any]:
+        """Get the physical values of the raw samples from `start` to `stop`."""
+        chunk_size = self.chunk_size
+        first = start // chunk_size
+        last = max(stop - 1, start) // chunk_size
+
+        parts = []
+        for index in range(first, last + 1):
+            key = index, ignore_value2text_conversions
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                chunk = self.chunks[key] = self.conversion.convert(
+                    self.samples[index * chunk_size : (index + 1) * chunk_size],
+                    ignore_value2text_conversions=ignore_value2text_conversions,
+                )
+            parts.append(chunk)
+
+        if len(parts) == 1:
+            values = parts[0]
+        elif len({part.dtype.kind for part in parts}) == 1:
+            values = np.concatenate(parts)
+        else:
+            # the chunks have values of different kinds (numbers and texts)
+            return self.conversion.convert(
+                self.samples[start:stop], ignore_value2text_conversions=ignore_value2text_conversions
+            )
+
+        offset = first * chunk_size
+        return values[start - offset : stop - offset]
+
+
+class _InterpolationIndex:
+    """Positions of the new timestamps in the timestamps of a signal. They are
+    computed once and used for all the signals that share the timestamps.
+    """
+
+    __slots__ = ("_linear", "_previous", "batched", "new_timestamps", "timestamps")
+
+    def __init__(self, timestamps: NDArray[Any], new_timestamps: NDArray[Any], batched: bool) -> None:
+        self.timestamps = timestamps
+        self.new_timestamps = new_timestamps
+        # a single signal is interpolated faster by np.interp
+        self.batched = batched
+        self._previous: NDArray[np.intp] | None = None
+        self._linear: tuple[NDArray[np.intp], NDArray[np.intp], NDArray[Any], NDArray[Any]] | None = None
+
+    @property
+    def previous(self) -> NDArray[np.intp]:
+        """Index of the previous sample for each new timestamp."""
+        if self._previous is None:
+            idx = np.searchsorted(self.timestamps, self.new_timestamps, side="right")
+            idx -= 1
+            idx[idx < 0] = 0
+            self._previous = idx
+
+        return self._previous
+
+    def linear(self, samples: NDArray[Any]) -> NDArray[Any]:
+        """Linear interpolation of the samples; the result is identical to
+        the result of np.interp.
+        """
+        if not self.batched:
+            return np.interp(self.new_timestamps, self.timestamps, samples)
+
+        if self._linear is None:
+            timestamps, new_timestamps = self.timestamps, self.new_timestamps
+            lower = self.previous
+            upper = lower + 1
+
+            start_timestamps = timestamps[lower]
+            # before the first and after the last timestamp, and on the
+            # timestamps, the sample is taken as it is
+            flat = (new_timestamps < timestamps[0]) | (new_timestamps == start_timestamps) | (upper == len(timestamps))
+            upper[flat] = lower[flat]
+
+            delta_t = timestamps[upper] - start_timestamps
+            delta_t[flat] = 1
+            delta_x = new_timestamps - start_timestamps
+            delta_x[flat] = 0
+
+            self._linear = lower, upper, delta_t, delta_x
+
+        lower, upper, delta_t, delta_x = self._linear
+
+        start_values = samples[lower].astype(np.float64, copy=False)
+        values = samples[upper].astype(np.float64, copy=False)
+
+        # same operations as np.interp
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values -= start_values
+            values /= delta_t
+            values *= delta_x
+            values += start_values
+
+        if np.isnan(values).any():
+            # np.interp has special handling for the non-finite samples
+            values = np.interp(self.new_timestamps, self.timestamps, samples)
+
+        return values
+
+
 class Signal:  # noqa: PLW1641
     """The `Signal` represents a channel described by its samples and
     timestamps. It can perform arithmetic operations against other `Signal`
@@ -174,6 +293,9 @@ class Signal:  # noqa: PLW1641
             self.group_index = group_index
             self.channel_index = channel_index
             self._invalidation_bits = InvalidationArray(invalidation_bits) if invalidation_bits is not None else None
+            # memoized physical values, position of the samples inside them
+            # and the samples for which the position is valid
+            self._physical_chunks: tuple[_PhysicalChunks, int, NDArray[Any]] | None = None
 
             self.source: Source | None
             if source:
@@ -857,6 +979,17 @@ class Signal:  # noqa: PLW1641
                         virtual_master_conversion=self.virtual_master_conversion,
                     )
 
+        if self._physical_chunks is not None and len(result):
+            # the samples are shared only if no samples were interpolated at the ends
+            start_idx = int(np.searchsorted(self.timestamps, result.timestamps[0], side="left"))
+            stop_idx = start_idx + len(result)
+            if (
+                stop_idx <= len(self)
+                and self.timestamps[start_idx] == result.timestamps[0]
+                and self.timestamps[stop_idx - 1] == result.timestamps[-1]
+            ):
+                self._share_physical_chunks(result, start_idx)
+
         return result
 
     def extend(self, other: "Signal") -> "Signal":
@@ -1028,96 +1161,70 @@ class Signal:  # noqa: PLW1641
                     virtual_master_conversion=self.virtual_master_conversion,
                 )
 
-            if len(signal.samples.shape) > 1:
-                idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                idx -= 1
-                idx[idx < 0] = 0
-                s = signal.samples[idx]
-                if invalidation_bits is not None:
-                    invalidation_bits = invalidation_bits[idx]
-            else:
-                kind = signal.samples.dtype.kind
-
-                if kind == "f":
-                    if float_interpolation_mode == FloatInterpolation.REPEAT_PREVIOUS_SAMPLE:
-                        idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                        idx -= 1
-                        idx[idx < 0] = 0
-                        s = signal.samples[idx]
-
-                        if invalidation_bits is not None:
-                            invalidation_bits = invalidation_bits[idx]
-
-                    else:
-                        s = np.interp(new_timestamps, signal.timestamps, signal.samples)
-
-                        if invalidation_bits is not None:
-                            idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                            idx -= 1
-                            idx[idx < 0] = 0
-                            invalidation_bits = invalidation_bits[idx]
-
-                elif kind in "ui":
-                    if integer_interpolation_mode == IntegerInterpolation.HYBRID_INTERPOLATION:
-                        if signal.raw and signal.conversion:
-                            kind = signal.conversion.convert(signal.samples[:1]).dtype.kind
-                            if kind == "f":
-                                integer_interpolation_mode = IntegerInterpolation.LINEAR_INTERPOLATION
-
-                    if integer_interpolation_mode == IntegerInterpolation.HYBRID_INTERPOLATION:
-                        integer_interpolation_mode = IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE
+            return self._interp(
+                _InterpolationIndex(signal.timestamps, np.asarray(new_timestamps), batched=False),
+                integer_interpolation_mode,
+                float_interpolation_mode,
+            )
 
-                    if integer_interpolation_mode == IntegerInterpolation.LINEAR_INTERPOLATION:
-                        s = np.interp(new_timestamps, signal.timestamps, signal.samples).astype(signal.samples.dtype)
+    def _interp(
+        self,
+        index: _InterpolationIndex,
+        integer_interpolation_mode: IntegerInterpolation,
+        float_interpolation_mode: FloatInterpolation,
+    ) -> "Signal":
+        """Interpolate the samples of a non-empty `Signal` using the
+        positions of the new timestamps.
+        """
+        invalidation_bits = self.invalidation_bits
 
-                        if invalidation_bits is not None:
-                            idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                            idx -= 1
-                            idx[idx < 0] = 0
-                            invalidation_bits = invalidation_bits[idx]
+        kind = self.samples.dtype.kind
+        linear = False
 
-                    elif integer_interpolation_mode == IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE:
-                        idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                        idx -= 1
-                        idx[idx < 0] = 0
+        if len(self.samples.shape) == 1:
+            if kind == "f":
+                linear = float_interpolation_mode == FloatInterpolation.LINEAR_INTERPOLATION
 
-                        s = signal.samples[idx]
+            elif kind in "ui":
+                if integer_interpolation_mode == IntegerInterpolation.HYBRID_INTERPOLATION:
+                    if self.raw and self.conversion:
+                        kind = self.conversion.convert(self.samples[:1]).dtype.kind
+                        if kind == "f":
+                            integer_interpolation_mode = IntegerInterpolation.LINEAR_INTERPOLATION
 
-                        if invalidation_bits is not None:
-                            invalidation_bits = invalidation_bits[idx]
+                linear = integer_interpolation_mode == IntegerInterpolation.LINEAR_INTERPOLATION
 
-                else:
-                    idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                    idx -= 1
-                    idx[idx < 0] = 0
-                    s = signal.samples[idx]
+        if linear:
+            s = index.linear(self.samples)
+        else:
+            s = self.samples[index.previous]
 
-                    if invalidation_bits is not None:
-                        invalidation_bits = invalidation_bits[idx]
+        if invalidation_bits is not None:
+            invalidation_bits = invalidation_bits[index.previous]
 
-            if s.dtype != self.samples.dtype:
-                s = s.astype(self.samples.dtype)
+        if s.dtype != self.samples.dtype:
+            s = s.astype(self.samples.dtype)
 
-            return Signal(
-                s,
-                new_timestamps,
-                self.unit,
-                self.name,
-                comment=self.comment,
-                conversion=self.conversion,
-                source=self.source,
-                raw=self.raw,
-                master_metadata=self.master_metadata,
-                display_names=self.display_names,
-                attachment=self.attachment,
-                invalidation_bits=invalidation_bits,
-                encoding=self.encoding,
-                group_index=self.group_index,
-                channel_index=self.channel_index,
-                flags=self.flags,
-                virtual_conversion=self.virtual_conversion,
-                virtual_master_conversion=self.virtual_master_conversion,
-            )
+        return Signal(
+            s,
+            index.new_timestamps,
+            self.unit,
+            self.name,
+            comment=self.comment,
+            conversion=self.conversion,
+            source=self.source,
+            raw=self.raw,
+            master_metadata=self.master_metadata,
+            display_names=self.display_names,
+            attachment=self.attachment,
+            invalidation_bits=invalidation_bits,
+            encoding=self.encoding,
+            group_index=self.group_index,
+            channel_index=self.channel_index,
+            flags=self.flags,
+            virtual_conversion=self.virtual_conversion,
+            virtual_master_conversion=self.virtual_master_conversion,
+        )
 
     def __apply_func(self, other: Union["Signal", NDArray[Any], float] | None, func_name: str) -> "Signal":
         """Delegate operations to the `samples` attribute, but in a
@@ -1369,7 +1476,7 @@ class Signal:  # noqa: PLW1641
         if isinstance(val, str):
             return self.samples[val]
         else:
-            return Signal(
+            signal = Signal(
                 self.samples[val],
                 self.timestamps[val],
                 self.unit,
@@ -1390,9 +1497,15 @@ class Signal:  # noqa: PLW1641
                 virtual_conversion=self.virtual_conversion,
                 virtual_master_conversion=self.virtual_master_conversion,
             )
+            if self._physical_chunks is not None and isinstance(val, slice) and val.step in (None, 1):
+                self._share_physical_chunks(signal, val.indices(len(self))[0])
+
+            return signal
 
     def __setitem__(self, idx: Any, val: Any) -> None:
         self.samples[idx] = val
+        if self._physical_chunks is not None:
+            self._physical_chunks[0].chunks.clear()
 
     def astype(self, np_type: DTypeLike) -> "Signal":
         """Return a new `Signal` with samples of dtype `np_type`.
@@ -1454,7 +1567,20 @@ class Signal:  # noqa: PLW1641
                 samples = self.samples
             encoding = None
         else:
-            samples = self.conversion.convert(self.samples, ignore_value2text_conversions=ignore_value2text_conversions)
+            if (
+                self._physical_chunks is not None
+                and self._physical_chunks[2] is self.samples
+                and self._physical_chunks[0].conversion is self.conversion
+            ):
+                chunks, offset, _ = self._physical_chunks
+                samples = chunks.get(offset, offset + len(self.samples), ignore_value2text_conversions)
+                # the memoized values must not be changed by the caller
+                if copy:
+                    samples = samples.copy()
+            else:
+                samples = self.conversion.convert(
+                    self.samples, ignore_value2text_conversions=ignore_value2text_conversions
+                )
             if samples.dtype.kind == "S":
                 encoding = "utf-8" if self.conversion.id == b"##CC" else "latin-1"
             else:
@@ -1480,6 +1606,48 @@ class Signal:  # noqa: PLW1641
             virtual_master_conversion=self.virtual_master_conversion,
         )
 
+    def lazy_physical(self, chunk_size: int = PHYSICAL_CHUNK_SIZE) -> "Signal":
+        """Get a `Signal` that holds the raw samples and converts them to
+        physical values only when they are needed.
+
+        The returned `Signal` shares the raw samples with this `Signal`. The
+        signals obtained from it with `cut` or by slicing share the memoized
+        physical values, as long as no samples are interpolated at the ends.
+        When `physical` is called on any of these signals only the chunks
+        that contain their samples are converted, so the samples of a zoomed
+        window are converted only once.
+
+        Parameters
+        ----------
+        chunk_size : int, default 65536
+            Number of raw samples converted at once.
+
+        Returns
+        -------
+        signal : Signal
+            New raw `Signal` with lazy physical values; if this `Signal` has
+            physical values or no conversion, the physical `Signal` is
+            returned.
+        """
+        if not self.raw or self.conversion is None:
+            return self.physical(copy=False)
+
+        if chunk_size <= 0:
+            raise MdfException(f"The chunk size must be > 0, not {chunk_size}")
+
+        signal = self[:]
+        signal._physical_chunks = _PhysicalChunks(signal.samples, self.conversion, chunk_size), 0, signal.samples
+
+        return signal
+
+    def _share_physical_chunks(self, signal: "Signal", offset: int) -> None:
+        """Let `signal`, whose samples are the samples of this `Signal`
+        starting from `offset`, use the same memoized physical values.
+        """
+        if self._physical_chunks is not None and self._physical_chunks[2] is self.samples:
+            chunks, own_offset, _ = self._physical_chunks
+            signal._physical_chunks = chunks, own_offset + offset, signal.samples
+
     def validate(self, copy: bool = True) -> "Signal":
         """Apply invalidation bits if they are available for this signal.
 
@@ -1550,5 +1718,500 @@ class Signal:  # noqa: PLW1641
         )
 
 
+def interp_signals(
+    signals: Sequence[Signal],
+    new_timestamps: NDArray[Any] | list[float],
+    integer_interpolation_mode: IntInterpolationModeType | IntegerInterpolation = (
+        IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE
+    ),
+    float_interpolation_mode: FloatInterpolationModeType | FloatInterpolation = FloatInterpolation.LINEAR_INTERPOLATION,
+) -> list[Signal]:
+    """Interpolate several signals using the `new_timestamps`.
+
+    The result is the same as calling `Signal.interp` for each signal, but
+    the positions of the new timestamps are searched only once for all the
+    signals that have the same timestamps (for example the channels of a
+    channel group), so this is much faster for groups with many channels.
+
+    .. versionadded:: 8.8.0
+
+    Parameters
+    ----------
+    signals : list
+        Signals to interpolate.
+    new_timestamps : np.ndarray | list
+        Timestamps used for interpolation.
+    integer_interpolation_mode : int, default 0
+        Interpolation mode for integer signals, see `Signal.interp`.
+    float_interpolation_mode : int, default 1
+        Interpolation mode for float signals, see `Signal.interp`.
+
+    Returns
+    -------
+    signals : list
+        New interpolated signals, in the same order.
+    """
+    integer_interpolation_mode = IntegerInterpolation(integer_interpolation_mode)
+    float_interpolation_mode = FloatInterpolation(float_interpolation_mode)
+    new_timestamps = np.asarray(new_timestamps)
+
+    # the channels of a group usually share the timestamps array, otherwise
+    # the timestamps are compared to find the signals with the same timestamps
+    indexes: dict[int, _InterpolationIndex] = {}
+    candidates: dict[tuple[int, Any, Any], list[_InterpolationIndex]] = {}
+
+    result = []
+    for signal in signals:
+        if not len(signal.samples) or not len(new_timestamps):
+            result.append(signal.interp(new_timestamps, integer_interpolation_mode, float_interpolation_mode))
+            continue
+
+        timestamps = signal.timestamps
+        index = indexes.get(id(timestamps))
+
+        if index is None:
+            key = len(timestamps), timestamps[0], timestamps[-1]
+            for candidate in candidates.get(key, []):
+                if np.array_equal(candidate.timestamps, timestamps):
+                    index = candidate
+                    break
+            else:
+                index = _InterpolationIndex(timestamps, new_timestamps, batched=True)
+                candidates.setdefault(key, []).append(index)
+
+            indexes[id(timestamps)] = index
+
+        result.append(signal._interp(index, integer_interpolation_mode, float_interpolation_mode))
+
+    return result
+
+
+def _concatenate_signals(signals: Sequence[Signal]) -> Signal:
+    """Join consecutive parts of a signal; the metadata of the first part is
+    used.
+    """
+    first = signals[0]
+    if len(signals) == 1:
+        return first
+
+    if any(signal.invalidation_bits is not None for signal in signals):
+        invalidation_bits: InvalidationArray | None = InvalidationArray(
+            np.concatenate(
+                [
+                    signal.invalidation_bits
+                    if signal.invalidation_bits is not None
+                    else np.zeros(len(signal), dtype=bool)
+                    for signal in signals
+                ]
+            )
+        )
+    else:
+        invalidation_bits = None
+
+    return Signal(
+        np.concatenate([signal.samples for signal in signals]),
+        np.concatenate([signal.timestamps for signal in signals]),
+        first.unit,
+        first.name,
+        comment=first.comment,
+        conversion=first.conversion,
+        source=first.source,
+        raw=first.raw,
+        master_metadata=first.master_metadata,
+        display_names=first.display_names,
+        attachment=first.attachment,
+        invalidation_bits=invalidation_bits,
+        encoding=first.encoding,
+        group_index=first.group_index,
+        channel_index=first.channel_index,
+        flags=first.flags,
+        virtual_conversion=first.virtual_conversion,
+        virtual_master_conversion=first.virtual_master_conversion,
+    )
+
+
+def _aligned_chunks(first: Iterable[Signal], second: Iterable[Signal]) -> Iterator[tuple[Signal, Signal]]:
+    """Pair the chunks of two chunked signals that have the same timestamps
+    but different chunk boundaries.
+    """
+    first_chunks = (chunk for chunk in first if len(chunk))
+    second_chunks = (chunk for chunk in second if len(chunk))
+
+    left = next(first_chunks, None)
+    right = next(second_chunks, None)
+
+    while left is not None and right is not None:
+        size = min(len(left), len(right))
+        left_part, right_part = left[:size], right[:size]
+
+        if not np.array_equal(left_part.timestamps, right_part.timestamps):
+            raise MdfException(
+                f'The signals "{left.name}" and "{right.name}" have different timestamps; '
+                "use interp to bring one of them to the timestamps of the other"
+            )
+
+        yield left_part, right_part
+
+        left = left[size:] if len(left) > size else next(first_chunks, None)
+        right = right[size:] if len(right) > size else next(second_chunks, None)
+
+    if left is not None or right is not None:
+        raise MdfException("The signals have a different number of samples")
+
+
+class ChunkedSignal:
+    """Signal whose samples are never held in memory at once. The samples are
+    produced one chunk at a time, either by reading the data blocks fragments
+    from the file (see `MDF.get_chunked`) or by applying an operation to the
+    chunks of another `ChunkedSignal`; the chunks are produced again each
+    time the signal is iterated.
+
+    The memory usage is bounded by the chunk size, which is given by the
+    `read_fragment_size` option of the measurement (see `MDF.configure`).
+    The operations (`cut`, `interp` and the arithmetic operators) return new
+    `ChunkedSignal` objects and do not read any data; the reductions (`min`,
+    `max`, `mean` and `rms`) and `to_signal` iterate over the chunks.
+
+    .. versionadded:: 8.8.0
+
+    Parameters
+    ----------
+    chunks : callable
+        Function without arguments that returns a new iterator over the
+        chunks (`Signal` objects with consecutive timestamps).
+    name : str, optional
+        Signal name.
+    unit : str, optional
+        Signal unit.
+    comment : str, optional
+        Signal comment.
+
+    Examples
+    --------
+    >>> with MDF("large.mf4") as mdf:
+    ...     speed = mdf.get_chunked("VehicleSpeed")
+    ...     window = speed.cut(start=100, stop=3600)
+    ...     window.max(), (window * 3.6).mean()
+    """
+
+    def __init__(
+        self,
+        chunks: Callable[[], Iterable[Signal]],
+        name: str = "",
+        unit: str = "",
+        comment: str = "",
+    ) -> None:
+        self._chunks = chunks
+        self.name = name
+        self.unit = unit
+        self.comment = comment
+
+        # the data is read from the file and the record range can be limited
+        # (mdf, group index, channel index, raw, start, stop)
+        self._source: tuple[MDF, int, int, bool, float | None, float | None] | None = None
+
+    @classmethod
+    def _from_file(
+        cls,
+        mdf: "MDF",
+        group: int,
+        index: int,
+        raw: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
+        name: str = "",
+        unit: str = "",
+        comment: str = "",
+    ) -> "ChunkedSignal":
+        def chunks() -> Iterator[Signal]:
+            return mdf.iter_get(group=group, index=index, raw=raw, start=start, stop=stop)
+
+        signal = cls(chunks, name=name, unit=unit, comment=comment)
+        signal._source = mdf, group, index, raw, start, stop
+        return signal
+
+    def _derived(self, chunks: Callable[[], Iterable[Signal]]) -> "ChunkedSignal":
+        return ChunkedSignal(chunks, name=self.name, unit=self.unit, comment=self.comment)
+
+    def __repr__(self) -> str:
+        return f"<ChunkedSignal {self.name}>"
+
+    def __iter__(self) -> Iterator[Signal]:
+        """Iterate over the chunks; the empty chunks are skipped."""
+        for chunk in self._chunks():
+            if len(chunk):
+                yield chunk
+
+    def _physical_chunks(self) -> Iterator[Signal]:
+        for chunk in self:
+            yield chunk.physical(copy=False)
+
+    def cut(self, start: float | None = None, stop: float | None = None) -> "ChunkedSignal":
+        """Cut the signal to the [`start`, `stop`] interval. Unlike
+        `Signal.cut` no samples are interpolated at the interval limits.
+
+        If the samples are read from the file only the data blocks that
+        overlap the interval are read.
+
+        Parameters
+        ----------
+        start : float, optional
+            Start time; default is None and in this case the signal starts
+            with the first sample.
+        stop : float, optional
+            Stop time; default is None and in this case the signal ends with
+            the last sample.
+
+        Returns
+        -------
+        signal : ChunkedSignal
+            Cut signal.
+        """
+        if self._source is not None:
+            mdf, group, index, raw, source_start, source_stop = self._source
+            if source_start is not None:
+                start = source_start if start is None else max(start, source_start)
+            if source_stop is not None:
+                stop = source_stop if stop is None else min(stop, source_stop)
+
+            return ChunkedSignal._from_file(
+                mdf,
+                group,
+                index,
+                raw=raw,
+                start=start,
+                stop=stop,
+                name=self.name,
+                unit=self.unit,
+                comment=self.comment,
+            )
+
+        def chunks() -> Iterator[Signal]:
+            for chunk in self:
+                if stop is not None and chunk.timestamps[0] > stop:
+                    break
+                if start is not None and chunk.timestamps[-1] < start:
+                    continue
+                yield chunk.cut(start, stop, include_ends=False)
+
+        return self._derived(chunks)
+
+    def interp(
+        self,
+        new_timestamps: Union[NDArray[Any], "ChunkedSignal"],
+        integer_interpolation_mode: IntInterpolationModeType | IntegerInterpolation = (
+            IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE
+        ),
+        float_interpolation_mode: FloatInterpolationModeType | FloatInterpolation = (
+            FloatInterpolation.LINEAR_INTERPOLATION
+        ),
+    ) -> "ChunkedSignal":
+        """Interpolate the signal using the `new_timestamps`; the result is the
+        same as the result of `Signal.interp`.
+
+        Parameters
+        ----------
+        new_timestamps : np.ndarray | ChunkedSignal
+            Timestamps used for interpolation. If a `ChunkedSignal` is given,
+            its timestamps are used, so that the result can be combined with
+            it using the arithmetic operators.
+        integer_interpolation_mode : int, default 0
+            Interpolation mode for integer signals, see `Signal.interp`.
+        float_interpolation_mode : int, default 1
+            Interpolation mode for float signals, see `Signal.interp`.
+
+        Returns
+        -------
+        signal : ChunkedSignal
+            Interpolated signal.
+        """
+
+        def timestamps_chunks() -> Iterator[NDArray[Any]]:
+            if isinstance(new_timestamps, ChunkedSignal):
+                for chunk in new_timestamps:
+                    yield chunk.timestamps
+            else:
+                yield np.asarray(new_timestamps)
+
+        def chunks() -> Iterator[Signal]:
+            source = iter(self)
+            window = next(source, None)
+            if window is None:
+                return
+
+            exhausted = False
+
+            for timestamps in timestamps_chunks():
+                position = 0
+                while position < len(timestamps):
+                    if exhausted:
+                        end = len(timestamps)
+                    else:
+                        end = int(np.searchsorted(timestamps, window.timestamps[-1], side="right"))
+
+                    if end > position:
+                        yield window.interp(
+                            timestamps[position:end],
+                            integer_interpolation_mode=integer_interpolation_mode,
+                            float_interpolation_mode=float_interpolation_mode,
+                        )
+                        position = end
+
+                    if position < len(timestamps):
+                        chunk = next(source, None)
+                        if chunk is None:
+                            exhausted = True
+                        else:
+                            # the last sample of the previous chunk is needed for the
+                            # timestamps between the chunks
+                            window = _concatenate_signals([window[-1:], chunk])
+
+        return self._derived(chunks)
+
+    def _apply(self, other: Union["ChunkedSignal", float], func: Callable[[Any, Any], Any]) -> "ChunkedSignal":
+        if isinstance(other, ChunkedSignal):
+
+            def chunks() -> Iterator[Signal]:
+                for left, right in _aligned_chunks(self._physical_chunks(), other._physical_chunks()):
+                    if left.invalidation_bits is None:
+                        invalidation_bits = right.invalidation_bits
+                    elif right.invalidation_bits is None:
+                        invalidation_bits = left.invalidation_bits
+                    else:
+                        invalidation_bits = left.invalidation_bits | right.invalidation_bits
+
+                    yield Signal(
+                        func(left.samples, right.samples),
+                        left.timestamps,
+                        unit=left.unit,
+                        name=left.name,
+                        invalidation_bits=invalidation_bits,
+                        group_index=left.group_index,
+                        channel_index=left.channel_index,
+                    )
+
+        else:
+
+            def chunks() -> Iterator[Signal]:
+                for chunk in self._physical_chunks():
+                    yield Signal(
+                        func(chunk.samples, other),
+                        chunk.timestamps,
+                        unit=chunk.unit,
+                        name=chunk.name,
+                        invalidation_bits=chunk.invalidation_bits,
+                        group_index=chunk.group_index,
+                        channel_index=chunk.channel_index,
+                    )
+
+        return self._derived(chunks)
+
+    def __add__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.add)
+
+    def __radd__(self, other: float) -> "ChunkedSignal":
+        return self._apply(other, lambda samples, other: np.add(other, samples))
+
+    def __sub__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.subtract)
+
+    def __rsub__(self, other: float) -> "ChunkedSignal":
+        return self._apply(other, lambda samples, other: np.subtract(other, samples))
+
+    def __mul__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.multiply)
+
+    def __rmul__(self, other: float) -> "ChunkedSignal":
+        return self._apply(other, lambda samples, other: np.multiply(other, samples))
+
+    def __truediv__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.true_divide)
+
+    def __rtruediv__(self, other: float) -> "ChunkedSignal":
+        return self._apply(other, lambda samples, other: np.true_divide(other, samples))
+
+    def __floordiv__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.floor_divide)
+
+    def __mod__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.mod)
+
+    def __pow__(self, other: Union["ChunkedSignal", float]) -> "ChunkedSignal":
+        return self._apply(other, np.power)
+
+    def __neg__(self) -> "ChunkedSignal":
+        return self._apply(0, lambda samples, other: np.negative(samples))
+
+    def __abs__(self) -> "ChunkedSignal":
+        return self._apply(0, lambda samples, other: np.abs(samples))
+
+    def _valid_samples(self) -> Iterator[NDArray[Any]]:
+        for chunk in self._physical_chunks():
+            chunk = chunk.validate(copy=False)
+            if len(chunk):
+                yield chunk.samples
+
+    def min(self) -> Any:
+        """Minimum of the valid physical samples; NaN if there are no valid
+        samples.
+        """
+        values = [np.min(samples) for samples in self._valid_samples()]
+        return min(values) if values else np.nan
+
+    def max(self) -> Any:
+        """Maximum of the valid physical samples; NaN if there are no valid
+        samples.
+        """
+        values = [np.max(samples) for samples in self._valid_samples()]
+        return max(values) if values else np.nan
+
+    def mean(self) -> float:
+        """Mean of the valid physical samples; NaN if there are no valid
+        samples.
+        """
+        total, count = 0.0, 0
+        for samples in self._valid_samples():
+            total += float(np.sum(samples, dtype=np.float64))
+            count += len(samples)
+
+        return total / count if count else np.nan
+
+    def rms(self) -> float:
+        """Root mean square of the valid physical samples; NaN if there are no
+        valid samples.
+        """
+        total, count = 0.0, 0
+        for samples in self._valid_samples():
+            samples = samples.astype(np.float64, copy=False)
+            total += float(np.dot(samples, samples))
+            count += len(samples)
+
+        return float(np.sqrt(total / count)) if count else np.nan
+
+    def to_signal(self) -> Signal:
+        """Load all the chunks in a single `Signal`.
+
+        Returns
+        -------
+        signal : Signal
+            Materialized signal.
+        """
+        chunks = list(self)
+        if chunks:
+            return _concatenate_signals(chunks)
+
+        if self._source is not None:
+            mdf, group, index, raw, _, _ = self._source
+            return mdf.get(group=group, index=index, raw=raw, record_count=0)
+
+        return Signal(
+            np.array([], dtype=np.float64),
+            np.array([], dtype=np.float64),
+            self.unit,
+            self.name,
+            comment=self.comment,
+        )
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,479 @@
+"""asammdf writer for MDF v4 files that are created while the measurement is running"""
+
+from collections.abc import Sequence
+import logging
+from pathlib import Path
+from time import perf_counter
+import typing
+from typing import BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+from typing_extensions import Any, SupportsBytes
+
+from . import tool
+from .blocks import v4_constants as v4c
+from .blocks.mdf_common import GroupV4
+from .blocks.mdf_v4 import MDF4
+from .blocks.source_utils import Source
+from .blocks.types import CompressionType, StrPath
+from .blocks.utils import MdfException, validate_version_argument
+from .blocks.v4_blocks import (
+    ChannelArrayBlock,
+    ChannelGroup,
+    DataBlock,
+    DataGroup,
+    DataList,
+    DataListKwargs,
+    DataZippedBlock,
+    FileHistory,
+    HeaderBlock,
+    HeaderList,
+)
+from .mdf import MDF
+from .signal import Signal
+
+logger = logging.getLogger("asammdf")
+
+__all__ = ["StreamingMDF4Writer"]
+
+
+class _GroupWriteState:
+    """Data blocks of a channel group that were written since the last
+    finalization, and the tail of the group's data list chain.
+    """
+
+    __slots__ = ("data_size", "last_data_list", "pending_blocks")
+
+    def __init__(self) -> None:
+        self.data_size = 0
+        self.last_data_list: DataList | None = None
+        self.pending_blocks: list[tuple[int, int]] = []
+
+
+class StreamingMDF4Writer:
+    """Write a MDF v4 file while the measurement is running.
+
+    Unlike `MDF.append` and `MDF.extend`, which keep the samples in a
+    temporary file until `MDF.save` is called, the records are written as data
+    blocks directly to the destination file. The file is finalized
+    periodically: the data blocks written so far are linked in the groups'
+    data lists and the channel groups cycle counters are updated. A crashed
+    logger leaves a valid file that contains the samples up to the last
+    finalization, and the memory usage does not depend on the length of the
+    recording.
+
+    The channel groups are created with `append` (using the same `Signal`
+    objects as `MDF.append`) and the new samples are added with `extend`.
+
+    .. versionadded:: 8.8.0
+
+    Parameters
+    ----------
+    name : str | path-like
+        Destination file name.
+    version : str, default '4.10'
+        MDF file version; the streaming writer supports the row oriented
+        versions '4.00', '4.10' and '4.11'.
+    compression : int, default 0
+        Use compressed data blocks; valid since MDF version 4.10.
+
+        * 0 - no compression
+        * 1 - deflate
+        * 2 - transposition + deflate
+
+    finalize_interval : float | None, default 10.0
+        Interval in seconds after which `extend` finalizes the file. Use None
+        to finalize only when `finalize` or `close` is called.
+    overwrite : bool, default False
+        Overwrite an existing destination file.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from asammdf import Signal, StreamingMDF4Writer
+    >>> t = np.arange(5, dtype=np.float64)
+    >>> speed = Signal(np.zeros(5), t, name="Speed", unit="km/h")
+    >>> with StreamingMDF4Writer("session.mf4", compression=1) as writer:
+    ...     index = writer.append([speed])
+    ...     for i in range(1, 100):
+    ...         writer.extend(index, [(t + 5 * i, None), (np.full(5, float(i)), None)])
+    """
+
+    def __init__(
+        self,
+        name: StrPath,
+        version: str = "4.10",
+        compression: CompressionType = v4c.CompressionAlgorithm.NO_COMPRESSION,
+        finalize_interval: float | None = 10.0,
+        overwrite: bool = False,
+    ) -> None:
+        version = validate_version_argument(version)
+        if not "4.00" <= version < "4.20":
+            raise MdfException(f'The streaming writer does not support the MDF version "{version}"')
+
+        if compression not in (
+            v4c.CompressionAlgorithm.NO_COMPRESSION,
+            v4c.CompressionAlgorithm.DEFLATE,
+            v4c.CompressionAlgorithm.TRANSPOSED_DEFLATE,
+        ):
+            raise MdfException(f'The streaming writer does not support the compression "{compression}"')
+        if compression and version < "4.10":
+            raise MdfException("Compressed data blocks are valid since MDF version 4.10")
+
+        self.name = Path(name).with_suffix(".mf4")
+        if self.name.exists() and not overwrite:
+            raise MdfException(f'Destination file "{self.name}" already exists and "overwrite" is False')
+
+        self.version = version
+        self.compression = compression
+        self.finalize_interval = finalize_interval
+        self.closed = False
+
+        # the channel group metadata and the records layout are handled by a
+        # new MDF object; its temporary file only holds the samples of the
+        # last appended group until they are written to the destination file
+        self._mdf = MDF(version=version)
+        self._mdf4 = typing.cast(MDF4, self._mdf._mdf)
+        self._groups: list[_GroupWriteState] = []
+
+        self._defined_texts: dict[bytes | str, int] = {"": 0, b"": 0}
+        self._cc_map: dict[bytes | int, int] = {}
+        self._si_map: dict[bytes | int, int] = {}
+
+        self.name.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(self.name, "wb+")
+
+        try:
+            self._write_header()
+        except:
+            self._file.close()
+            raise
+
+        self._last_finalize = perf_counter()
+
+    def __enter__(self) -> "StreamingMDF4Writer":
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.close()
+
+    @property
+    def groups(self) -> list[GroupV4]:
+        """Channel groups metadata of the written file."""
+        return self._mdf4.groups
+
+    def append(
+        self,
+        signals: list[Signal] | Signal,
+        acq_name: str | None = None,
+        acq_source: Source | None = None,
+        comment: str = "Python",
+        common_timebase: bool = False,
+    ) -> int:
+        """Append a new channel group, see `MDF.append` for the arguments.
+
+        The samples of the signals are written as the first records of the
+        group. Variable length signals (strings and byte arrays) are not
+        supported.
+
+        Returns
+        -------
+        index : int
+            Index of the new channel group, used by `extend`.
+        """
+        self._check_open()
+
+        if isinstance(signals, Signal):
+            signals = [signals]
+
+        if not signals:
+            raise MdfException('"append" requires a non-empty list of Signal objects')
+
+        for signal in signals:
+            if signal.samples.dtype.names is None and signal.samples.dtype.kind in "SUVO":
+                raise MdfException(f'The streaming writer does not support the variable length signal "{signal.name}"')
+
+        index = len(self._mdf4.groups)
+        self._mdf.append(
+            signals,
+            acq_name=acq_name,
+            acq_source=acq_source,
+            comment=comment,
+            common_timebase=common_timebase,
+        )
+        if len(self._mdf4.groups) != index + 1:
+            raise MdfException("The streaming writer requires the signals to be appended in a single channel group")
+
+        group = self._mdf4.groups[index]
+        self._groups.append(_GroupWriteState())
+
+        group_address = self._write_group_metadata(index)
+
+        for fragment in self._mdf4._load_data(group):
+            self._write_records(index, fragment.data)
+
+        # the samples are in the destination file now
+        group.data_blocks.clear()
+        self._mdf4._tempfile.seek(0)
+        self._mdf4._tempfile.truncate()
+
+        self._finalize_group(index)
+
+        # the group becomes visible to the readers only after its data is linked
+        if index:
+            previous_data_group = self._mdf4.groups[index - 1].data_group
+            previous_data_group.next_dg_addr = group_address
+            self._rewrite(previous_data_group)
+        else:
+            self._mdf4.header.first_dg_addr = group_address
+            self._rewrite(self._mdf4.header)
+
+        self._file.flush()
+
+        return index
+
+    def extend(self, index: int, signals: Sequence[tuple[NDArray[Any], NDArray[np.bool] | None]]) -> None:
+        """Write new samples for a channel group, see `MDF.extend` for the
+        format of `signals`.
+
+        Parameters
+        ----------
+        index : int
+            Group index returned by `append`.
+        signals : sequence
+            Sequence of (np.ndarray, np.ndarray) tuples; the first pair is the
+            master channel's pair.
+        """
+        self._check_open()
+
+        if not signals:
+            raise MdfException('"extend" requires a non-empty list of samples')
+
+        group = self._mdf4.groups[index]
+        added_cycles = len(signals[0][0])
+
+        records, _ = self._mdf4._build_records(index, signals)
+        self._write_records(index, records)
+
+        group.channel_group.cycles_nr += added_cycles
+        self._mdf4.virtual_groups[index].cycles_nr += added_cycles
+
+        if self.finalize_interval is not None and perf_counter() - self._last_finalize >= self.finalize_interval:
+            self.finalize()
+
+    def finalize(self) -> None:
+        """Link the data blocks written since the last finalization and
+        update the channel groups cycle counters, so that the file contains
+        all the samples written so far.
+        """
+        self._check_open()
+
+        for index in range(len(self._groups)):
+            self._finalize_group(index)
+
+        self._file.flush()
+        self._last_finalize = perf_counter()
+
+    def close(self) -> None:
+        """Finalize and close the file; calling `close` again has no effect."""
+        if self.closed:
+            return
+
+        try:
+            self.finalize()
+        finally:
+            self.closed = True
+            self._file.close()
+            self._mdf.close()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise MdfException(f'The streaming writer for "{self.name}" is closed')
+
+    def _rewrite(self, block: ChannelGroup | DataGroup | DataList | HeaderBlock) -> None:
+        """Write the block again at its address; the block size is unchanged."""
+        self._file.seek(block.address)
+        self._file.write(bytes(block))
+        self._file.seek(0, 2)
+
+    def _write_blocks(self, blocks: list[bytes | SupportsBytes]) -> None:
+        self._file.seek(0, 2)
+        for block in blocks:
+            self._file.write(bytes(block))
+
+    def _write_header(self) -> None:
+        mdf = self._mdf4
+
+        blocks: list[bytes | SupportsBytes] = [mdf.identification]
+        address = mdf.header.to_blocks(v4c.IDENTIFICATION_BLOCK_SIZE, blocks)
+
+        fh = FileHistory()
+        fh.comment = f"""<FHcomment>
+    <TX>created</TX>
+    <tool_id>{tool.__tool__}</tool_id>
+    <tool_vendor>{tool.__vendor__}</tool_vendor>
+    <tool_version>{tool.__version__}</tool_version>
+</FHcomment>"""
+        mdf.file_history.append(fh)
+
+        fh.to_blocks(address, blocks, self._defined_texts)
+        fh.next_fh_addr = 0
+        mdf.header.file_history_addr = fh.address
+        mdf.header.first_dg_addr = 0
+
+        self._write_blocks(blocks)
+
+    def _write_group_metadata(self, index: int) -> int:
+        """Write the channels, channel group and data group blocks of the
+        group and return the data group address.
+        """
+        group = self._mdf4.groups[index]
+        channels = group.channels
+
+        self._file.seek(0, 2)
+        address = self._file.tell()
+        blocks: list[bytes | SupportsBytes] = []
+
+        for j, channel in enumerate(channels):
+            channel.data_block_addr = 0
+            address = channel.to_blocks(address, blocks, self._defined_texts, self._cc_map, self._si_map)
+
+            dep_list = group.channel_dependencies[j]
+            if dep_list and all(isinstance(dep, ChannelArrayBlock) for dep in dep_list):
+                dep_list = typing.cast(list[ChannelArrayBlock], dep_list)
+                for dep in dep_list:
+                    dep.address = address
+                    address += dep.block_len
+                    blocks.append(dep)
+                for k, dep in enumerate(dep_list[:-1]):
+                    dep.composition_addr = dep_list[k + 1].address
+                dep_list[-1].composition_addr = 0
+
+                channel.component_addr = dep_list[0].address
+
+        if channels:
+            for j, channel in enumerate(channels[:-1]):
+                channel.next_ch_addr = channels[j + 1].address
+            channels[-1].next_ch_addr = 0
+
+        # structure components are linked to their parent channel
+        for j in range(len(channels) - 1, -1, -1):
+            dep_list = group.channel_dependencies[j]
+            if dep_list and all(isinstance(dep, tuple) for dep in dep_list):
+                dep_list = typing.cast(list[tuple[int, int]], dep_list)
+                channels[j].component_addr = channels[dep_list[0][1]].address
+                last_index = dep_list[-1][1]
+                channels[j].next_ch_addr = channels[last_index].next_ch_addr
+                channels[last_index].next_ch_addr = 0
+
+                for _, ch_nr in dep_list:
+                    channels[ch_nr].source_addr = 0
+
+        channel_group = group.channel_group
+        channel_group.first_sample_reduction_addr = 0
+        channel_group.first_ch_addr = channels[0].address if channels else 0
+        channel_group.next_cg_addr = 0
+        address = channel_group.to_blocks(address, blocks, self._defined_texts, self._si_map)
+
+        data_group = group.data_group
+        data_group.first_cg_addr = channel_group.address
+        data_group.data_block_addr = 0
+        data_group.next_dg_addr = 0
+        data_group.to_blocks(address, blocks, self._defined_texts)
+
+        self._write_blocks(blocks)
+
+        return data_group.address
+
+    def _write_records(self, index: int, records: bytes | bytearray | memoryview) -> None:
+        """Write the records as data blocks of up to `write_fragment_size`
+        bytes at the end of the file.
+        """
+        if not len(records):
+            return
+
+        group = self._mdf4.groups[index]
+        state = self._groups[index]
+        record_size = group.channel_group.samples_byte_nr + group.channel_group.invalidation_bytes_nr
+
+        block_size = max(self._mdf4._write_fragment_size // record_size, 1) * record_size
+        records = memoryview(records)
+        write = self._file.write
+
+        self._file.seek(0, 2)
+        address = self._file.tell()
+
+        for offset in range(0, len(records), block_size):
+            data = records[offset : offset + block_size]
+
+            block: DataBlock | DataZippedBlock
+            if self.compression == v4c.CompressionAlgorithm.DEFLATE:
+                block = DataZippedBlock(data=data, zip_type=v4c.FLAG_DZ_DEFLATE, param=0)
+            elif self.compression == v4c.CompressionAlgorithm.TRANSPOSED_DEFLATE:
+                block = DataZippedBlock(data=data, zip_type=v4c.FLAG_DZ_TRANSPOSED_DEFLATE, param=record_size)
+            else:
+                block = DataBlock(data=data)
+
+            write(bytes(block))
+            align = block.block_len % 8
+            if align:
+                write(b"\0" * (8 - align))
+
+            state.pending_blocks.append((address, len(data)))
+            address = self._file.tell()
+
+    def _finalize_group(self, index: int) -> None:
+        """Link the pending data blocks of the group in a new data list, then
+        update the channel group cycles counter.
+        """
+        group = self._mdf4.groups[index]
+        state = self._groups[index]
+
+        if state.pending_blocks:
+            blocks_nr = len(state.pending_blocks)
+            dl_kwargs: DataListKwargs = {
+                "flags": 0,
+                "links_nr": blocks_nr + 1,
+                "data_block_nr": blocks_nr,
+            }
+            for i, (address, size) in enumerate(state.pending_blocks):
+                dl_kwargs[f"data_block_addr{i}"] = address  # type: ignore[literal-required]
+                dl_kwargs[f"offset_{i}"] = state.data_size  # type: ignore[literal-required]
+                state.data_size += size
+            data_list = DataList(**dl_kwargs)
+
+            self._file.seek(0, 2)
+            data_list.address = self._file.tell()
+            self._file.write(bytes(data_list))
+            state.pending_blocks.clear()
+
+            # the new data list is appended to the chain with a single block
+            # update so that the file is consistent at every step
+            if state.last_data_list is not None:
+                state.last_data_list.next_dl_addr = data_list.address
+                self._rewrite(state.last_data_list)
+
+            elif self.compression:
+                header_list = HeaderList(
+                    flags=0,
+                    zip_type=(
+                        v4c.FLAG_DZ_DEFLATE
+                        if self.compression == v4c.CompressionAlgorithm.DEFLATE
+                        else v4c.FLAG_DZ_TRANSPOSED_DEFLATE
+                    ),
+                    first_dl_addr=data_list.address,
+                )
+                header_list.address = self._file.tell()
+                self._file.write(bytes(header_list))
+
+                group.data_group.data_block_addr = header_list.address
+                self._rewrite(group.data_group)
+
+            else:
+                group.data_group.data_block_addr = data_list.address
+                self._rewrite(group.data_group)
+
+            state.last_data_list = data_list
+
+        self._rewrite(group.channel_group)
@@ -1,12 +1,29 @@
 #!/usr/bin/env python
+import builtins
+from datetime import datetime, timezone
+import gzip
+import os
 from pathlib import Path
+import pickle
+import shutil
+from struct import unpack_from
 import tempfile
 import unittest
+from unittest import mock
+from zipfile import ZipFile
 
 import numpy as np
+import pandas as pd
 
-from asammdf import MDF, Signal
+from asammdf import MDF, Signal, StreamingMDF4Writer
+from asammdf.blocks import cache_utils
+from asammdf.blocks import v4_constants as v4c
+from asammdf.blocks.conversion_utils import from_dict
+from asammdf.blocks.cutils import data_block_from_arrays, scan_block_headers
 from asammdf.blocks.mdf_v4 import MDF4
+from asammdf.blocks.utils import all_blocks_addresses, MdfException, Terminated
+from asammdf.blocks.v4_blocks import CC, CN, FileHistory, ZERO_LIMITS
+from asammdf.signal import interp_signals
 
 CHANNEL_LEN = 100000
 
@@ -145,6 +162,1102 @@ class TestMDF4(unittest.TestCase):
 
         self.assertTrue((record == signal.samples).all())
 
+    def test_metadata_cache(self) -> None:
+        user_cache = mock.patch.object(
+            cache_utils, "user_cache_folder", return_value=Path(TestMDF4.tempdir.name) / "user_cache"
+        )
+        user_cache.start()
+        self.addCleanup(user_cache.stop)
+
+        sig = Signal(
+            np.random.random(CHANNEL_LEN),
+            np.arange(CHANNEL_LEN, dtype=np.float64),
+            name="Float Channel",
+            unit="unit",
+        )
+
+        with MDF(version="4.10") as mdf:
+            mdf.append([sig])
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "cached.mf4", overwrite=True)
+
+        # the index is stored in the per-user cache folder
+        index_file = cache_utils.metadata_cache_path(outfile)
+        self.assertEqual(index_file.parent, Path(TestMDF4.tempdir.name) / "user_cache" / "metadata")
+
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            self.assertTrue(np.array_equal(mdf.get(sig.name).samples, sig.samples))
+        self.assertTrue(index_file.exists())
+        if os.name == "posix":
+            key_file = Path(TestMDF4.tempdir.name) / "user_cache" / "metadata.key"
+            self.assertEqual(key_file.stat().st_mode & 0o777, 0o600)
+
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            ret_sig = mdf.get(sig.name)
+            self.assertEqual(ret_sig.unit, sig.unit)
+            self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+            self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+        # an index that was not written with the user's key is not unpickled
+        class Payload:
+            def __reduce__(self):
+                return exec, ("import builtins; builtins.asammdf_index_loaded = True",)
+
+        index = index_file.read_bytes()
+        index_file.write_bytes(index[:32] + pickle.dumps(Payload()))
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            self.assertTrue(np.array_equal(mdf.get(sig.name).samples, sig.samples))
+        self.assertFalse(hasattr(builtins, "asammdf_index_loaded"))
+
+        # a modified file invalidates the index
+        with MDF(version="4.10") as mdf:
+            mdf.append([sig * 2])
+            mdf.save(outfile, overwrite=True)
+
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            self.assertTrue(np.array_equal(mdf.get(sig.name).samples, sig.samples * 2))
+
+        # the signal data blocks of the VLSD channels are not stored in the index
+        strings = Signal(
+            np.array([f"Value {i}".encode() for i in range(CHANNEL_LEN)]),
+            np.arange(CHANNEL_LEN, dtype=np.float64),
+            name="String Channel",
+            encoding="utf-8",
+        )
+        with MDF(version="4.10") as mdf:
+            mdf.append([strings])
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "cached_vlsd.mf4", overwrite=True)
+
+        for _ in range(2):
+            with MDF(outfile, use_metadata_cache=True) as mdf:
+                self.assertTrue(np.array_equal(mdf.get(strings.name).samples, strings.samples))
+
+        # the index of the zipped files is named after the archive
+        archive_name = outfile.with_suffix(".mf4z")
+        with ZipFile(archive_name, "w") as archive:
+            archive.write(outfile, outfile.name)
+
+        for _ in range(2):
+            with MDF(archive_name, use_metadata_cache=True) as mdf:
+                self.assertTrue(np.array_equal(mdf.get(strings.name).samples, strings.samples))
+            self.assertTrue(cache_utils.metadata_cache_path(archive_name).exists())
+
+        # the unfinalised files are not cached
+        with MDF(version="4.00") as mdf:
+            mdf.append([sig])
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "unfinalised.mf4", overwrite=True)
+
+        with open(outfile, "r+b") as stream:
+            stream.write(b"UnFinMF ")
+            stream.seek(60)
+            stream.write((1).to_bytes(2, "little"))
+
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            self.assertTrue(np.array_equal(mdf.get(sig.name).samples, sig.samples))
+        self.assertFalse(cache_utils.metadata_cache_path(outfile).exists())
+
+    def test_parallel_decompression(self) -> None:
+        sigs = [
+            Signal(
+                np.random.random(CHANNEL_LEN),
+                np.arange(CHANNEL_LEN, dtype=np.float64),
+                name=f"Channel_{i}",
+            )
+            for i in range(4)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "zipped.mf4", overwrite=True, compression=2)
+
+        for thread_count in (1, 3):
+            with MDF(outfile) as mdf:
+                mdf.configure(decompression_thread_count=thread_count)
+                self.assertGreater(len(mdf.groups[0].data_blocks), 1)
+
+                for sig, ret_sig in zip(sigs, mdf.select([sig.name for sig in sigs]), strict=True):
+                    self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+
+                ret_sig = mdf.get(sigs[0].name, record_offset=CHANNEL_LEN // 2, record_count=1000)
+                start = CHANNEL_LEN // 2
+                self.assertTrue(np.array_equal(ret_sig.samples, sigs[0].samples[start : start + 1000]))
+
+    def test_time_range_read(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64) * 0.01
+        sig = Signal(np.random.random(CHANNEL_LEN), timestamps, name="Channel")
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append([sig])
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "time_range.mf4", overwrite=True, compression=2)
+
+        with MDF(outfile) as mdf:
+            for start, stop in ((12.345, 20.0), (None, 3.0), (40.0, None), (-1.0, 0.0), (1e6, 2e6)):
+                expected = sig.cut(start, stop, include_ends=False)
+
+                ret_sig = mdf.get("Channel", start=start, stop=stop)
+                self.assertTrue(np.array_equal(ret_sig.timestamps, expected.timestamps))
+                self.assertTrue(np.array_equal(ret_sig.samples, expected.samples))
+
+                (ret_sig,) = mdf.select(["Channel"], start=start, stop=stop)
+                self.assertTrue(np.array_equal(ret_sig.samples, expected.samples))
+
+                fragments = list(mdf.iter_get("Channel", start=start, stop=stop))
+                samples = np.concatenate([fragment.samples for fragment in fragments]) if fragments else []
+                self.assertTrue(np.array_equal(samples, expected.samples))
+
+    def test_master_summary(self) -> None:
+        user_cache = mock.patch.object(
+            cache_utils, "user_cache_folder", return_value=Path(TestMDF4.tempdir.name) / "user_cache"
+        )
+        user_cache.start()
+        self.addCleanup(user_cache.stop)
+
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64) * 0.01
+        sig = Signal(np.random.random(CHANNEL_LEN), timestamps, name="Channel")
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append([sig])
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "master_summary.mf4", overwrite=True, compression=2)
+
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            mdf.get("Channel", start=300.0, stop=310.0)
+
+            cut = mdf.cut(start=300.0, stop=310.0)
+            expected = sig.cut(300.0, 310.0)
+            ret_sig = cut.get("Channel")
+            self.assertTrue(np.array_equal(ret_sig.timestamps, expected.timestamps))
+            self.assertTrue(np.array_equal(ret_sig.samples, expected.samples))
+            cut.close()
+
+        with MDF(outfile, use_metadata_cache=True) as mdf:
+            blocks = mdf.groups[0].data_blocks
+            self.assertGreater(len(blocks), 1)
+            self.assertTrue(any(info.first_timestamp is not None for info in blocks))
+
+            position = 0
+            for info in blocks:
+                first = position // 16
+                position += info.original_size
+                if info.first_timestamp is not None:
+                    self.assertEqual(info.first_timestamp, timestamps[first])
+                    self.assertEqual(info.last_timestamp, timestamps[position // 16 - 1])
+
+        cache_utils.metadata_cache_path(outfile).unlink()
+
+    def test_zero_copy_get(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+        sigs = [
+            Signal(np.random.random(CHANNEL_LEN), timestamps, name="Float"),
+            Signal(np.arange(CHANNEL_LEN, dtype=">i4"), timestamps, name="Int"),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "zero_copy.mf4", overwrite=True, compression=0)
+
+        mdf = MDF(outfile)
+        self.assertGreater(len(list(mdf.groups[0].get_data_blocks())), 1)
+
+        for sig in sigs:
+            ret_sig = mdf.get(sig.name, copy=False)
+            self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+            self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+        # records inside a single data block are returned as a view over the file
+        ret_sig = mdf.get("Int", copy=False, record_offset=10, record_count=100)
+        self.assertFalse(ret_sig.samples.flags.writeable)
+        self.assertTrue(np.array_equal(ret_sig.samples, sigs[1].samples[10:110]))
+
+        mdf.close()
+        self.assertTrue(np.array_equal(ret_sig.samples, sigs[1].samples[10:110]))
+
+    def test_parallel_extraction(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+        sigs = [
+            Signal((np.arange(CHANNEL_LEN) * i).astype(dtype), timestamps, name=f"Channel_{i}")
+            for i, dtype in enumerate(("<u1", "<i2", ">u4", "<f8", ">i8") * 4)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "extraction.mf4", overwrite=True)
+
+        for thread_count in (1, 3):
+            with MDF(outfile) as mdf:
+                mdf.configure(extraction_thread_count=thread_count, read_fragment_size=64 * 1024)
+
+                for sig, ret_sig in zip(sigs, mdf.select([sig.name for sig in sigs]), strict=True):
+                    self.assertEqual(ret_sig.samples.dtype, sig.samples.dtype)
+                    self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+
+    def test_prefetch(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+        sigs = [Signal(np.arange(CHANNEL_LEN) * i, timestamps, name=f"Channel_{i}") for i in range(5)]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "prefetch.mf4", overwrite=True, compression=2)
+
+        # the unfinalised files are read from a temporary copy on the background thread
+        data = bytearray(outfile.read_bytes())
+        data[:8] = b"UnFinMF "
+        data[60] = 1
+        unfinalised = Path(TestMDF4.tempdir.name) / "prefetch_unfinalised.mf4"
+        unfinalised.write_bytes(data)
+
+        # the file descriptor of a gzip file object belongs to the compressed file
+        with open(outfile, "rb") as stream, gzip.open(outfile.with_suffix(".mf4.gz"), "wb") as compressed:
+            shutil.copyfileobj(stream, compressed)
+
+        for prefetch_depth in (0, 1, 8):
+            # memory mapped file, file opened by MDF4 and user file objects
+            with (
+                MDF(outfile) as mdf,
+                MDF(unfinalised) as mdf_unfinalised,
+                open(outfile, "rb") as stream,
+                MDF(stream) as mdf_stream,
+                gzip.open(outfile.with_suffix(".mf4.gz"), "rb") as compressed,
+                MDF(compressed) as mdf_gzip,
+            ):
+                for mdf_ in (mdf, mdf_unfinalised, mdf_stream, mdf_gzip):
+                    mdf_.configure(prefetch_depth=prefetch_depth, read_fragment_size=256 * 1024)
+
+                    for sig, ret_sig in zip(sigs, mdf_.select([sig.name for sig in sigs]), strict=True):
+                        self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                        self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+                    ret_sig = mdf_.get("Channel_3", start=50000.5, stop=60000)
+                    self.assertTrue(np.array_equal(ret_sig.timestamps, timestamps[50001:60001]))
+
+    def test_parallel_compression(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+        sigs = [Signal(np.arange(CHANNEL_LEN) * i, timestamps, name=f"Channel_{i}") for i in range(5)]
+        strings = np.array([f"value {i}".encode() * 5 for i in range(5000)])
+        string_sig = Signal(strings, np.arange(len(strings), dtype=np.float64), name="Strings", encoding="utf-8")
+        start_time = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        for compression in (1, 2):
+            outputs = []
+            for compression_thread_count in (1, 3):
+                with MDF(version="4.10") as mdf:
+                    mdf.configure(write_fragment_size=64 * 1024, compression_thread_count=compression_thread_count)
+                    mdf.header.start_time = start_time
+                    file_history = FileHistory()
+                    file_history.time_stamp = start_time
+                    mdf.file_history.append(file_history)
+                    mdf.append(sigs)
+                    mdf.append(string_sig)
+                    outfile = mdf.save(
+                        Path(TestMDF4.tempdir.name) / f"compression_{compression_thread_count}.mf4",
+                        overwrite=True,
+                        compression=compression,
+                        add_history_block=False,
+                    )
+                outputs.append(outfile.read_bytes())
+
+            self.assertEqual(outputs[0], outputs[1])
+
+            with MDF(outfile) as mdf:
+                for sig, ret_sig in zip(sigs, mdf.select([sig.name for sig in sigs]), strict=True):
+                    self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                self.assertTrue(np.array_equal(mdf.get("Strings").samples, strings))
+
+    def test_streaming_writer(self) -> None:
+        timestamps = np.arange(100, dtype=np.float64)
+        integers = Signal(np.arange(100, dtype=np.int32), timestamps, name="Integers", conversion={"a": 2, "b": 1})
+        floats = Signal(timestamps / 2, timestamps, name="Floats", invalidation_bits=np.zeros(100, dtype=bool))
+
+        for compression in (0, 1, 2):
+            outfile = Path(TestMDF4.tempdir.name) / f"streaming_{compression}.mf4"
+            crashed_file = Path(TestMDF4.tempdir.name) / f"streaming_crashed_{compression}.mf4"
+
+            with StreamingMDF4Writer(
+                outfile, compression=compression, finalize_interval=None, overwrite=True
+            ) as writer:
+                index = writer.append([integers, floats])
+                for i in range(1, 10):
+                    t = timestamps + 100 * i
+                    writer.extend(index, [(t, None), (t.astype(np.int32), None), (t / 2, t % 3 == 0)])
+                    if i == 4:
+                        writer.finalize()
+
+                # the last finalized state is a valid file
+                crashed_file.write_bytes(outfile.read_bytes())
+
+            with MDF(crashed_file) as mdf:
+                sig = mdf.get("Integers")
+                self.assertTrue(np.array_equal(sig.timestamps, np.arange(500, dtype=np.float64)))
+                self.assertTrue(np.array_equal(sig.samples, np.arange(500) * 2 + 1))
+
+            with MDF(outfile) as mdf:
+                sig = mdf.get("Integers")
+                self.assertTrue(np.array_equal(sig.timestamps, np.arange(1000, dtype=np.float64)))
+                self.assertTrue(np.array_equal(sig.samples, np.arange(1000) * 2 + 1))
+
+                sig = mdf.get("Floats", ignore_invalidation_bits=True)
+                self.assertTrue(np.array_equal(sig.samples, np.arange(1000) / 2))
+                invalidation_bits = np.arange(1000) % 3 == 0
+                invalidation_bits[:100] = False
+                self.assertTrue(np.array_equal(np.asarray(sig.invalidation_bits), invalidation_bits))
+
+        with self.assertRaises(MdfException):
+            StreamingMDF4Writer(outfile)
+
+        with self.assertRaises(MdfException):
+            StreamingMDF4Writer(outfile, version="4.20", overwrite=True)
+
+    def test_incremental_save(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+        sigs = [Signal(np.arange(CHANNEL_LEN) * i, timestamps, name=f"Channel_{i}") for i in range(5)]
+        outfile = Path(TestMDF4.tempdir.name) / "incremental.mf4"
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs)
+            mdf.save(outfile, overwrite=True, compression=2)
+
+        original = outfile.read_bytes()
+
+        with MDF(outfile) as mdf:
+            mdf.header.comment = "annotated"
+            mdf.attach(b"annotation", file_name="annotation.txt")
+            mdf.save(outfile, overwrite=True, incremental=True)
+
+            # only the header block is changed; the new metadata is appended
+            updated = outfile.read_bytes()
+            header_end = 64 + 104
+            self.assertEqual(updated[:64], original[:64])
+            self.assertEqual(updated[header_end : len(original)], original[header_end:])
+            self.assertLess(len(updated) - len(original), 16 * 1024)
+
+            self.assertEqual(len(mdf.attachments), 1)
+            self.assertTrue(np.array_equal(mdf.get("Channel_3").samples, sigs[3].samples))
+
+        with MDF(outfile) as mdf:
+            self.assertIn("annotated", mdf.header.comment)
+            self.assertEqual(str(mdf.attachments[0].file_name), "annotation.txt")
+            for sig, ret_sig in zip(sigs, mdf.select([sig.name for sig in sigs]), strict=True):
+                self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+
+            # the unchanged embedded attachments are kept in place
+            data = np.random.default_rng(0).bytes(2 * 1024 * 1024)
+            mdf.attach(data, file_name="large.bin", compression=False)
+            mdf.save(outfile, overwrite=True, incremental=True)
+            size = outfile.stat().st_size
+
+            mdf.header.comment = "annotated again"
+            mdf.save(outfile, overwrite=True, incremental=True)
+            self.assertLess(outfile.stat().st_size - size, 16 * 1024)
+
+            mdf.attach(b"second annotation", file_name="annotation_2.txt")
+            mdf.save(outfile, overwrite=True, incremental=True)
+            self.assertLess(outfile.stat().st_size - size, 32 * 1024)
+
+            self.assertIn("annotated again", mdf.header.comment)
+            self.assertEqual(
+                [str(at_block.file_name) for at_block in mdf.attachments],
+                ["annotation.txt", "large.bin", "annotation_2.txt"],
+            )
+            self.assertEqual(mdf.extract_attachment(0)[0], b"annotation")
+            self.assertEqual(mdf.extract_attachment(1)[0], data)
+            self.assertEqual(mdf.extract_attachment(2)[0], b"second annotation")
+
+            # a new channel group requires a full rewrite
+            mdf.append(Signal(np.ones(10), np.arange(10, dtype=np.float64), name="New"))
+            mdf.save(outfile, overwrite=True, incremental=True)
+
+            self.assertTrue(np.array_equal(mdf.get("New").samples, np.ones(10)))
+            self.assertTrue(np.array_equal(mdf.get("Channel_4").samples, sigs[4].samples))
+
+    def test_lazy_channel_metadata(self) -> None:
+        timestamps = np.arange(100, dtype=np.float64)
+        sigs = [
+            Signal(
+                np.arange(100),
+                timestamps,
+                name=f"Channel_{i}",
+                unit=f"unit_{i % 3}",
+                comment=f"comment {i}",
+                conversion={"a": i + 1, "b": 0.5},
+            )
+            for i in range(20)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "lazy.mf4", overwrite=True)
+
+        with MDF(outfile) as mdf, MDF(outfile, lazy_channel_metadata=True) as lazy_mdf:
+            channels = lazy_mdf.groups[0].channels
+            self.assertTrue(all(channel._metadata_source is not None for channel in channels))
+
+            ret_sig = lazy_mdf.get("Channel_5")
+            self.assertEqual(ret_sig.unit, "unit_2")
+            self.assertEqual(ret_sig.comment, "comment 5")
+            self.assertTrue(np.array_equal(ret_sig.samples, np.arange(100) * 6 + 0.5))
+            self.assertEqual(
+                sum(channel._metadata_source is None for channel in channels),
+                2,  # time and Channel_5
+            )
+
+            for sig in sigs:
+                self.assertEqual(lazy_mdf.get_channel_unit(sig.name), mdf.get_channel_unit(sig.name))
+                self.assertEqual(lazy_mdf.get_channel_comment(sig.name), mdf.get_channel_comment(sig.name))
+
+        # the deferred metadata cannot be loaded after the file is closed
+        with MDF(outfile, lazy_channel_metadata=True) as lazy_mdf:
+            channel = lazy_mdf.groups[0].channels[3]
+
+        with self.assertRaises(MdfException):
+            _ = channel.unit
+
+    def test_compact_channel_metadata(self) -> None:
+        timestamps = np.arange(10, dtype=np.float64)
+        sigs = [
+            Signal(
+                np.arange(10, dtype=np.int16) + i,
+                timestamps,
+                name=f"Channel_{i}",
+                unit="unit",
+                conversion={"a": float(i), "b": -0.5},
+            )
+            for i in range(5)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs, common_timebase=True)
+            channels = mdf.groups[0].channels
+            channels[1].lower_limit = -0.0
+            channels[2].upper_limit = 10.0
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "compact.mf4", overwrite=True)
+
+        with open(outfile, "rb") as stream:
+            data = stream.read()
+
+        with MDF(outfile) as mdf:
+            channels = mdf.groups[0].channels
+            for channel in channels:
+                # the compact objects give the same block bytes as the file
+                self.assertEqual(bytes(channel), data[channel.address : channel.address + channel.block_len])
+                self.assertIs(channel.id, CN)
+
+                limits = (
+                    channel.min_raw_value,
+                    channel.max_raw_value,
+                    channel.lower_limit,
+                    channel.upper_limit,
+                    channel.lower_ext_limit,
+                    channel.upper_ext_limit,
+                )
+                expected_limits = unpack_from("<6d", data, channel.address + 24 + channel.links_nr * 8 + 24)
+                self.assertEqual(
+                    [np.signbit(limit) for limit in limits], [np.signbit(limit) for limit in expected_limits]
+                )
+                self.assertEqual(limits, expected_limits)
+
+                conversion = channel.conversion
+                if conversion is not None:
+                    self.assertEqual(
+                        bytes(conversion), data[conversion.address : conversion.address + conversion.block_len]
+                    )
+                    self.assertIs(conversion.id, CC)
+
+            self.assertEqual([channel.conversion.a for channel in channels[1:]], [0.0, 1.0, 2.0, 3.0, 4.0])
+            self.assertTrue(all(limit is ZERO_LIMITS[0] for limit in ZERO_LIMITS))
+            self.assertIs(channels[3].lower_limit, ZERO_LIMITS[0])
+            self.assertTrue(np.signbit(channels[1].lower_limit))
+            self.assertEqual(channels[2].upper_limit, 10.0)
+
+    def test_block_headers_scan(self) -> None:
+        timestamps = np.arange(100, dtype=np.float64)
+        sigs = [Signal(np.arange(100) * i, timestamps, name=f"Channel_{i}", unit="unit") for i in range(10)]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs)
+            mdf.append(sigs)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "scan.mf4", overwrite=True)
+
+        with open(outfile, "rb") as stream:
+            data = stream.read()
+            blocks, block_groups, addresses = all_blocks_addresses(stream)
+
+        addresses_array, ids, block_lengths, links_nrs = scan_block_headers(data)
+
+        # follow the links starting from the HD block to get the expected headers
+        expected = {}
+        _, _, _, links_nr = unpack_from("<4s4s2Q", data, 64)
+        pending = [link for link in unpack_from(f"<{links_nr}Q", data, 64 + 24) if link]
+        while pending:
+            address = pending.pop()
+            if address in expected:
+                continue
+            block_id, _, block_len, links_nr = unpack_from("<4s4s2Q", data, address)
+            expected[address] = block_id, block_len, links_nr
+            pending.extend(link for link in unpack_from(f"<{links_nr}Q", data, address + 24) if link)
+
+        self.assertEqual(addresses, sorted(expected))
+        self.assertEqual(addresses_array.tolist(), sorted(expected))
+        self.assertEqual(blocks, {address: block_id for address, (block_id, _, _) in expected.items()})
+        self.assertEqual(
+            list(zip(ids.tolist(), block_lengths.tolist(), links_nrs.tolist(), strict=True)),
+            [expected[address] for address in sorted(expected)],
+        )
+
+        with MDF(outfile) as mdf:
+            self.assertEqual(block_groups[b"##DG"], [group.data_group.address for group in mdf.groups])
+            self.assertEqual(block_groups[b"##CG"], [group.channel_group.address for group in mdf.groups])
+            self.assertEqual(
+                block_groups[b"##CN"],
+                sorted(channel.address for group in mdf.groups for channel in group.channels),
+            )
+
+    def test_raw_blocks_passthrough(self) -> None:
+        timestamps = np.arange(CHANNEL_LEN) * 0.01
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype=np.int32), timestamps, name="Int32", conversion={"a": 2.0, "b": 1.0}),
+            Signal(np.sin(timestamps), timestamps, name="Sin"),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "passthrough.mf4", overwrite=True, compression=2)
+
+        with MDF(outfile) as mdf:
+            source_blocks = mdf._mdf.groups[0].data_blocks
+            self.assertGreater(len(source_blocks), 2)
+            source = mdf.get("Int32", raw=True)
+
+            # only the two blocks that contain the interval limits are encoded again
+            cut = mdf.cut(100.005, 500.0, include_ends=False)
+            blocks = cut._mdf.groups[0].data_blocks
+            self.assertGreater(len(blocks), 2)
+            self.assertEqual({blocks[0].block_type, blocks[-1].block_type}, {v4c.DZ_BLOCK_LZ})
+            source_sizes = [(info.block_type, info.compressed_size) for info in source_blocks]
+            for info in blocks[1:-1]:
+                self.assertIn((info.block_type, info.compressed_size), source_sizes)
+            expected = source.cut(100.005, 500.0, include_ends=False)
+            signal = cut.get("Int32", raw=True)
+            self.assertTrue(np.array_equal(signal.samples, expected.samples))
+            self.assertTrue(np.array_equal(signal.timestamps, expected.timestamps))
+
+            filtered = mdf.filter(["Int32", "Sin"])
+            self.assertEqual(len(filtered._mdf.groups[0].data_blocks), len(source_blocks))
+            self.assertTrue(np.array_equal(filtered.get("Int32", raw=True).samples, source.samples))
+
+            # the interpolated ends need the decoded samples
+            cut = mdf.cut(100.005, 500.0, include_ends=True)
+            self.assertEqual(len(cut.get("Int32")), len(expected) + 1)
+
+            mdf.cut(100.005, 500.0, inplace=True)
+            signal = mdf.get("Int32", raw=True)
+            self.assertTrue(np.array_equal(signal.samples, expected.samples))
+
+        files = []
+        for i in range(2):
+            with MDF(version="4.10") as mdf:
+                mdf.configure(write_fragment_size=64 * 1024)
+                mdf.append([Signal(sig.samples, timestamps + i * 2000, name=sig.name) for sig in sigs])
+                files.append(
+                    mdf.save(Path(TestMDF4.tempdir.name) / f"passthrough_{i}.mf4", overwrite=True, compression=1)
+                )
+
+        with MDF.concatenate(files, sync=False) as mdf:
+            signal = mdf.get("Sin")
+            self.assertEqual(len(signal), 2 * CHANNEL_LEN)
+            self.assertTrue(np.array_equal(signal.timestamps, np.concatenate([timestamps, timestamps + 2000])))
+            self.assertTrue(np.array_equal(signal.samples, np.concatenate([sigs[1].samples, sigs[1].samples])))
+
+    def test_data_block_from_arrays(self) -> None:
+        cycles = 1000
+        rng = np.random.default_rng(0)
+        values = np.arange(2 * cycles, dtype=np.int32)[::2]
+        bits = [rng.integers(0, 2, cycles).astype(bool) for _ in range(10)]
+
+        records = data_block_from_arrays([(values, 4), ([bits[0], None, *bits[1:]], 2), (b"\x01" * cycles, 1)], cycles)
+
+        expected = np.zeros(cycles, dtype=[("values", "<i4"), ("bits", "<u2"), ("bytes", "u1")])
+        expected["values"] = values
+        expected["bits"] = bits[0].astype("<u2")
+        for position, bit in enumerate(bits[1:], 2):
+            expected["bits"] |= bit.astype("<u2") << position
+        expected["bytes"] = 1
+
+        self.assertEqual(bytes(records), expected.tobytes())
+
+        with self.assertRaises(ValueError):
+            data_block_from_arrays([(values, 8)], cycles)
+
+        with self.assertRaises(ValueError):
+            data_block_from_arrays([(bits, 1)], cycles)
+
+        # the invalidation bits are packed in the extended records
+        timestamps = np.arange(cycles, dtype=np.float64)
+        with MDF(version="4.10") as mdf:
+            sigs = [
+                Signal(values, timestamps, name=f"Channel_{i}", invalidation_bits=bit) for i, bit in enumerate(bits)
+            ]
+            index = mdf.append(sigs, common_timebase=True)
+            mdf.extend(index, [(timestamps + cycles, None)] + [(values, ~bit) for bit in bits])
+
+            for i, bit in enumerate(bits):
+                signal = mdf.get(f"Channel_{i}", ignore_invalidation_bits=True)
+                self.assertTrue(np.array_equal(signal.invalidation_bits, np.concatenate([bit, ~bit])))
+
+    def test_append_buffer(self) -> None:
+        chunk = 100
+        timestamps = np.arange(chunk, dtype=np.float64)
+        samples = np.arange(chunk, dtype=np.int32)
+
+        for version in ("4.10", "4.20"):
+            for buffer_size, blocks_nr in ((0, 100), (1024 * 1024, 3)):
+                with MDF(version=version) as mdf:
+                    mdf.configure(append_buffer_size=buffer_size)
+                    mdf.append([Signal(samples, timestamps, name="Int32")])
+
+                    for i in range(1, 100):
+                        mdf.extend(0, [(timestamps + i * chunk, None), (samples + i * chunk, None)])
+
+                        # the pending records are visible to the readers
+                        if i == 50:
+                            signal = mdf.get("Int32")
+                            self.assertTrue(np.array_equal(signal.samples, np.arange(51 * chunk)))
+
+                    signal = mdf.get("Int32")
+                    self.assertTrue(np.array_equal(signal.samples, np.arange(100 * chunk)))
+                    self.assertTrue(np.array_equal(signal.timestamps, np.arange(100 * chunk)))
+
+                    # the buffered records are written by the read and at the end
+                    index = len(mdf.groups) - 1
+                    self.assertEqual(len(mdf.groups[index].data_blocks), blocks_nr)
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(append_buffer_samples=10 * chunk)
+            mdf.append([Signal(samples, timestamps, name="Int32")])
+
+            for i in range(1, 100):
+                mdf.extend(0, [(timestamps + i * chunk, None), (samples + i * chunk, None)])
+
+            record_size = mdf.groups[0].channel_group.samples_byte_nr
+            sizes = [info.original_size // record_size for info in mdf.groups[0].data_blocks]
+            self.assertEqual(sizes, [chunk] + [10 * chunk] * 9)
+
+            output = Path(TestMDF4.tempdir.name) / "tmp_append_buffer.mf4"
+            mdf.save(output, overwrite=True)
+
+        with MDF(output) as mdf:
+            self.assertTrue(np.array_equal(mdf.get("Int32").samples, np.arange(100 * chunk)))
+
+    def test_compression_level(self) -> None:
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+        noise = [rng.integers(0, 2**63, CHANNEL_LEN, dtype=np.uint64) for _ in range(15)]
+        ramp = np.arange(CHANNEL_LEN, dtype=np.uint64) % 100
+
+        output = Path(TestMDF4.tempdir.name) / "tmp_compression_level.mf4"
+
+        with MDF(version="4.10") as mdf:
+            mdf.append([Signal(samples, timestamps, name=f"Noise_{i}") for i, samples in enumerate(noise)])
+            mdf.append([Signal(ramp, timestamps, name="Ramp")])
+
+            for compression_level, noise_block_type in (
+                (None, v4c.DZ_BLOCK_TRANSPOSED),
+                ("fastest", v4c.DT_BLOCK),
+                ("balanced", v4c.DT_BLOCK),
+                ("smallest", v4c.DZ_BLOCK_TRANSPOSED),
+            ):
+                mdf.save(output, overwrite=True, compression=2, compression_level=compression_level)
+
+                with MDF(output) as saved:
+                    self.assertTrue(np.array_equal(saved.get("Noise_14").samples, noise[14]))
+                    self.assertTrue(np.array_equal(saved.get("Ramp").samples, ramp))
+
+                    # the smallest policy keeps the blocks that compress a little
+                    noise_blocks = list(saved.groups[0].get_data_blocks())
+                    self.assertTrue(all(info.block_type == noise_block_type for info in noise_blocks))
+                    ramp_blocks = list(saved.groups[1].get_data_blocks())
+                    self.assertTrue(all(info.block_type == v4c.DZ_BLOCK_TRANSPOSED for info in ramp_blocks))
+
+            with self.assertRaises(MdfException):
+                mdf.save(output, overwrite=True, compression=2, compression_level="best")  # type: ignore[arg-type]
+
+    def test_group_threads(self) -> None:
+        rng = np.random.default_rng(0)
+
+        with MDF(version="4.10") as mdf:
+            for i in range(10):
+                timestamps = np.sort(rng.uniform(0, 10, 1000))
+                sigs = [Signal(rng.standard_normal(1000), timestamps, name=f"Channel_{i}_{j}") for j in range(5)]
+                mdf.append(sigs, comment=f"Group {i}")
+
+            results = {}
+            for group_thread_count in (1, 4):
+                # the larger groups are read by the output writer
+                for read_fragment_size in (0, 10000):
+                    mdf.configure(group_thread_count=group_thread_count, read_fragment_size=read_fragment_size)
+                    results[group_thread_count, read_fragment_size] = (mdf.convert("4.20"), mdf.resample(0.01))
+
+            for converted, resampled in results.values():
+                self.assertEqual(
+                    [group.channel_group.comment for group in resampled.groups], [f"Group {i}" for i in range(10)]
+                )
+
+                for i in range(10):
+                    original = mdf.get(f"Channel_{i}_4")
+                    signal = converted.get(f"Channel_{i}_4")
+                    self.assertTrue(np.array_equal(signal.samples, original.samples))
+                    self.assertTrue(np.array_equal(signal.timestamps, original.timestamps))
+
+                    expected = results[1, 0][1].get(f"Channel_{i}_4")
+                    signal = resampled.get(f"Channel_{i}_4")
+                    self.assertTrue(np.array_equal(signal.samples, expected.samples))
+                    self.assertTrue(np.array_equal(signal.timestamps, expected.timestamps))
+
+            for converted, resampled in results.values():
+                converted.close()
+                resampled.close()
+
+    def test_concatenate_inputs(self) -> None:
+        files = []
+        for i in range(4):
+            timestamps = np.arange(100, dtype=np.float64) + i * 100
+            with MDF(version="4.10") as mdf:
+                mdf.append(
+                    [
+                        Signal(np.arange(100, dtype=np.int32) + i * 100, timestamps, name="Counter"),
+                        Signal(np.full(100, i, dtype=np.uint8), timestamps, name="Index"),
+                    ]
+                )
+                files.append(mdf.save(Path(TestMDF4.tempdir.name) / f"concatenate_{i}.mf4", overwrite=True))
+
+        opened = []
+        outputs = []
+        iter_opened_files = MDF._iter_opened_files
+        configure = MDF.configure
+
+        def iter_checked_files(files, **kwargs):
+            checked = []
+            for mdf, close in iter_opened_files(files, **kwargs):
+                # the previous file is closed before the next one is used
+                self.assertTrue(all(previous._mdf._closed for previous in checked))
+                checked.append(mdf)
+                opened.append(mdf)
+                yield mdf, close
+
+        def configure_output(mdf, **kwargs):
+            # the output file is configured from the first input file
+            if "from_other" in kwargs:
+                outputs.append(mdf)
+            return configure(mdf, **kwargs)
+
+        def concatenate(files, **kwargs):
+            opened.clear()
+            outputs.clear()
+            with (
+                mock.patch.object(MDF, "_iter_opened_files", side_effect=iter_checked_files),
+                mock.patch.object(MDF, "configure", autospec=True, side_effect=configure_output),
+            ):
+                return MDF.concatenate(files, sync=False, **kwargs)
+
+        with concatenate(files) as mdf:
+            signal = mdf.get("Counter")
+            self.assertTrue(np.array_equal(signal.samples, np.arange(400, dtype=np.int32)))
+            self.assertTrue(np.array_equal(signal.timestamps, np.arange(400, dtype=np.float64)))
+            self.assertTrue(np.array_equal(mdf.get("Index").samples, np.repeat(np.arange(4, dtype=np.uint8), 100)))
+
+        # the files are checked before they are written
+        self.assertEqual(len(opened), 2 * len(files))
+        self.assertTrue(all(mdf._mdf._closed for mdf in opened))
+
+        # the output and the input files are closed if the concatenation stops
+        progress = mock.NonCallableMagicMock(stop=False)
+        progress.signals.setLabelText.emit.side_effect = lambda text: setattr(progress, "stop", True)
+        with self.assertRaises(Terminated):
+            concatenate(files, progress=progress)
+        self.assertTrue(opened)
+        self.assertTrue(all(mdf._mdf._closed for mdf in opened))
+        self.assertEqual(len(outputs), 1)
+        self.assertTrue(outputs[0]._mdf._closed)
+
+        # the incompatible last file is detected before the samples are written
+        with MDF(version="4.10") as mdf:
+            mdf.append([Signal(np.arange(100, dtype=np.int32), np.arange(100, dtype=np.float64), name="Counter")])
+            files.append(mdf.save(Path(TestMDF4.tempdir.name) / "concatenate_other.mf4", overwrite=True))
+
+        with self.assertRaises(MdfException):
+            concatenate(files)
+        self.assertEqual(len(opened), len(files))
+        self.assertTrue(all(mdf._mdf._closed for mdf in opened))
+        self.assertFalse(outputs)
+
+    def test_stack_fragments(self) -> None:
+        files = []
+        for i in range(3):
+            timestamps = np.arange(CHANNEL_LEN, dtype=np.float64)
+            with MDF(version="4.10") as mdf:
+                mdf.header.start_time = datetime(2020, 1, 1, 0, 0, i, tzinfo=timezone.utc)
+                mdf.configure(write_fragment_size=64 * 1024)
+                mdf.append([Signal(np.arange(CHANNEL_LEN, dtype=np.int32) * i, timestamps, name=f"Channel_{i}")])
+                files.append(mdf.save(Path(TestMDF4.tempdir.name) / f"stack_{i}.mf4", overwrite=True, compression=2))
+
+        for sync in (False, True):
+            with MDF.stack(files, sync=sync) as mdf:
+                mdf.configure(read_fragment_size=64 * 1024)
+                self.assertEqual(len(mdf.groups), 3)
+                for i in range(3):
+                    signal = mdf.get(f"Channel_{i}")
+                    self.assertTrue(np.array_equal(signal.samples, np.arange(CHANNEL_LEN, dtype=np.int32) * i))
+                    self.assertTrue(np.array_equal(signal.timestamps, timestamps + (i if sync else 0)))
+
+    def test_conversion_cache(self) -> None:
+        values = np.arange(100, dtype=np.float64) / 3
+
+        algebraic = from_dict({"formula": "X * 2 + 1"})
+        for _ in range(2):
+            self.assertTrue(np.array_equal(algebraic.convert(values), values * 2 + 1))
+        # the cached formula is replaced when the formula changes
+        algebraic.formula = "X * 3"
+        self.assertTrue(np.array_equal(algebraic.convert(values), values * 3))
+
+        table = from_dict(
+            {"raw_0": 0, "raw_1": 10, "raw_2": 20, "phys_0": 0, "phys_1": 100, "phys_2": 400, "interpolation": True}
+        )
+        for _ in range(2):
+            self.assertTrue(np.array_equal(table.convert(values), np.interp(values, [0, 10, 20], [0, 100, 400])))
+
+        range_table = from_dict(
+            {"lower_0": 0, "upper_0": 9, "phys_0": 1, "lower_1": 10, "upper_1": 19, "phys_1": 2, "default": -1}
+        )
+        # the float values equal to the upper limit are outside the range
+        expected = np.where(values < 9, 1, np.where((values >= 10) & (values < 19), 2, -1))
+        for _ in range(2):
+            self.assertTrue(np.array_equal(range_table.convert(values), expected))
+
+    def test_value2text_as_categorical(self) -> None:
+        value_to_text = {"val_0": 0, "val_1": 1, "val_2": 2, "text_0": b"off", "text_1": b"on", "text_2": b"on"}
+        range_to_text = {"lower_0": 0, "upper_0": 9, "text_0": b"low", "lower_1": 10, "upper_1": 19, "text_1": b"high"}
+
+        values = np.arange(1000, dtype=np.uint8) % 25
+        for conversion in (value_to_text, range_to_text):
+            table = from_dict({**conversion, "default_addr": b"unknown"})
+            codes, categories = table.convert_to_categories(values)  # type: ignore[misc]
+            self.assertEqual(len(categories), len(set(categories.tolist())))
+            self.assertTrue(np.array_equal(categories[codes], table.convert(values)))
+
+        # a referenced conversion that outputs numbers cannot be encoded
+        scaled = from_dict({**value_to_text, "text_2": {"a": 2.0, "b": 0.0}})
+        self.assertIsNone(scaled.convert_to_categories(values))
+
+        # boundary values and overlapping ranges; the small arrays are converted
+        # sample by sample and the large arrays with a table lookup
+        overlapping = from_dict(
+            {
+                "lower_0": 0,
+                "upper_0": 3,
+                "text_0": b"low",
+                "lower_1": 5,
+                "upper_1": 6,
+                "text_1": b"high",
+                "lower_2": 2,
+                "upper_2": 5,
+                "text_2": b"middle",
+                "default_addr": b"default",
+            }
+        )
+        for cycle in ([1.0, 3.0, 5.5, 6.0, 2.0, 5.0, -1.0, 7.0], [0, 2, 3, 4, 5, 6, 7]):
+            for size in (10, 99, 100, 200):
+                cycle_values = np.resize(np.array(cycle), size)
+                codes, categories = overlapping.convert_to_categories(cycle_values)  # type: ignore[misc]
+                self.assertTrue(np.array_equal(categories[codes], overlapping.convert(cycle_values)))
+
+        timestamps = np.arange(1000, dtype=np.float64)
+        with MDF(version="4.10") as mdf:
+            mdf.append(
+                [
+                    Signal(values, timestamps, name="State", conversion={**value_to_text, "default_addr": b"?"}),
+                    Signal(values, timestamps, name="Range", conversion={**range_to_text, "default_addr": b"?"}),
+                ]
+            )
+            mdf.append([Signal(np.arange(500, dtype=np.int16), timestamps[::2] + 0.5, name="Counter")])
+
+            df = mdf.to_dataframe()
+            categorical_df = mdf.to_dataframe(value2text_as_categorical=True)
+
+            for name in ("State", "Range"):
+                self.assertIsInstance(categorical_df[name].dtype, pd.CategoricalDtype)
+                self.assertTrue(categorical_df[name].astype(object).equals(df[name]))
+
+        timestamps = np.arange(200, dtype=np.float64)
+        with MDF(version="4.10") as mdf:
+            mdf.append(
+                [
+                    Signal(
+                        np.resize(np.array([1.0, 3.0, 5.5, 6.0]), 200),
+                        timestamps,
+                        name="Level",
+                        conversion={
+                            "lower_0": 0,
+                            "upper_0": 3,
+                            "text_0": b"low",
+                            "lower_1": 5,
+                            "upper_1": 6,
+                            "text_1": b"high",
+                            "default_addr": b"default",
+                        },
+                    )
+                ]
+            )
+
+            df = mdf.to_dataframe()
+            categorical_df = mdf.to_dataframe(value2text_as_categorical=True)
+            self.assertEqual(df["Level"].tolist()[:4], [b"low", b"low", b"high", b"high"])
+            self.assertTrue(categorical_df["Level"].astype(object).equals(df["Level"]))
+
+    def test_lazy_physical(self) -> None:
+        timestamps = np.arange(10000, dtype=np.float64) / 100
+        raw = Signal(
+            np.arange(10000, dtype=np.int32) % 300,
+            timestamps,
+            name="Sig",
+            conversion={"a": 0.5, "b": -3.0},
+            raw=True,
+        )
+        physical = raw.physical()
+
+        lazy = raw.lazy_physical(chunk_size=1000)
+        self.assertTrue(lazy.raw)
+        self.assertTrue(np.array_equal(lazy[2500:4700].physical().samples, physical.samples[2500:4700]))
+
+        for start, stop in ((10.0, 20.0), (10.005, 20.005), (-1.0, 150.0)):
+            for include_ends in (True, False):
+                lazy_cut = lazy.cut(start, stop, include_ends=include_ends).physical()
+                eager_cut = raw.cut(start, stop, include_ends=include_ends).physical()
+                self.assertTrue(np.array_equal(lazy_cut.timestamps, eager_cut.timestamps))
+                self.assertTrue(np.array_equal(lazy_cut.samples, eager_cut.samples))
+
+        self.assertTrue(np.array_equal(lazy.physical().samples, physical.samples))
+
+        with self.assertRaises(MdfException):
+            raw.lazy_physical(chunk_size=0)
+
+    def test_interp_signals(self) -> None:
+        timestamps = np.cumsum(np.linspace(0.5, 1.5, 1000))
+        other_timestamps = np.arange(300, dtype=np.float64) * 2
+        new_timestamps = np.concatenate([[-5.0], timestamps[::7], np.arange(0, 1100, 0.37), [2000.0]])
+        new_timestamps.sort()
+
+        floats = np.sin(np.arange(1000) / 10)
+        floats[500] = np.inf
+        signals = [
+            Signal(floats, timestamps, name="Float"),
+            Signal(np.arange(1000, dtype=np.int16) * 3, timestamps.copy(), name="Int"),
+            Signal(
+                (np.arange(1000) % 7).astype(np.uint8),
+                timestamps,
+                name="Scaled",
+                conversion={"a": 0.1, "b": 0.0},
+                raw=True,
+                invalidation_bits=np.arange(1000) % 5 == 0,
+            ),
+            Signal(np.ones((300, 4), dtype=np.float32), other_timestamps, name="Array"),
+            Signal(other_timestamps.astype(np.float32), other_timestamps, name="Float32"),
+            Signal(np.array([], dtype=np.float64), np.array([], dtype=np.float64), name="Empty"),
+        ]
+
+        for integer_interpolation_mode in (0, 1, 2):
+            for float_interpolation_mode in (0, 1):
+                interpolated = interp_signals(
+                    signals,
+                    new_timestamps,
+                    integer_interpolation_mode=integer_interpolation_mode,
+                    float_interpolation_mode=float_interpolation_mode,
+                )
+                for signal, result in zip(signals, interpolated, strict=False):
+                    expected = signal.interp(
+                        new_timestamps,
+                        integer_interpolation_mode=integer_interpolation_mode,
+                        float_interpolation_mode=float_interpolation_mode,
+                    )
+                    self.assertEqual(result.samples.dtype, expected.samples.dtype)
+                    self.assertTrue(np.array_equal(result.samples, expected.samples))
+                    self.assertTrue(np.array_equal(result.timestamps, expected.timestamps))
+                    if expected.invalidation_bits is None:
+                        self.assertIsNone(result.invalidation_bits)
+                    else:
+                        self.assertTrue(np.array_equal(result.invalidation_bits, expected.invalidation_bits))
+
+    def test_chunked_signal(self) -> None:
+        timestamps = np.arange(50000, dtype=np.float64) * 0.01
+        other_timestamps = np.arange(15000, dtype=np.float64) * 0.03 + 0.005
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(
+                [
+                    Signal(
+                        np.arange(50000, dtype=np.int16) % 1000,
+                        timestamps,
+                        name="Scaled",
+                        conversion={"a": 2.0, "b": 1.0},
+                        invalidation_bits=np.arange(50000) % 13 == 0,
+                    )
+                ]
+            )
+            mdf.append([Signal(np.sin(other_timestamps), other_timestamps, name="Sine")])
+            mdf.configure(read_fragment_size=16 * 1024)
+
+            scaled = mdf.get_chunked("Scaled")
+            sine = mdf.get_chunked("Sine", raw=True)
+            self.assertGreater(len(list(scaled)), 1)
+
+            expected_scaled = mdf.get("Scaled")
+            expected_sine = mdf.get("Sine")
+
+            valid = expected_scaled.validate().samples
+            self.assertEqual(scaled.min(), valid.min())
+            self.assertEqual(scaled.max(), valid.max())
+            self.assertAlmostEqual(scaled.mean(), valid.mean())
+            self.assertAlmostEqual(scaled.rms(), np.sqrt(np.mean(valid.astype(np.float64) ** 2)))
+
+            cut = scaled.cut(100.0, 300.5).to_signal()
+            expected = expected_scaled.cut(100.0, 300.5, include_ends=False)
+            self.assertTrue(np.array_equal(cut.samples, expected.samples))
+            self.assertTrue(np.array_equal(cut.timestamps, expected.timestamps))
+
+            new_timestamps = np.arange(-5, 550, 0.0123)
+            for mode in (0, 1):
+                interpolated = sine.interp(new_timestamps, float_interpolation_mode=mode).to_signal()
+                expected = expected_sine.interp(new_timestamps, float_interpolation_mode=mode)
+                self.assertTrue(np.array_equal(interpolated.samples, expected.samples))
+
+            result = (scaled + sine.interp(scaled) * 2).to_signal()
+            expected = expected_scaled + expected_sine.interp(expected_scaled.timestamps) * 2
+            self.assertTrue(np.allclose(result.samples, expected.samples))
+            self.assertTrue(np.array_equal(result.invalidation_bits, expected_scaled.invalidation_bits))
+
+            with self.assertRaises(MdfException):
+                (scaled + sine).to_signal()
+
+            empty = scaled.cut(1000, 2000)
+            self.assertEqual(len(empty.to_signal()), 0)
+            self.assertTrue(np.isnan(empty.mean()))
+
+        with MDF(version="3.30") as mdf:
+            mdf.append([Signal((np.arange(50000) % 200).astype(np.uint8), timestamps, name="U8")])
+            mdf.configure(read_fragment_size=7777)
+
+            chunked = mdf.get_chunked("U8")
+            expected = mdf.get("U8")
+            self.assertGreater(len(list(chunked)), 1)
+            self.assertEqual(chunked.max(), expected.samples.max())
+
+            cut = chunked.cut(100.0, 300.5).to_signal()
+            self.assertTrue(np.array_equal(cut.samples, expected.cut(100.0, 300.5, include_ends=False).samples))
+
+            self.assertEqual(len(mdf.get_chunked("U8", start=1e6).to_signal()), 0)
+
 
 if __name__ == "__main__":
     unittest.main()